@@ -0,0 +1,47 @@
+"""Benchmark of Emulator creation time and private memory, the ROM read into a buffer against mmap
+
+Run from the src directory with `py -m benchmarks.cartridge_load`
+"""
+
+import contextlib
+import io
+import os
+import time
+import tracemalloc
+
+from benchmarks.common import make_rom
+from pyvologb.emulator import Emulator
+
+INSTANCES = 50
+SIZES = (1 << 20, 8 << 20)
+
+
+def measure(rom_path: str, use_mmap: bool) -> tuple[float, float]:
+    """Returns (ms per instance, private KiB per instance) for INSTANCES live emulators"""
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        emulators = [Emulator(rom_path, use_mmap=use_mmap) for _ in range(INSTANCES)]
+        elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del emulators
+
+    return elapsed / INSTANCES * 1e3, allocated / INSTANCES / 1024
+
+
+def main() -> None:
+    print(f"{'size':<8}{'mode':<8}{'ms/instance':>14}{'KiB/instance':>16}")
+    for size in SIZES:
+        rom_path = make_rom(size)
+        try:
+            for use_mmap in (False, True):
+                ms, kib = measure(rom_path, use_mmap)
+                mode = "mmap" if use_mmap else "read"
+                print(f"{size >> 20:>3} MiB  {mode:<8}{ms:>14.3f}{kib:>16.1f}")
+        finally:
+            os.remove(rom_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Micro-benchmark of the Opcodes dispatch table against a match statement dispatch
+
+Run from the src directory with `py -m benchmarks.dispatch`
+"""
+
+import contextlib
+import io
+import os
+import random
+import time
+from typing import Callable
+
+from benchmarks.common import make_rom
+from pyvologb.emulator import Emulator
+from pyvologb.opcodes import Opcodes
+
+REPEATS = 5
+STREAM_LENGTH = 100_000
+
+
+def build_match_dispatch(opcodes: Opcodes) -> Callable[[int], int]:
+    """Build the equivalent `match` based execute, as Opcodes.execute was before the table"""
+    lines = [
+        "def execute(self, opcode):",
+        "    self.R.PC += 1",
+        "    match opcode:",
+    ]
+    for code, (handler, width) in enumerate(opcodes.DISPATCH):
+        operand = f"self.fetch{width * 8}()" if width else ""
+        lines.append(f"        case {code:#x}:")
+        lines.append(f"            return self.{handler.__name__}({operand})")
+
+    namespace: dict[str, Callable[[Opcodes, int], int]] = {}
+    exec("\n".join(lines), namespace)
+    execute = namespace["execute"]
+    return lambda opcode: execute(opcodes, opcode)
+
+
+def register_only_opcodes() -> tuple[list[int], list[int]]:
+    """Opcodes that only touch registers, so they can be executed in any order"""
+    base = [0x40 + i for i in range(0x80) if i & 7 != 6 and i & 0x38 != 0x30]
+    base += [0x04 + r * 8 for r in range(8) if r != 6]
+    base += [0x05 + r * 8 for r in range(8) if r != 6]
+    cb = [0x100 + i for i in range(0x100) if i & 7 != 6]
+    return base, cb
+
+
+def time_dispatch(execute: Callable[[int], int], opcodes: Opcodes, stream: list[int]) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        opcodes.R.PC = 0xC000
+        start = time.perf_counter()
+        for opcode in stream:
+            execute(opcode)
+        best = min(best, time.perf_counter() - start)
+    return best / len(stream) * 1e9
+
+
+def main() -> None:
+    rom_path = make_rom()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            opcodes = Emulator(rom_path, skip_boot=True).opcodes
+    finally:
+        os.remove(rom_path)
+
+    match_execute = build_match_dispatch(opcodes)
+    rng = random.Random(0)
+    base, cb = register_only_opcodes()
+
+    print(f"{'stream':<10}{'match ns/op':>14}{'table ns/op':>14}{'speedup':>10}")
+    for name, pool in (("base", base), ("cb", cb), ("mixed", base + cb)):
+        stream = [rng.choice(pool) for _ in range(STREAM_LENGTH)]
+        match_ns = time_dispatch(match_execute, opcodes, stream)
+        table_ns = time_dispatch(opcodes.execute, opcodes, stream)
+        print(f"{name:<10}{match_ns:>14.1f}{table_ns:>14.1f}{match_ns / table_ns:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
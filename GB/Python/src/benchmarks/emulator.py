@@ -0,0 +1,71 @@
+"""Benchmark of emulated frames per second driving an Emulator from code, for a CPU bound loop, a
+loop waiting on LY and a program halting until V-Blank, with and without --jit and --skip-idle.
+Each runs with run_frame and with step until the frame is done
+
+Run from the src directory with `py -m benchmarks.emulator`
+"""
+
+import contextlib
+import io
+import os
+import time
+
+from benchmarks.common import make_rom
+from pyvologb.emulator import Emulator
+from pyvologb.ppu import FRAME_CYCLES
+
+FRAMES = 30
+
+PROGRAMS = {
+    # loop: LD HL,C000; LD A,(HL+); ADD A,B; LD B,A; INC C; DEC E; PUSH AF; POP AF; JR loop
+    "cpu": bytes([0x21, 0x00, 0xC0, 0x2A, 0x80, 0x47, 0x0C, 0x1D, 0xF5, 0xF1, 0x18, 0xF3]),
+    # start: INC B; vblank: LDH A,(44); CP 90; JR NZ,vblank; line: LDH A,(44); CP 90; JR Z,line;
+    # JR start
+    "ly wait": bytes(
+        [0x04, 0xF0, 0x44, 0xFE, 0x90, 0x20, 0xFA, 0xF0, 0x44, 0xFE, 0x90, 0x28, 0xFA, 0x18, 0xF1]
+    ),
+    # LD A,1; LDH (FF),A; loop: HALT; XOR A; LDH (0F),A; INC B; JR loop
+    # With IME off HALT ends on the pending V-Blank without calling a handler, so IF is cleared here
+    "halt": bytes([0x3E, 0x01, 0xE0, 0xFF, 0x76, 0xAF, 0xE0, 0x0F, 0x04, 0x18, 0xF9]),
+}
+
+OPTIONS = {
+    "interpreted": {},
+    "--jit": {"jit": True},
+    "--skip-idle": {"skip_idle": True},
+    "--jit --skip-idle": {"jit": True, "skip_idle": True},
+}
+
+
+def run(rom_path: str, options: dict[str, bool], stepped: bool) -> float:
+    """Returns emulated frames per second"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        emulator = Emulator(rom_path, skip_boot=True, **options)
+    scheduler = emulator.SCHEDULER
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        if stepped:
+            end = scheduler.CYCLE + FRAME_CYCLES
+            while scheduler.CYCLE < end:
+                emulator.step()
+        else:
+            emulator.run_frame()
+    return FRAMES / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print(f"{'program':<10}{'options':<20}{'step frames/s':>16}{'run_frame frames/s':>20}")
+    for program_name, program in PROGRAMS.items():
+        rom_path = make_rom(program=program)
+        try:
+            for name, options in OPTIONS.items():
+                stepped = run(rom_path, options, stepped=True)
+                framed = run(rom_path, options, stepped=False)
+                print(f"{program_name:<10}{name:<20}{stepped:>16.1f}{framed:>20.1f}")
+        finally:
+            os.remove(rom_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark of CPU loop instructions per second, polling pygame events per instruction against
+once per frame from the scheduler as main does
+
+Run from the src directory with `py -m benchmarks.event_polling`
+"""
+
+import contextlib
+import io
+import os
+import time
+
+import pygame
+
+from benchmarks.common import make_rom
+from pyvologb.emulator import Emulator
+from pyvologb.ppu import FRAME_CYCLES
+
+FRAMES = 30
+
+# loop: INC A; ADD A,B; XOR A,C; DEC D; JR loop - 5 instructions in 28 cycles
+PROGRAM = bytes([0x3C, 0x80, 0xA9, 0x15, 0x18, 0xFA])
+LOOP_INSTRUCTIONS = 5
+LOOP_CYCLES = 28
+
+
+def run(rom_path: str, per_instruction: bool) -> float:
+    """Returns instructions per second of the CPU loop, without interrupts"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        emulator = Emulator(rom_path, skip_boot=True, headless=False)
+    scheduler = emulator.SCHEDULER
+    joypad = emulator.IO.JOYP
+
+    def poll_events() -> None:
+        for event in pygame.event.get():
+            joypad.handle_event(event)
+        scheduler.schedule(poll_event, FRAME_CYCLES)
+
+    start_cycle = scheduler.CYCLE
+    end = start_cycle + FRAMES * FRAME_CYCLES
+    start = time.perf_counter()
+    if per_instruction:
+        while scheduler.CYCLE < end:
+            for event in pygame.event.get():
+                joypad.handle_event(event)
+            emulator.step()
+    else:
+        poll_event = scheduler.register(poll_events)
+        scheduler.schedule(poll_event, 0)
+        emulator.run_to(end)
+    elapsed = time.perf_counter() - start
+
+    return (scheduler.CYCLE - start_cycle) * LOOP_INSTRUCTIONS / LOOP_CYCLES / elapsed
+
+
+def main() -> None:
+    rom_path = make_rom(program=PROGRAM)
+    try:
+        before = run(rom_path, per_instruction=True)
+        after = run(rom_path, per_instruction=False)
+    finally:
+        os.remove(rom_path)
+
+    print(f"{'per instruction':<20}{before:>12,.0f} instructions/s")
+    print(f"{'per frame':<20}{after:>12,.0f} instructions/s")
+    print(f"{'speedup':<20}{after / before:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Micro-benchmarks of the Registers layout and the handlers reading it
+
+* the CPU loop with the slotted Registers against the same class keeping its attributes in a
+  __dict__
+* handlers reading a register pair once into a local against reading the pair property each time,
+  as they did before
+* flag writes and reads on the four flag attributes against a packed F register
+
+Run from the src directory with `py -m benchmarks.registers`
+"""
+
+import contextlib
+import io
+import os
+import time
+from typing import Any, Callable
+
+from benchmarks.common import make_rom
+from pyvologb.emulator import Emulator
+from pyvologb.opcodes import Opcodes
+from pyvologb.registers import Registers
+
+REPEATS = 7
+INSTRUCTIONS = 200_000
+CALLS = 200_000
+
+# LD HL,C000; loop: LD A,(HL+); ADD A,B; LD B,A; INC C; DEC E; ADD HL,DE; LD HL,C000; PUSH AF; POP AF; JR loop
+# 10 instructions in 84 cycles
+LOOP_INSTRUCTIONS = 10
+LOOP_CYCLES = 84
+PROGRAM = bytes(
+    [0x21, 0x00, 0xC0, 0x2A, 0x80, 0x47, 0x0C, 0x1D, 0x19, 0x21, 0x00, 0xC0, 0xF5, 0xF1, 0x18, 0xF3]
+)
+
+# Registers without __slots__, as it was before
+DictRegisters = type(
+    "DictRegisters",
+    (),
+    {
+        name: value
+        for name, value in vars(Registers).items()
+        if name not in Registers.__slots__ and name != "__slots__"
+    },
+)
+
+
+class PackedRegisters:
+    """Just the registers the flag handlers below touch, with the flags packed into F"""
+
+    __slots__ = ("A", "B", "F", "PC")
+
+    def __init__(self) -> None:
+        self.A = 0x01
+        self.B = 0x00
+        self.F = 0xB0
+        self.PC = 0x150
+
+
+class PackedOpcodes:
+    """Holds PackedRegisters as R, so the handlers below look them up like Opcodes handlers do"""
+
+    __slots__ = ("R",)
+
+    def __init__(self) -> None:
+        self.R = PackedRegisters()
+
+
+# Handlers as they were before, reading the pair property each time
+
+
+def old_ADD_19(self: Opcodes) -> int:
+    calc = self.R.HL + self.R.DE
+    self.R.SUBTRACTION = 0
+    self.R.HALFCARRY = ((self.R.HL & 0xFFF) + (self.R.DE & 0xFFF) > 0xFFF) & 1
+    self.R.CARRY = (calc > 0xFFFF) & 1
+    self.R.HL = calc & 0xFFFF
+    return 8
+
+
+def old_LD_22(self: Opcodes) -> int:
+    self.mmu.set_memory(self.R.HL, self.R.A)
+    self.R.HL = (self.R.HL + 1) & 0xFFFF
+    return 8
+
+
+def old_INC_34(self: Opcodes) -> int:
+    initial = self.mmu.get_memory(self.R.HL)
+    final = (initial + 1) & 0xFF
+    self.mmu.set_memory(self.R.HL, final)
+    self.R.ZERO = (final == 0) & 1
+    self.R.SUBTRACTION = 0
+    self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
+    return 12
+
+
+def old_SET_CBC6(self: Opcodes) -> int:
+    self.mmu.set_memory(self.R.HL, self.mmu.get_memory(self.R.HL) | 1 << 0)
+    return 16
+
+
+# ADD A,B, INC B and JR NZ on a packed F. ADD writes every flag, INC keeps the carry
+
+
+def packed_ADD_80(self: PackedOpcodes) -> int:
+    initial = self.R.A
+    calc = initial + self.R.B
+    final = calc & 0xFF
+    self.R.A = final
+    self.R.F = (
+        (final == 0) << 7
+        | ((initial & 0xF) + (self.R.B & 0xF) > 0xF) << 5
+        | (calc > 0xFF) << 4
+    )
+    return 4
+
+
+def packed_INC_04(self: PackedOpcodes) -> int:
+    initial = self.R.B
+    final = (initial + 1) & 0xFF
+    self.R.B = final
+    self.R.F = self.R.F & 0x10 | (final == 0) << 7 | ((initial & 0xF) + 1 > 0xF) << 5
+    return 4
+
+
+def packed_JR_20(self: PackedOpcodes, value: int) -> int:
+    if self.R.F & 0x80 == 0:
+        self.R.PC += (value ^ 0x80) - 0x80
+        return 12
+    return 8
+
+
+def compare(before: Callable[[], Any], after: Callable[[], Any], count: int) -> tuple[float, float]:
+    """Best ns per call of `count` calls for each, alternating runs so drift hits both alike"""
+    times: tuple[list[float], list[float]] = ([], [])
+    for _ in range(REPEATS):
+        for run, runs in zip((before, after), times):
+            start = time.perf_counter()
+            run()
+            runs.append(time.perf_counter() - start)
+    return min(times[0]) / count * 1e9, min(times[1]) / count * 1e9
+
+
+def create(rom_path: str) -> Emulator:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Emulator(rom_path, skip_boot=True)
+
+
+def cpu_loop(rom_path: str, registers: type) -> Callable[[], None]:
+    """An Emulator running INSTRUCTIONS instructions with `registers` swapped in"""
+    emulator = create(rom_path)
+    emulator.R = registers(emulator.mmu)
+    emulator.opcodes = Opcodes(emulator.mmu, emulator.R)
+    emulator.R.PC = 0x150
+
+    def run() -> None:
+        emulator.run_cycles(INSTRUCTIONS // LOOP_INSTRUCTIONS * LOOP_CYCLES)
+
+    return run
+
+
+def calls(handler: Callable[..., int], *args: Any) -> Callable[[], None]:
+    def run() -> None:
+        for _ in range(CALLS):
+            handler(*args)
+
+    return run
+
+
+def report(name: str, times: tuple[float, float]) -> None:
+    before, after = times
+    print(f"{name:<28}{before:>9.1f} ns{after:>9.1f} ns{before / after:>8.2f}x")
+
+
+def main() -> None:
+    rom_path = make_rom(program=PROGRAM)
+    try:
+        print(f"{'CPU loop, per instruction':<28}{'__dict__':>12}{'__slots__':>12}")
+        report(
+            "",
+            compare(
+                cpu_loop(rom_path, DictRegisters), cpu_loop(rom_path, Registers), INSTRUCTIONS
+            ),
+        )
+
+        opcodes = create(rom_path).opcodes
+        opcodes.R.HL = 0xC000
+        opcodes.R.DE = 0x0000
+        opcodes.R.A = 0
+    finally:
+        os.remove(rom_path)
+
+    print(f"\n{'pair reads, per call':<28}{'property':>12}{'local':>12}")
+    for name, old, new in (
+        ("ADD HL,DE", old_ADD_19, Opcodes.ADD_19),
+        ("INC (HL)", old_INC_34, Opcodes.INC_34),
+        ("SET 0,(HL)", old_SET_CBC6, Opcodes.SET_CBC6),
+    ):
+        report(name, compare(calls(old, opcodes), calls(new, opcodes), CALLS))
+
+    # LD (HL+),A moves HL, start it over each run
+    def ld_22(handler: Callable[[Opcodes], int]) -> Callable[[], None]:
+        def run() -> None:
+            opcodes.R.HL = 0xC000
+            for _ in range(0x1000):
+                handler(opcodes)
+
+        return run
+
+    report("LD (HL+),A", compare(ld_22(old_LD_22), ld_22(Opcodes.LD_22), 0x1000))
+
+    packed = PackedOpcodes()
+    print(f"\n{'flags, per call':<28}{'packed F':>12}{'separate':>12}")
+    for name, packed_handler, packed_args, handler, args in (
+        ("ADD A,B, writes 4 flags", packed_ADD_80, (packed,), Opcodes.ADD_80, (opcodes,)),
+        ("INC B, writes 3 flags", packed_INC_04, (packed,), Opcodes.INC_04, (opcodes,)),
+        ("JR NZ, reads Z", packed_JR_20, (packed, 0), Opcodes.JR_20, (opcodes, 0)),
+    ):
+        opcodes.R.ZERO = packed.R.F = 0
+        report(name, compare(calls(packed_handler, *packed_args), calls(handler, *args), CALLS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark of VecEnv throughput, emulated frames per second across all instances, for growing
+worker process counts up to the number of cores
+
+Run from the src directory with `py -m benchmarks.vecenv`
+"""
+
+import os
+import random
+import time
+
+from benchmarks.common import make_rom
+from pyvologb.vecenv import VecEnv
+
+STEPS = 20
+INSTANCES_PER_PROCESS = 2
+
+# loop: LD HL,C000; LD A,(HL+); ADD A,B; LD B,A; INC C; DEC E; PUSH AF; POP AF; JR loop
+PROGRAM = bytes([0x21, 0x00, 0xC0, 0x2A, 0x80, 0x47, 0x0C, 0x1D, 0xF5, 0xF1, 0x18, 0xF3])
+
+
+def run(rom_path: str, processes: int) -> float:
+    """Returns frames per second across every instance, with random actions each step"""
+    instances = processes * INSTANCES_PER_PROCESS
+    with VecEnv(rom_path, instances, processes=processes, skip_boot=True, jit=True) as env:
+        env.reset()
+        start = time.perf_counter()
+        for _ in range(STEPS):
+            env.step([random.randrange(0x100) for _ in range(instances)])
+        return env.FRAMES / (time.perf_counter() - start)
+
+
+def main() -> None:
+    cores = os.cpu_count() or 1
+    counts = sorted({1, *range(2, cores + 1, 2), cores})
+
+    rom_path = make_rom(program=PROGRAM)
+    try:
+        results = {processes: run(rom_path, processes) for processes in counts}
+    finally:
+        os.remove(rom_path)
+
+    for processes, speed in results.items():
+        instances = processes * INSTANCES_PER_PROCESS
+        print(
+            f"{processes:>3} processes {instances:>4} instances {speed:>10.1f} frames/s "
+            f"{speed / results[1]:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
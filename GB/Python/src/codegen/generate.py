@@ -0,0 +1,399 @@
+"""Generates `pyvologb/opcodes.py` from the instruction table and templates
+
+Run from the src directory with `py -m codegen.generate [--backend <backend>]`
+
+Backends:
+* methods - a method per opcode, reading registers through self.R. The default
+* closures - the handlers are closures over the registers and MMU made in `build_dispatch_table`, so
+  the dispatch table holds plain functions rather than bound methods
+* locals - methods loading self.R and self.mmu into locals once, each attribute load is a native
+  field access under mypyc
+"""
+
+import argparse
+import os
+import re
+
+from codegen.instructions import BASE, CB, Instruction
+from codegen.semantics import TEMPLATES
+
+BACKENDS = ["methods", "closures", "locals"]
+
+OUTPUT = os.path.join(os.path.dirname(__file__), "..", "pyvologb", "opcodes.py")
+
+FLAGS = {"Z": "ZERO", "N": "SUBTRACTION", "H": "HALFCARRY", "C": "CARRY"}
+CONDITIONS = {
+    "NZ": "R.ZERO == 0",
+    "Z": "R.ZERO == 1",
+    "NC": "R.CARRY == 0",
+    "C": "R.CARRY == 1",
+}
+BRANCHES = {"JR", "JP", "CALL", "RET"}
+
+# Memory operands and the address they're at
+ADDRESSES = {
+    "[BC]": "R.BC",
+    "[DE]": "R.DE",
+    "[HL]": "R.HL",
+    "[HL+]": "R.HL",
+    "[HL-]": "R.HL",
+    "[C]": "0xFF00 + R.C",
+    "[n8]": "0xFF00 + offset",
+    "[n16]": "address",
+}
+
+WRITE = re.compile(r"(\s*)\{([xy])\} = (.*)")
+ATTRIBUTES = re.compile(r"\b(R|mmu)\.")
+
+
+class Operand:
+    """How a handler reads and writes one operand
+
+    KIND is what templates are looked up by: r, rr, m for memory, n for immediates, cc, or a
+    literal. PARAM is the handler argument the operand is passed in, WIDTH its bytes
+    """
+
+    def __init__(self, text: str, mnemonic: str, condition: bool) -> None:
+        self.PARAM: str | None = None
+        self.WIDTH = 0
+        self.ADDRESS: str | None = None
+        self.STEP = 0
+        self.READ = text
+
+        if condition:
+            self.KIND = "cc"
+            self.READ = CONDITIONS[text]
+        elif text in ADDRESSES:
+            self.KIND = "m"
+            self.ADDRESS = ADDRESSES[text]
+            self.STEP = {"[HL+]": 1, "[HL-]": -1}.get(text, 0)
+            if text == "[n8]":
+                self.PARAM, self.WIDTH = "offset", 1
+            elif text == "[n16]":
+                self.PARAM, self.WIDTH = "address", 2
+        elif text in ("n8", "e8", "n16", "SP + e8"):
+            self.KIND = "SP + n" if text == "SP + e8" else "n"
+            self.PARAM = "address" if mnemonic in ("JP", "CALL") else "value"
+            self.WIDTH = 2 if text == "n16" else 1
+            self.READ = self.PARAM
+        elif text in ("BC", "DE", "HL", "SP", "AF"):
+            self.KIND = "rr"
+            self.READ = f"R.{text}"
+        elif text in ("A", "B", "C", "D", "E", "H", "L"):
+            self.KIND = "r"
+            self.READ = f"R.{text}"
+        elif text.startswith("$"):
+            self.KIND = "v"
+            self.READ = f"0x{text[1:]}"
+        else:
+            self.KIND = "b"
+
+    def prepare(self, reads: int, writes: int) -> list[str]:
+        """Lines loading the operand before the body, for memory read more than once or written
+        after a read"""
+        if self.ADDRESS is None:
+            return []
+
+        lines = []
+        address = self.ADDRESS
+        if self.STEP or (reads and writes):
+            pair = address[2:].lower()
+            lines.append(f"{pair} = {address}")
+            address = pair
+        self.ADDRESS = address
+
+        self.READ = f"mmu.get_memory({address})"
+        if reads > 1:
+            lines.append(f"mem = {self.READ}")
+            self.READ = "mem"
+        return lines
+
+    def write(self, value: str) -> str:
+        if self.ADDRESS is None:
+            return f"{self.READ} = {value}"
+        return f"mmu.set_memory({self.ADDRESS}, {value})"
+
+    def finish(self) -> list[str]:
+        """Lines after the body, incrementing or decrementing HL"""
+        if not self.STEP:
+            return []
+        return [f"R.HL = (hl {'+' if self.STEP > 0 else '-'} 1) & 0xFFFF"]
+
+
+class Handler:
+    def __init__(
+        self, name: str, doc: str, param: str | None, width: int, lines: list[str]
+    ) -> None:
+        self.NAME = name
+        self.DOC = doc
+        self.PARAM = param
+        self.WIDTH = width
+        self.LINES = lines  # body, with registers as R and the MMU as mmu
+
+
+def build_handler(name: str, instruction: Instruction) -> Handler:
+    text, cycles, flags = instruction
+    taken, not_taken = cycles if isinstance(cycles, tuple) else (cycles, cycles)
+
+    mnemonic, _, rest = text.partition(" ")
+    texts = rest.split(", ") if rest else []
+    conditional = mnemonic in BRANCHES and len(texts) == (1 if mnemonic == "RET" else 2)
+    operands = [
+        Operand(operand, mnemonic, conditional and i == 0) for i, operand in enumerate(texts)
+    ]
+
+    kinds = ", ".join(operand.KIND for operand in operands)
+    body, computed = TEMPLATES.get(f"{mnemonic} {kinds}") or TEMPLATES[mnemonic]
+
+    lines = body.splitlines() if body else []
+    for letter, effect in zip("ZNHC", flags):
+        if effect in "01":
+            lines.append(f"R.{FLAGS[letter]} = {effect}")
+        elif effect == letter and letter in computed:
+            lines.append(f"R.{FLAGS[letter]} = {computed[letter]}")
+
+    # count reads and writes to load memory once
+    fields = dict(zip("xy", range(len(operands))))
+    writes = [0] * len(operands)
+    reads = [0] * len(operands)
+    for line in lines:
+        match = WRITE.fullmatch(line)
+        if match is not None:
+            writes[fields[match[2]]] += 1
+            line = match[3]
+        for field, i in fields.items():
+            reads[i] += line.count(f"{{{field}}}")
+
+    prelude = []
+    for i, operand in enumerate(operands):
+        prelude.extend(operand.prepare(reads[i], writes[i]))
+
+    def substitute(line: str) -> str:
+        for field, i in fields.items():
+            line = line.replace(f"{{{field}}}", operands[i].READ)
+        return line.replace("{taken}", str(taken))
+
+    source = prelude
+    for line in lines:
+        match = WRITE.fullmatch(line)
+        if match is None:
+            source.append(substitute(line))
+        else:
+            operand = operands[fields[match[2]]]
+            source.append(match[1] + operand.write(substitute(match[3])))
+    for operand in operands:
+        source.extend(operand.finish())
+    source.append(f"return {not_taken}")
+
+    params = [operand for operand in operands if operand.PARAM is not None]
+    return Handler(
+        name,
+        text,
+        params[0].PARAM if params else None,
+        sum(operand.WIDTH for operand in operands),
+        source,
+    )
+
+
+def build_handlers() -> list[Handler | None]:
+    """Handlers for opcodes 0x000 -> 0x1FF, None for illegal opcodes and the CB prefix"""
+    handlers: list[Handler | None] = []
+    for opcode in range(0x100):
+        if opcode in BASE and opcode != 0xCB:
+            mnemonic = BASE[opcode][0].partition(" ")[0]
+            handlers.append(build_handler(f"{mnemonic}_{opcode:02X}", BASE[opcode]))
+        else:
+            handlers.append(None)
+    for opcode in range(0x100):
+        mnemonic = CB[opcode][0].partition(" ")[0]
+        handlers.append(build_handler(f"{mnemonic}_CB{opcode:02X}", CB[opcode]))
+    return handlers
+
+
+def cycles() -> list[int]:
+    """Cycles per opcode, branches not taken, 0 for illegal opcodes"""
+    table = []
+    for instructions in (BASE, CB):
+        for opcode in range(0x100):
+            if opcode in instructions:
+                count = instructions[opcode][1]
+                table.append(count[1] if isinstance(count, tuple) else count)
+            else:
+                table.append(0)
+    return table
+
+
+def header() -> list[str]:
+    table = cycles()
+    lines = [
+        "# Generated by `py -m codegen.generate` from codegen.instructions, don't edit by hand",
+        "",
+        "from typing import Callable",
+        "from pyvologb.helpers import formatted_hex",
+        "from pyvologb.mmu import MMU",
+        "from pyvologb.registers import Registers",
+        "",
+        "# Cycles per opcode, branches not taken. Entries 0x100 -> 0x1FF are the CB prefixed opcodes",
+        "CYCLES = [",
+    ]
+    for row in range(0, len(table), 16):
+        lines.append("    " + " ".join(f"{count}," for count in table[row : row + 16]))
+    lines.append("]  # fmt: skip")
+    return lines
+
+
+def signature(handler: Handler, self: bool) -> str:
+    params = ["self"] if self else []
+    if handler.PARAM is not None:
+        params.append(f"{handler.PARAM}: int")
+    return f"def {handler.NAME}({', '.join(params)}) -> int:"
+
+
+def indent(lines: list[str], depth: int) -> list[str]:
+    return [" " * depth + line if line else "" for line in lines]
+
+
+def generate(backend: str) -> str:
+    handlers = build_handlers()
+    closures = backend == "closures"
+    prefix = "" if closures else "self."
+
+    lines = header()
+    lines += [
+        "",
+        "",
+        "class Opcodes:",
+        "    def __init__(self, mmu: MMU, registers: Registers) -> None:",
+        "        self.mmu = mmu",
+        "        self.R = registers",
+        "",
+        "        self.DISPATCH = self.build_dispatch_table()",
+    ]
+    if closures:
+        lines += ["        # Called by the CPU loop for interrupts", "        self.CALL_CD = self.DISPATCH[0xCD][0]"]
+    lines += [
+        "",
+        "    def fetch8(self) -> int:",
+        '        """The byte at PC, moving PC past it"""',
+        "        pc = self.R.PC",
+        "        self.R.PC = pc + 1",
+        "        page = self.mmu.READ_PAGES[pc >> 8]",
+        "        if page is None:",
+        "            return self.mmu.get_memory(pc)",
+        "        return page[pc & 0xFF]",
+        "",
+        "    def fetch16(self) -> int:",
+        '        """The little endian word at PC, moving PC past it"""',
+        "        pc = self.R.PC",
+        "        self.R.PC = pc + 2",
+        "        offset = pc & 0xFF",
+        "        page = self.mmu.READ_PAGES[pc >> 8]",
+        "        if page is None or offset == 0xFF:",
+        "            return self.mmu.get_memory(pc) | self.mmu.get_memory(pc + 1) << 8",
+        "        return page[offset] | page[offset + 1] << 8",
+        "",
+        "    def build_dispatch_table(self) -> list[tuple[Callable[..., int], int]]:",
+        '        """Build the opcode table of (handler, operand width in bytes)',
+        "",
+        "        Entries 0x000 -> 0x0FF are the base opcodes, 0x100 -> 0x1FF are the CB prefixed opcodes",
+        '        """',
+    ]
+
+    # the handlers, as methods after the table or closures before it
+    definitions = [
+        "def ILLEGAL(self) -> int:",
+        '    """Illegal Opcode"""',
+        "    opcode = self.mmu.get_memory(self.R.PC - 1)",
+        '    raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")',
+        "",
+        "def PREFIX_CB(self, opcode: int) -> int:",
+        '    """PREFIX CB"""',
+        "    return self.DISPATCH[0x100 | opcode][0]()",
+    ]
+    if closures:
+        definitions = [
+            line.replace("(self) ", "() ")
+            .replace("self, ", "")
+            .replace("self.mmu.", "mmu.")
+            .replace("self.R.", "R.")
+            .replace("self.DISPATCH", "table")
+            for line in definitions
+        ]
+
+    for handler in handlers:
+        if handler is None:
+            continue
+        body = handler.LINES
+        if backend == "methods":
+            body = [ATTRIBUTES.sub(r"self.\1.", line) for line in body]
+        elif backend == "locals":
+            source = "\n".join(body)
+            body = [
+                *(["R = self.R"] if "R." in source else []),
+                *(["mmu = self.mmu"] if "mmu." in source else []),
+                *body,
+            ]
+        definitions += [
+            "",
+            signature(handler, not closures),
+            f'    """{handler.DOC}"""',
+            *indent(body, 4),
+        ]
+
+    table = [
+        f"({prefix}{'ILLEGAL' if handler is None else handler.NAME}, "
+        f"{0 if handler is None else handler.WIDTH}),"
+        for handler in handlers
+    ]
+    table[0xCB] = f"({prefix}PREFIX_CB, 1),"
+
+    if closures:
+        lines += [
+            "        R = self.R",
+            "        mmu = self.mmu",
+            "",
+            *indent(definitions, 8),
+            "",
+            "        table: list[tuple[Callable[..., int], int]] = [",
+            *indent(table, 12),
+            "        ]",
+            "        return table",
+        ]
+    else:
+        lines += ["        return [", *indent(table, 12), "        ]"]
+
+    lines += [
+        "",
+        "    def execute(self, opcode: int) -> int:",
+        "        handler, width = self.DISPATCH[opcode]",
+        "        self.R.PC += 1",
+        "",
+        "        match width:",
+        "            case 0:",
+        "                return handler()",
+        "            case 1:",
+        "                return handler(self.fetch8())",
+        "            case _:",
+        "                return handler(self.fetch16())",
+    ]
+    if not closures:
+        lines += ["", *indent(definitions, 4)]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=BACKENDS, default="methods")
+    parser.add_argument("-o", "--output", default=OUTPUT, help="file to write, - for stdout")
+    args = parser.parse_args()
+
+    source = generate(args.backend)
+    if args.output == "-":
+        print(source, end="")
+    else:
+        with open(args.output, "w") as f:
+            f.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""The instruction table `pyvologb/opcodes.py` is generated from
+
+Each opcode maps to (mnemonic and operands, cycles, flags). Cycles are (taken, not taken) for
+conditional jumps, calls and returns, and include the CB prefix for CB opcodes. Flags are Z N H C,
+"-" when unchanged, "0" or "1" when reset or set, and the flag's letter when it depends on the result.
+
+Operands are registers, [..] for memory, n8 / n16 for immediates, e8 for a signed offset, and
+NZ / Z / NC / C for conditions. Opcodes missing from BASE are illegal.
+"""
+
+Instruction = tuple[str, int | tuple[int, int], str]
+
+# Register operands, by the low 3 bits of an opcode
+REGISTERS = ["B", "C", "D", "E", "H", "L", "[HL]", "A"]
+
+BASE: dict[int, Instruction] = {
+    0x00: ("NOP", 4, "----"),
+    0x01: ("LD BC, n16", 12, "----"),
+    0x02: ("LD [BC], A", 8, "----"),
+    0x03: ("INC BC", 8, "----"),
+    0x04: ("INC B", 4, "Z0H-"),
+    0x05: ("DEC B", 4, "Z1H-"),
+    0x06: ("LD B, n8", 8, "----"),
+    0x07: ("RLCA", 4, "000C"),
+    0x08: ("LD [n16], SP", 20, "----"),
+    0x09: ("ADD HL, BC", 8, "-0HC"),
+    0x0A: ("LD A, [BC]", 8, "----"),
+    0x0B: ("DEC BC", 8, "----"),
+    0x0C: ("INC C", 4, "Z0H-"),
+    0x0D: ("DEC C", 4, "Z1H-"),
+    0x0E: ("LD C, n8", 8, "----"),
+    0x0F: ("RRCA", 4, "000C"),
+    0x10: ("STOP", 4, "----"),
+    0x11: ("LD DE, n16", 12, "----"),
+    0x12: ("LD [DE], A", 8, "----"),
+    0x13: ("INC DE", 8, "----"),
+    0x14: ("INC D", 4, "Z0H-"),
+    0x15: ("DEC D", 4, "Z1H-"),
+    0x16: ("LD D, n8", 8, "----"),
+    0x17: ("RLA", 4, "000C"),
+    0x18: ("JR e8", 12, "----"),
+    0x19: ("ADD HL, DE", 8, "-0HC"),
+    0x1A: ("LD A, [DE]", 8, "----"),
+    0x1B: ("DEC DE", 8, "----"),
+    0x1C: ("INC E", 4, "Z0H-"),
+    0x1D: ("DEC E", 4, "Z1H-"),
+    0x1E: ("LD E, n8", 8, "----"),
+    0x1F: ("RRA", 4, "000C"),
+    0x20: ("JR NZ, e8", (12, 8), "----"),
+    0x21: ("LD HL, n16", 12, "----"),
+    0x22: ("LD [HL+], A", 8, "----"),
+    0x23: ("INC HL", 8, "----"),
+    0x24: ("INC H", 4, "Z0H-"),
+    0x25: ("DEC H", 4, "Z1H-"),
+    0x26: ("LD H, n8", 8, "----"),
+    0x27: ("DAA", 4, "Z-0C"),
+    0x28: ("JR Z, e8", (12, 8), "----"),
+    0x29: ("ADD HL, HL", 8, "-0HC"),
+    0x2A: ("LD A, [HL+]", 8, "----"),
+    0x2B: ("DEC HL", 8, "----"),
+    0x2C: ("INC L", 4, "Z0H-"),
+    0x2D: ("DEC L", 4, "Z1H-"),
+    0x2E: ("LD L, n8", 8, "----"),
+    0x2F: ("CPL", 4, "-11-"),
+    0x30: ("JR NC, e8", (12, 8), "----"),
+    0x31: ("LD SP, n16", 12, "----"),
+    0x32: ("LD [HL-], A", 8, "----"),
+    0x33: ("INC SP", 8, "----"),
+    0x34: ("INC [HL]", 12, "Z0H-"),
+    0x35: ("DEC [HL]", 12, "Z1H-"),
+    0x36: ("LD [HL], n8", 12, "----"),
+    0x37: ("SCF", 4, "-001"),
+    0x38: ("JR C, e8", (12, 8), "----"),
+    0x39: ("ADD HL, SP", 8, "-0HC"),
+    0x3A: ("LD A, [HL-]", 8, "----"),
+    0x3B: ("DEC SP", 8, "----"),
+    0x3C: ("INC A", 4, "Z0H-"),
+    0x3D: ("DEC A", 4, "Z1H-"),
+    0x3E: ("LD A, n8", 8, "----"),
+    0x3F: ("CCF", 4, "-00C"),
+    0xC0: ("RET NZ", (20, 8), "----"),
+    0xC1: ("POP BC", 12, "----"),
+    0xC2: ("JP NZ, n16", (16, 12), "----"),
+    0xC3: ("JP n16", 16, "----"),
+    0xC4: ("CALL NZ, n16", (24, 12), "----"),
+    0xC5: ("PUSH BC", 16, "----"),
+    0xC6: ("ADD A, n8", 8, "Z0HC"),
+    0xC7: ("RST $00", 16, "----"),
+    0xC8: ("RET Z", (20, 8), "----"),
+    0xC9: ("RET", 16, "----"),
+    0xCA: ("JP Z, n16", (16, 12), "----"),
+    0xCB: ("PREFIX CB", 4, "----"),
+    0xCC: ("CALL Z, n16", (24, 12), "----"),
+    0xCD: ("CALL n16", 24, "----"),
+    0xCE: ("ADC A, n8", 8, "Z0HC"),
+    0xCF: ("RST $08", 16, "----"),
+    0xD0: ("RET NC", (20, 8), "----"),
+    0xD1: ("POP DE", 12, "----"),
+    0xD2: ("JP NC, n16", (16, 12), "----"),
+    0xD4: ("CALL NC, n16", (24, 12), "----"),
+    0xD5: ("PUSH DE", 16, "----"),
+    0xD6: ("SUB A, n8", 8, "Z1HC"),
+    0xD7: ("RST $10", 16, "----"),
+    0xD8: ("RET C", (20, 8), "----"),
+    0xD9: ("RETI", 16, "----"),
+    0xDA: ("JP C, n16", (16, 12), "----"),
+    0xDC: ("CALL C, n16", (24, 12), "----"),
+    0xDE: ("SBC A, n8", 8, "Z1HC"),
+    0xDF: ("RST $18", 16, "----"),
+    0xE0: ("LDH [n8], A", 12, "----"),
+    0xE1: ("POP HL", 12, "----"),
+    0xE2: ("LDH [C], A", 8, "----"),
+    0xE5: ("PUSH HL", 16, "----"),
+    0xE6: ("AND A, n8", 8, "Z010"),
+    0xE7: ("RST $20", 16, "----"),
+    0xE8: ("ADD SP, e8", 16, "00HC"),
+    0xE9: ("JP HL", 4, "----"),
+    0xEA: ("LD [n16], A", 16, "----"),
+    0xEE: ("XOR A, n8", 8, "Z000"),
+    0xEF: ("RST $28", 16, "----"),
+    0xF0: ("LDH A, [n8]", 12, "----"),
+    0xF1: ("POP AF", 12, "ZNHC"),
+    0xF2: ("LDH A, [C]", 8, "----"),
+    0xF3: ("DI", 4, "----"),
+    0xF5: ("PUSH AF", 16, "----"),
+    0xF6: ("OR A, n8", 8, "Z000"),
+    0xF7: ("RST $30", 16, "----"),
+    0xF8: ("LD HL, SP + e8", 12, "00HC"),
+    0xF9: ("LD SP, HL", 8, "----"),
+    0xFA: ("LD A, [n16]", 16, "----"),
+    0xFB: ("EI", 4, "----"),
+    0xFE: ("CP A, n8", 8, "Z1HC"),
+    0xFF: ("RST $38", 16, "----"),
+}
+
+# LD r, r'
+BASE.update(
+    {
+        0x40 | target << 3 | source: (
+            f"LD {REGISTERS[target]}, {REGISTERS[source]}",
+            8 if 6 in (target, source) else 4,
+            "----",
+        )
+        for target in range(8)
+        for source in range(8)
+    }
+)
+BASE[0x76] = ("HALT", 4, "----")
+
+# ALU A, r
+ALU = [
+    ("ADD", "Z0HC"), ("ADC", "Z0HC"), ("SUB", "Z1HC"), ("SBC", "Z1HC"),
+    ("AND", "Z010"), ("XOR", "Z000"), ("OR", "Z000"), ("CP", "Z1HC"),
+]  # fmt: skip
+BASE.update(
+    {
+        0x80 | operation << 3 | source: (
+            f"{ALU[operation][0]} A, {REGISTERS[source]}",
+            8 if source == 6 else 4,
+            ALU[operation][1],
+        )
+        for operation in range(8)
+        for source in range(8)
+    }
+)
+
+# Entries 0x00 -> 0xFF after the CB prefix
+SHIFTS = [
+    ("RLC", "Z00C"), ("RRC", "Z00C"), ("RL", "Z00C"), ("RR", "Z00C"),
+    ("SLA", "Z00C"), ("SRA", "Z00C"), ("SWAP", "Z000"), ("SRL", "Z00C"),
+]  # fmt: skip
+CB: dict[int, Instruction] = {
+    operation << 3 | target: (
+        f"{SHIFTS[operation][0]} {REGISTERS[target]}",
+        16 if target == 6 else 8,
+        SHIFTS[operation][1],
+    )
+    for operation in range(8)
+    for target in range(8)
+}
+for bit in range(8):
+    for target in range(8):
+        CB[0x40 | bit << 3 | target] = (
+            f"BIT {bit}, {REGISTERS[target]}",
+            12 if target == 6 else 8,
+            "Z01-",
+        )
+        CB[0x80 | bit << 3 | target] = (
+            f"RES {bit}, {REGISTERS[target]}",
+            16 if target == 6 else 8,
+            "----",
+        )
+        CB[0xC0 | bit << 3 | target] = (
+            f"SET {bit}, {REGISTERS[target]}",
+            16 if target == 6 else 8,
+            "----",
+        )
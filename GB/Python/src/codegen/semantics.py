@@ -0,0 +1,328 @@
+"""What each instruction does, as templates of handler bodies
+
+Templates are looked up by mnemonic and operand kinds, e.g. "ADD rr, rr", then by mnemonic alone.
+{x} and {y} are the first and second operand: a line assigning to one writes it, anywhere else it's
+read. {taken} and {cycles} are the cycles with a condition met and not.
+
+The flags a template computes map from Z / N / H / C to their expression. The instruction table picks
+the ones that are set, after the body. A flag the table marks as computed without an expression here
+is set by the body itself, as POP AF does through F.
+"""
+
+from textwrap import dedent
+
+Template = tuple[str, dict[str, str]]
+
+ZERO = "(final == 0) & 1"
+
+
+def template(body: str, **flags: str) -> Template:
+    return dedent(body).strip(), flags
+
+
+def rotate_a(rotate: Template) -> Template:
+    """The A only form of a CB rotate"""
+    body, flags = rotate
+    return body.replace("{x}", "R.A"), {
+        name: flag.replace("{x}", "R.A") for name, flag in flags.items()
+    }
+
+
+TEMPLATES: dict[str, Template] = {
+    "NOP": template(""),
+    "STOP": template(""),
+    "HALT": template("mmu.HALT = True"),
+    "DI": template("mmu.IME = False"),
+    "EI": template("mmu.IME = True"),
+    # Loads
+    "LD": template("{x} = {y}"),
+    "LD m, rr": template(
+        """
+        mmu.set_memory(address, {y} & 0xFF)
+        mmu.set_memory(address + 1, {y} >> 8)
+        """
+    ),
+    "LD rr, SP + n": template(
+        """
+        initial = R.SP
+        offset = ({y} ^ 0x80) - 0x80
+        {x} = (initial + offset) & 0xFFFF
+        """,
+        H="((initial & 0xF) + (offset & 0xF) > 0xF) & 1",
+        C="((initial & 0xFF) + (offset & 0xFF) > 0xFF) & 1",
+    ),
+    "PUSH": template("R.PUSH({x})"),
+    "POP": template("{x} = R.POP()"),
+    # 16 bit arithmetic
+    "INC rr": template("{x} = ({x} + 1) & 0xFFFF"),
+    "DEC rr": template("{x} = ({x} - 1) & 0xFFFF"),
+    "ADD rr, rr": template(
+        """
+        initial = {x}
+        value = {y}
+        calc = initial + value
+        {x} = calc & 0xFFFF
+        """,
+        H="((initial & 0xFFF) + (value & 0xFFF) > 0xFFF) & 1",
+        C="(calc > 0xFFFF) & 1",
+    ),
+    "ADD rr, n": template(
+        """
+        initial = {x}
+        offset = ({y} ^ 0x80) - 0x80
+        {x} = (initial + offset) & 0xFFFF
+        """,
+        H="((initial & 0xF) + (offset & 0xF) > 0xF) & 1",
+        C="((initial & 0xFF) + (offset & 0xFF) > 0xFF) & 1",
+    ),
+    # 8 bit arithmetic. The second operand is read after A is written, so ADD A, A and ADC A, A take
+    # the half carry from the result
+    "INC": template(
+        """
+        initial = {x}
+        final = (initial + 1) & 0xFF
+        {x} = final
+        """,
+        Z=ZERO,
+        H="((initial & 0xF) + 1 > 0xF) & 1",
+    ),
+    "DEC": template(
+        """
+        initial = {x}
+        final = (initial - 1) & 0xFF
+        {x} = final
+        """,
+        Z=ZERO,
+        H="((initial & 0xF) - 1 < 0) & 1",
+    ),
+    "ADD": template(
+        """
+        initial = {x}
+        calc = initial + {y}
+        final = calc & 0xFF
+        {x} = final
+        """,
+        Z=ZERO,
+        H="((initial & 0xF) + ({y} & 0xF) > 0xF) & 1",
+        C="(calc > 0xFF) & 1",
+    ),
+    "ADC": template(
+        """
+        initial = {x}
+        carry = R.CARRY
+        calc = initial + {y} + carry
+        final = calc & 0xFF
+        {x} = final
+        """,
+        Z=ZERO,
+        H="((initial & 0xF) + ({y} & 0xF) + carry > 0xF) & 1",
+        C="(calc > 0xFF) & 1",
+    ),
+    "SUB": template(
+        """
+        initial = {x}
+        calc = initial - {y}
+        final = calc & 0xFF
+        {x} = final
+        """,
+        Z=ZERO,
+        H="((initial & 0xF) - ({y} & 0xF) < 0) & 1",
+        C="(calc < 0) & 1",
+    ),
+    "SBC": template(
+        """
+        initial = {x}
+        carry = R.CARRY
+        calc = initial - ({y} + carry)
+        final = calc & 0xFF
+        {x} = final
+        """,
+        Z=ZERO,
+        H="((initial & 0xF) - (({y} & 0xF) + carry) < 0) & 1",
+        C="(calc < 0) & 1",
+    ),
+    "AND": template(
+        """
+        final = {x} & {y}
+        {x} = final
+        """,
+        Z=ZERO,
+    ),
+    "XOR": template(
+        """
+        final = {x} ^ {y}
+        {x} = final
+        """,
+        Z=ZERO,
+    ),
+    "OR": template(
+        """
+        final = {x} | {y}
+        {x} = final
+        """,
+        Z=ZERO,
+    ),
+    "CP": template(
+        "calc = {x} - {y}",
+        Z="((calc & 0xFF) == 0) & 1",
+        H="(({x} & 0xF) - ({y} & 0xF) < 0) & 1",
+        C="(calc < 0) & 1",
+    ),
+    "DAA": template(
+        """
+        # Credit to https://blog.ollien.com/posts/gb-daa/ for the logic
+        offset = 0
+        carry = 0
+
+        if (R.SUBTRACTION == 0 and R.A & 0xF > 0x09) or R.HALFCARRY == 1:
+            offset |= 0x06
+        if (R.SUBTRACTION == 0 and R.A > 0x99) or R.CARRY == 1:
+            offset |= 0x60
+            carry = 1
+
+        final = (
+            (R.A + offset) & 0xFF
+            if R.SUBTRACTION == 0
+            else (R.A - offset) & 0xFF
+        )
+        R.A = final
+        """,
+        Z=ZERO,
+        C="carry",
+    ),
+    "CPL": template("R.A = R.A ^ 0xFF"),
+    "SCF": template(""),
+    "CCF": template("", C="(R.CARRY == 0) & 1"),
+    # Rotates and shifts
+    "RLC": template(
+        """
+        carry = {x} >> 7
+        final = ({x} << 1) & 0xFF | carry
+        {x} = final
+        """,
+        Z=ZERO,
+        C="carry",
+    ),
+    "RRC": template(
+        """
+        carry = {x} & 1
+        final = carry << 7 | {x} >> 1
+        {x} = final
+        """,
+        Z=ZERO,
+        C="carry",
+    ),
+    "RL": template(
+        """
+        carry = {x} >> 7
+        final = ({x} << 1) & 0xFF | R.CARRY
+        {x} = final
+        """,
+        Z=ZERO,
+        C="carry",
+    ),
+    "RR": template(
+        """
+        carry = {x} & 1
+        final = R.CARRY << 7 | {x} >> 1
+        {x} = final
+        """,
+        Z=ZERO,
+        C="carry",
+    ),
+    "SLA": template(
+        """
+        carry = {x} >> 7
+        final = ({x} << 1) & 0xFF
+        {x} = final
+        """,
+        Z=ZERO,
+        C="carry",
+    ),
+    "SRA": template(
+        """
+        carry = {x} & 1
+        final = {x} & 0x80 | {x} >> 1
+        {x} = final
+        """,
+        Z=ZERO,
+        C="carry",
+    ),
+    "SWAP": template(
+        """
+        final = ({x} & 0xF) << 4 | {x} >> 4
+        {x} = final
+        """,
+        Z=ZERO,
+    ),
+    "SRL": template(
+        """
+        carry = {x} & 1
+        final = {x} >> 1
+        {x} = final
+        """,
+        Z=ZERO,
+        C="carry",
+    ),
+    # Bits, {x} is the bit number
+    "BIT": template("", Z="({y} >> {x} & 1) ^ 1"),
+    "RES": template("{y} = {y} & ~(1 << {x})"),
+    "SET": template("{y} = {y} | 1 << {x}"),
+    # Jumps, calls and returns. JR doesn't wrap PC
+    "JR": template("R.PC += ({x} ^ 0x80) - 0x80"),
+    "JR cc, n": template(
+        """
+        if {x}:
+            R.PC += ({y} ^ 0x80) - 0x80
+            return {taken}
+        """
+    ),
+    "JP": template("R.PC = {x}"),
+    "JP cc, n": template(
+        """
+        if {x}:
+            R.PC = {y}
+            return {taken}
+        """
+    ),
+    "CALL": template(
+        """
+        R.PUSH(R.PC)
+        R.PC = {x}
+        """
+    ),
+    "CALL cc, n": template(
+        """
+        if {x}:
+            R.PUSH(R.PC)
+            R.PC = {y}
+            return {taken}
+        """
+    ),
+    "RET": template("R.PC = R.POP()"),
+    "RET cc": template(
+        """
+        if {x}:
+            R.PC = R.POP()
+            return {taken}
+        """
+    ),
+    "RETI": template(
+        """
+        mmu.IME = True
+        R.PC = R.POP()
+        """
+    ),
+    "RST": template(
+        """
+        R.PUSH(R.PC)
+        R.PC = {x}
+        """
+    ),
+}
+
+TEMPLATES["LDH"] = TEMPLATES["LD"]
+TEMPLATES["RLCA"] = rotate_a(TEMPLATES["RLC"])
+TEMPLATES["RRCA"] = rotate_a(TEMPLATES["RRC"])
+TEMPLATES["RLA"] = rotate_a(TEMPLATES["RL"])
+TEMPLATES["RRA"] = rotate_a(TEMPLATES["RR"])
@@ -1,16 +1,35 @@
 from collections import namedtuple
+import mmap
+import os
 import struct
 
 
 class Cartridge:
-    def __init__(self, rom_path: str) -> None:
+    def __init__(self, rom_path: str, use_mmap: bool = False) -> None:
 
-        self.MEMORY_BANKS = []
         self.ROM_PATH = rom_path
+        self.ROM: bytearray | mmap.mmap
 
+        # The whole ROM is held in one buffer, banks and their pages are views over it
+        # A memory mapped ROM shares the page cache with every other instance using the same file
         with open(self.ROM_PATH, "rb") as f:
-            while data := f.read(0x4000):
-                self.MEMORY_BANKS.append(bytearray(data))
+            size = os.fstat(f.fileno()).st_size
+            if use_mmap and size and size % 0x4000 == 0:
+                self.ROM = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.ROM = bytearray(f.read())
+
+        if len(self.ROM) % 0x4000 and isinstance(self.ROM, bytearray):
+            self.ROM.extend(bytes([0xFF]) * (0x4000 - len(self.ROM) % 0x4000))
+
+        rom_view = memoryview(self.ROM).toreadonly()
+        self.MEMORY_BANKS = [
+            rom_view[i : i + 0x4000] for i in range(0, len(self.ROM), 0x4000)
+        ]
+        # Page views are only built for banks that get mapped
+        self.MEMORY_PAGES: list[list[memoryview] | None] = [None] * len(
+            self.MEMORY_BANKS
+        )
 
         self.MBC_COUNT = len(self.MEMORY_BANKS)
 
@@ -40,6 +59,15 @@ class Cartridge:
         )
         #self.HEADER = CartridgeHeader(*header_unpacked)
 
+    def get_bank_pages(self, bank: int) -> list[memoryview]:
+        """Get the 256 byte page views of a ROM bank"""
+        pages = self.MEMORY_PAGES[bank]
+        if pages is None:
+            bank_view = self.MEMORY_BANKS[bank]
+            pages = [bank_view[i : i + 0x100] for i in range(0, 0x4000, 0x100)]
+            self.MEMORY_PAGES[bank] = pages
+        return pages
+
     def toggle_ram_enable(self, value: int) -> None:
         if (value & 0xF) == 0xA:
             self.RAM_ENABLE = True
@@ -0,0 +1,236 @@
+from typing import Callable
+
+from pyvologb.helpers import formatted_hex
+from pyvologb.cartridge import Cartridge
+from pyvologb.mmu import MMU
+from pyvologb.registers import Registers
+from pyvologb.opcodes import Opcodes
+from pyvologb.interrupts import vector
+from pyvologb.ppu import FRAME_CYCLES
+from pyvologb.scheduler import NEVER
+from pyvologb.translator import BlockCache
+from pyvologb.idle import IdleLoops
+from pyvologb.rewind import Rewind
+from pyvologb.savestate import restore, snapshot
+from pyvologb.trace import TraceComparison, TraceRecorder
+
+OP_DEBUG = False
+
+
+class Emulator:
+    """A Game Boy to drive from code, the command line in main is a front-end over it
+
+    `run_cycles`, `run_frame` and `run` go through the CPU loop in `run_to`, which only checks the
+    cycle counter between instructions. `step` and `run_until` run one pass of the same loop at a
+    time.
+    Events like a window or a stop condition go through the scheduler, `stop` can be called from
+    one to return from the run in progress.
+
+    TRACE, COMPARISON and REWIND are set by a front-end to record, check or rewind the run
+    """
+
+    def __init__(
+        self,
+        rom_path: str,
+        skip_boot: bool = False,
+        headless: bool = True,
+        jit: bool = False,
+        skip_idle: bool = False,
+        use_mmap: bool = False,
+        debug: bool = False,
+    ) -> None:
+        self.CARTRIDGE = Cartridge(rom_path, use_mmap=use_mmap)
+        self.mmu = MMU(
+            self.CARTRIDGE, use_boot_rom=not skip_boot, debug=debug, headless=headless
+        )
+        self.R = Registers(self.mmu)
+        self.opcodes = Opcodes(self.mmu, self.R)
+
+        self.IO = self.mmu.IO
+        self.SCHEDULER = self.IO.SCHEDULER
+        self.PPU = self.IO.LCD
+        self.DEBUG = debug
+
+        self.BLOCKS = BlockCache(self.mmu, self.opcodes, self.SCHEDULER) if jit else None
+        self.IDLE = IdleLoops(self.mmu, self.opcodes) if skip_idle else None
+
+        self.TRACE: TraceRecorder | None = None
+        self.COMPARISON: TraceComparison | None = None
+        self.DIVERGENCE: str | None = None  # the first divergence COMPARISON found
+        self.REWIND: Rewind | None = None
+
+        # Cycle the run in progress returns at
+        self.END = 0
+        self.STOP_ON_FRAME = False
+        self.PPU.FRAME_CALLBACKS.append(self.end_frame)
+
+    # region Running
+
+    def step(self) -> int:
+        """One pass of the CPU loop, returns the cycles it took
+
+        A pending interrupt is called, then an instruction, translated block or halted stretch runs.
+        Nothing runs once COMPARISON has diverged
+        """
+        start = self.SCHEDULER.CYCLE
+        self.run_loop(NEVER, once=True)
+        return self.SCHEDULER.CYCLE - start
+
+    def run_to(self, end: int) -> None:
+        """Run until the cycle counter reaches `end`, or `stop` is called"""
+        self.run_loop(end, once=False)
+
+    def run_loop(self, end: int, once: bool) -> None:
+        """The CPU loop, for `run_to` and `step`. Runs until the cycle counter reaches `end`, `stop`
+        is called, or after one pass if `once`"""
+        mmu = self.mmu
+        R = self.R
+        opcodes = self.opcodes
+        IO = self.IO
+        IF = IO.IF
+        IE = IO.IE
+        scheduler = self.SCHEDULER
+        blocks = self.BLOCKS
+        idle = self.IDLE
+        trace = self.TRACE
+        comparison = self.COMPARISON
+        rewind = self.REWIND
+        ppu = self.PPU
+        debug = self.DEBUG
+
+        self.END = end
+        while scheduler.CYCLE < self.END:
+            if rewind is not None and rewind.REQUESTED:
+                if rewind.step_back():
+                    ppu.present()
+
+            # region Interrupts
+
+            if mmu.IME and IF.FLAGS & IE.FLAGS:
+                self.service_interrupt()
+
+            # endregion
+
+            if mmu.HALT and IF.FLAGS & IE.FLAGS == 0:
+                # Only an event can raise an interrupt, so skip to the next one in 4 cycle steps
+                IO.tick(scheduler.cycles_to_deadline(4))
+            else:
+                mmu.HALT = False
+                block = blocks.lookup(R.PC) if blocks is not None else None
+                if block is not None:
+                    cycles = block.RUN()
+                    IO.tick(cycles)
+                    if idle is not None and R.PC < block.END:
+                        idle.check()
+                    if debug:
+                        ppu.CYCLE_COUNTER += block.instructions(cycles)
+                else:
+                    # After interrupts and HALT, so each state is that of an instruction about to
+                    # execute
+                    if trace is not None:
+                        trace.record()
+                    if comparison is None or self.compare():
+                        PC = R.PC
+                        PC_DATA = mmu.get_memory(PC)
+
+                        # region DEBUG
+                        if OP_DEBUG:
+                            print(
+                                formatted_hex(R.PC),
+                                formatted_hex(PC_DATA),
+                            )
+                            R.debug()
+                        # endregion
+
+                        cycles = opcodes.execute(PC_DATA)
+                        IO.tick(cycles)
+                        if idle is not None and R.PC <= PC:
+                            idle.check()
+                        if debug:
+                            ppu.CYCLE_COUNTER += 1
+
+            if once:
+                break
+
+    def compare(self) -> bool:
+        """Check the state against COMPARISON, False and stopping the run once it has diverged"""
+        assert self.COMPARISON is not None
+        if self.DIVERGENCE is None:
+            self.DIVERGENCE = self.COMPARISON.check()
+        if self.DIVERGENCE is None:
+            return True
+        self.stop()
+        return False
+
+    def run(self) -> None:
+        """Run until `stop` is called"""
+        self.run_to(NEVER)
+
+    def run_cycles(self, cycles: int) -> int:
+        """Run for at least `cycles` cycles, returns the cycles run"""
+        start = self.SCHEDULER.CYCLE
+        self.run_to(start + cycles)
+        return self.SCHEDULER.CYCLE - start
+
+    def run_frame(self) -> None:
+        """Run to the end of the next frame, or for a frame's cycles while the LCD is off"""
+        self.STOP_ON_FRAME = True
+        try:
+            self.run_to(self.SCHEDULER.CYCLE + FRAME_CYCLES + 1)
+        finally:
+            self.STOP_ON_FRAME = False
+
+    def run_until(self, predicate: Callable[[], bool], max_cycles: int = NEVER) -> bool:
+        """Step until `predicate` is true, checked before each step. False if `max_cycles` ran
+        out first, or COMPARISON diverged"""
+        end = self.SCHEDULER.CYCLE + max_cycles
+        while not predicate():
+            if self.SCHEDULER.CYCLE >= end or self.DIVERGENCE is not None:
+                return False
+            self.step()
+        return True
+
+    def stop(self) -> None:
+        """Return from the run in progress after the current instruction"""
+        self.END = 0
+
+    def end_frame(self) -> None:
+        if self.STOP_ON_FRAME:
+            self.stop()
+
+    def service_interrupt(self) -> None:
+        """Call the handler of the highest priority interrupt pending and enabled"""
+        IF = self.IO.IF
+        pending = IF.FLAGS & self.IO.IE.FLAGS
+        interrupt = pending & -pending
+        self.mmu.IME = False
+        IF.FLAGS ^= interrupt
+        self.opcodes.CALL_CD(vector(interrupt))
+        self.IO.tick(20)
+        self.mmu.HALT = False
+
+    # endregion
+
+    # region Input and Output
+
+    def press(self, button: str) -> None:
+        """Press one of A, B, START, SELECT, UP, DOWN, LEFT, RIGHT"""
+        self.IO.JOYP.press(button)
+
+    def release(self, button: str) -> None:
+        self.IO.JOYP.release(button)
+
+    def framebuffer(self) -> memoryview:
+        """The PPU framebuffer as palette indices, one byte per pixel, 4 where the display is
+        cleared. The screen is the top left 160 x 144 of PPU.FRAME_WIDTH wide rows, which are 160
+        unless the PPU is debugging. A view, so it changes as the emulator runs"""
+        return memoryview(self.PPU.FRAMEBUFFER)
+
+    def snapshot(self) -> bytes:
+        return snapshot(self.mmu, self.R)
+
+    def restore(self, state: bytes) -> None:
+        """Restore a `snapshot`, not from inside a scheduler event"""
+        restore(self.mmu, self.R, state)
+
+    # endregion
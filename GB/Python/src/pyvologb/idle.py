@@ -0,0 +1,220 @@
+from pyvologb.mmu import MMU
+from pyvologb.opcodes import CYCLES, Opcodes
+from pyvologb.scheduler import NEVER
+
+# Longest loop body checked, in instructions
+MAX_LOOP_LENGTH = 16
+
+# Opcodes with no effect outside the registers and flags, besides reading memory
+PURE_OPCODES = (
+    {0x00, 0x07, 0x0F, 0x17, 0x1F, 0x27, 0x2F, 0x37, 0x3F}
+    | {0x04 | r << 3 for r in range(8) if r != 6}  # INC r
+    | {0x05 | r << 3 for r in range(8) if r != 6}  # DEC r
+    | {0x06 | r << 3 for r in range(8) if r != 6}  # LD r,n
+    | {0x0A, 0x1A, 0x2A, 0x3A, 0xF0, 0xF2, 0xFA}  # LD A,(..)
+    | {opcode for opcode in range(0x40, 0x80) if not 0x70 <= opcode <= 0x77}  # LD r,r'
+    | set(range(0x80, 0xC0))  # ALU A,r
+    | {0xC6, 0xCE, 0xD6, 0xDE, 0xE6, 0xEE, 0xF6, 0xFE}  # ALU A,n
+    | {0x100 | opcode for opcode in range(0x100) if opcode & 7 != 6}  # CB r
+    | {0x100 | opcode for opcode in range(0x40, 0x80) if opcode & 7 == 6}  # BIT n,(HL)
+)
+
+# Branches that can close a loop, and their cycles when taken
+LOOP_BRANCHES = {
+    0x18: 12, 0x20: 12, 0x28: 12, 0x30: 12, 0x38: 12,
+    0xC2: 16, 0xC3: 16, 0xCA: 16, 0xD2: 16, 0xDA: 16,
+}  # fmt: skip
+
+
+def registers_written(index: int) -> tuple[int, ...]:
+    """Registers written by a PURE_OPCODES instruction, numbered as in opcodes, B C D E H L A as
+    0 -> 5 and 7"""
+    match index:
+        case 0x2A | 0x3A:
+            return (4, 5, 7)
+        case _ if index < 0x40 and index & 7 in (4, 5, 6):
+            return (index >> 3,)
+        case _ if 0x40 <= index < 0x80:
+            return (index >> 3 & 7,)
+        case _ if index > 0xFF and not 0x140 <= index < 0x180:
+            return (index & 7,)
+    return ()
+
+
+def stable_address(address: int) -> bool:
+    """Reads from `address` only change through writes and scheduler events
+
+    The timer registers are computed from the scheduler cycle, and cartridge RAM may be a clock
+    """
+    return (
+        address < 0xA000
+        or 0xC000 <= address < 0xFF00
+        or address in (0xFF00, 0xFF0F, 0xFFFF)
+        or 0xFF40 <= address <= 0xFF4B
+        or 0xFF80 <= address <= 0xFFFE
+    )
+
+
+class IdleLoop:
+    def __init__(
+        self, cycles: int, last_read: int, last_instruction: int, addresses: list[int]
+    ) -> None:
+        self.CYCLES = cycles  # one iteration, with the branch back taken
+        # cycles into an iteration where the last instruction reading memory, and the branch, start
+        self.LAST_READ = last_read
+        self.LAST_INSTRUCTION = last_instruction
+        self.ADDRESSES = addresses  # memory read each iteration
+
+
+class IdleLoops:
+    """Fast-forwards loops waiting on LY, STAT, IF, or a flag in RAM to change
+
+    Called whenever the CPU jumps back, `check` compares the state each time the same PC is reached.
+    If one iteration took the CPU back to the same registers and flags without a scheduler event
+    running, and the loop at PC only reads memory that events change, every iteration until the next
+    event is the same. Those iterations are skipped by ticking their cycles at once, the state after
+    them is the state now.
+
+    The iteration the next event falls in is skipped as well when the event runs after the loop's
+    last read, and after its last instruction started if interrupts are enabled. Skipping continues
+    through the following events until one changes the memory the loop reads, or raises an interrupt.
+    """
+
+    def __init__(self, mmu: MMU, opcodes: Opcodes) -> None:
+        self.mmu = mmu
+        self.R = opcodes.R
+        self.DISPATCH = opcodes.DISPATCH
+        self.SCHEDULER = mmu.IO.SCHEDULER
+
+        # The last PC jumped back to, and the cycle, deadline and state when it was reached
+        self._PC = -1
+        self._CYCLE = 0
+        self._DEADLINE = 0
+        self._STATE: tuple[int, ...] = ()
+
+        self.SKIPS = 0
+        self.SKIPPED_CYCLES = 0
+
+    def check(self) -> None:
+        """Called with R.PC just jumped back to"""
+        R = self.R
+        scheduler = self.SCHEDULER
+        pc = R.PC
+        state = (
+            R.A, R.B, R.C, R.D, R.E, R.H, R.L, R.SP,
+            R.ZERO, R.SUBTRACTION, R.HALFCARRY, R.CARRY,
+        )  # fmt: skip
+
+        # An event running in between moves the deadline on
+        if (
+            pc == self._PC
+            and state == self._STATE
+            and scheduler.NEXT_DEADLINE == self._DEADLINE
+            and scheduler.NEXT_DEADLINE != NEVER
+        ):
+            loop = self.decode_loop(pc)
+            if loop is not None and scheduler.CYCLE - self._CYCLE == loop.CYCLES:
+                self.skip(loop)
+
+        self._PC = pc
+        self._CYCLE = scheduler.CYCLE
+        self._DEADLINE = scheduler.NEXT_DEADLINE
+        self._STATE = state
+
+    def skip(self, loop: IdleLoop) -> None:
+        """Tick the iterations of `loop` that would leave the CPU state as it is"""
+        mmu = self.mmu
+        IO = mmu.IO
+        scheduler = self.SCHEDULER
+        cycles = loop.CYCLES
+        values = self.read(loop)
+        start = scheduler.CYCLE
+
+        while True:
+            # every iteration ending before the deadline
+            iterations = (scheduler.NEXT_DEADLINE - 1 - scheduler.CYCLE) // cycles
+            IO.tick(iterations * cycles)
+
+            # the iteration running the next event, when every read comes before it
+            offset = scheduler.NEXT_DEADLINE - scheduler.CYCLE
+            if offset <= loop.LAST_READ or (mmu.IME and offset <= loop.LAST_INSTRUCTION):
+                break
+            IO.tick(cycles)
+
+            if self.read(loop) != values or (mmu.IME and IO.IF.FLAGS & IO.IE.FLAGS):
+                break
+
+        if scheduler.CYCLE != start:
+            self.SKIPS += 1
+            self.SKIPPED_CYCLES += scheduler.CYCLE - start
+
+    def read(self, loop: IdleLoop) -> list[int]:
+        return [self.mmu.get_memory(address) for address in loop.ADDRESSES]
+
+    def decode_loop(self, start: int) -> IdleLoop | None:
+        """The loop at `start`, None if it isn't a side effect free block of instructions ending
+        with a branch back to `start`"""
+        mmu = self.mmu
+        pc = start
+        cycles = 0
+        last_read = 0
+        addresses: list[int] = []
+        # registers written so far, which no longer hold their value from the start of the loop
+        written: set[int] = set()
+
+        for _ in range(MAX_LOOP_LENGTH):
+            opcode = mmu.get_memory(pc)
+            width = self.DISPATCH[opcode][1]
+            operand = 0
+            for i in range(width):
+                operand |= mmu.get_memory((pc + 1 + i) & 0xFFFF) << (i * 8)
+            pc += 1 + width
+
+            if opcode in LOOP_BRANCHES:
+                if opcode < 0x40:
+                    target = pc + ((operand ^ 0x80) - 0x80)
+                else:
+                    target = operand
+                if target != start:
+                    return None
+                return IdleLoop(cycles + LOOP_BRANCHES[opcode], last_read, cycles, addresses)
+
+            index = 0x100 | operand if opcode == 0xCB else opcode
+            if index not in PURE_OPCODES:
+                return None
+
+            read = self.read_address(index, operand)
+            if read is not None:
+                address, registers = read
+                if written.intersection(registers) or not stable_address(address):
+                    return None
+                addresses.append(address)
+                last_read = cycles
+            written.update(registers_written(index))
+            cycles += CYCLES[index]
+
+        return None
+
+    def read_address(self, index: int, operand: int) -> tuple[int, tuple[int, ...]] | None:
+        """Address read by a PURE_OPCODES instruction from the current registers, and the registers
+        it's computed from"""
+        R = self.R
+        match index:
+            case 0x0A:
+                return R.B << 8 | R.C, (0, 1)
+            case 0x1A:
+                return R.D << 8 | R.E, (2, 3)
+            case 0xF0:
+                return 0xFF00 + operand, ()
+            case 0xF2:
+                return 0xFF00 + R.C, (1,)
+            case 0xFA:
+                return operand, ()
+            case 0x2A | 0x3A:
+                return R.H << 8 | R.L, (4, 5)
+            case _ if index & 7 == 6 and (0x40 <= index < 0xC0 or index > 0xFF):
+                return R.H << 8 | R.L, (4, 5)
+        return None
+
+    def stats(self) -> str:
+        return f"idle skips: {self.SKIPS} cycles: {self.SKIPPED_CYCLES}"
@@ -0,0 +1,57 @@
+from pyvologb.mmu import BUTTONS, IO
+from pyvologb.ppu import FRAME_CYCLES
+
+
+class InputScript:
+    """Presses and releases joypad buttons at set frames, for running without a keyboard
+
+    Each line of a script is `<frame> <button> <press|release>`, frames are counted in
+    FRAME_CYCLES from power on. Blank lines and lines starting with # are ignored, e.g.
+
+        # skip the title screen
+        120 START press
+        125 START release
+    """
+
+    def __init__(self, IO: IO, path: str) -> None:
+        self.IO = IO
+        self.STEPS: list[tuple[int, str, bool]] = []
+
+        with open(path) as f:
+            for number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                match line.split():
+                    case [frame, button, "press" | "release" as action] if (
+                        frame.isdigit() and button.upper() in BUTTONS
+                    ):
+                        self.STEPS.append((int(frame), button.upper(), action == "press"))
+                    case _:
+                        raise Exception(f"Invalid input script line {number}:", line)
+
+        self.STEPS.sort(key=lambda step: step[0])
+        self._NEXT = 0
+
+        self.STEP_EVENT = IO.SCHEDULER.register(self.run_steps)
+        self.schedule_next()
+
+    def schedule_next(self) -> None:
+        if self._NEXT < len(self.STEPS):
+            frame = self.STEPS[self._NEXT][0]
+            self.IO.SCHEDULER.schedule_at(self.STEP_EVENT, frame * FRAME_CYCLES)
+
+    def run_steps(self) -> None:
+        """Apply every step due by the current frame"""
+        frame = self.IO.SCHEDULER.CYCLE // FRAME_CYCLES
+
+        while self._NEXT < len(self.STEPS) and self.STEPS[self._NEXT][0] <= frame:
+            _, button, pressed = self.STEPS[self._NEXT]
+            if pressed:
+                self.IO.JOYP.press(button)
+            else:
+                self.IO.JOYP.release(button)
+            self._NEXT += 1
+
+        self.schedule_next()
@@ -0,0 +1,28 @@
+# Interrupt bits of IF and IE. A lower bit has higher priority
+VBLANK = 0x01
+LCD = 0x02
+TIMER = 0x04
+SERIAL = 0x08
+JOYPAD = 0x10
+
+
+def vector(interrupt: int) -> int:
+    """Handler address of a single interrupt bit"""
+    return 0x40 + (interrupt.bit_length() - 1) * 8
+
+
+class Interrupts:
+    """IF or IE, the five interrupt bits held as one integer"""
+
+    def __init__(self, value: int = 0x00, upper_bits: bool = False) -> None:
+        self.FLAGS = value & 0x1F
+        self.UPPER_F = upper_bits
+
+    def set(self, value: int) -> None:
+        self.FLAGS = value & 0x1F
+
+    def get(self) -> int:
+        return (7 << 5 if self.UPPER_F else 0) | self.FLAGS
+
+    def request(self, interrupt: int) -> None:
+        self.FLAGS |= interrupt
@@ -4,25 +4,84 @@ import pstats
 import traceback
 import sys
 import os
+import time
 import typing
 import pygame
-from pyvologb.helpers import formatted_hex
-from pyvologb.cartridge import Cartridge
-from pyvologb.mmu import MMU
-from pyvologb.registers import Registers
-from pyvologb.opcodes import Opcodes
+from pyvologb.emulator import Emulator
+from pyvologb.inputscript import InputScript
+from pyvologb.ppu import FRAME_CYCLES
+from pyvologb.rewind import Rewind
+from pyvologb.sharedframe import SharedFramebuffer
+from pyvologb.trace import TraceComparison, TraceRecorder
 
 
 def main() -> None:
     print()
 
     def parse_args(args: typing.List[str]) -> argparse.Namespace:
+        def positive_int(value: str) -> int:
+            count = int(value)
+            if count <= 0:
+                raise argparse.ArgumentTypeError(f"{value} is not a positive count")
+            return count
+
         parser = argparse.ArgumentParser()
         parser.add_argument("rom")
         parser.add_argument("-s", "--skip-boot", action="store_true", default=False)
-        parser.add_argument("-m", "--mem-dump", action="store_true", default=False)
+        parser.add_argument(
+            "-m",
+            "--mem-dump",
+            action="store_true",
+            default=False,
+            help="record a binary trace of every instruction, see TraceRecorder",
+        )
+        parser.add_argument(
+            "--trace-last",
+            type=positive_int,
+            help="with --mem-dump, keep only the last n instructions",
+        )
+        parser.add_argument(
+            "--compare",
+            help="stop at the first instruction diverging from a Gameboy Doctor log",
+        )
         parser.add_argument("-d", "--debug", action="store_true", default=False)
         parser.add_argument("-p", "--profile", action="store_true", default=False)
+        parser.add_argument("--mmap", action="store_true", default=False)
+        parser.add_argument("--headless", action="store_true", default=False)
+        parser.add_argument("--input", help="joypad input script, see InputScript")
+        parser.add_argument("--frames", type=int, help="stop after this many frames")
+        parser.add_argument(
+            "--jit", action="store_true", default=False, help="translate basic blocks"
+        )
+        parser.add_argument(
+            "--skip-idle",
+            action="store_true",
+            default=False,
+            help="fast-forward loops polling for the next event",
+        )
+        parser.add_argument(
+            "--rewind",
+            action="store_true",
+            default=False,
+            help="record savestates to step back through with backspace, see Rewind",
+        )
+        parser.add_argument(
+            "--rewind-interval",
+            type=int,
+            default=10,
+            help="frames between rewind savestates",
+        )
+        parser.add_argument(
+            "--rewind-memory",
+            type=float,
+            default=4,
+            help="MiB of rewind history to keep",
+        )
+        parser.add_argument(
+            "--shared-framebuffer",
+            metavar="NAME",
+            help="copy each frame into this shared memory block, see SharedFramebuffer",
+        )
         return parser.parse_args(args)
 
     args = parse_args(sys.argv[1:])
@@ -32,29 +91,63 @@ def main() -> None:
         print(f'ROM does not exist at "{ROM_PATH}"')
         sys.exit()
 
-    OP_DEBUG = False
-
     if args.profile:
         profiler = cProfile.Profile()
         profiler.enable()
 
+    # The state dump and comparison see every instruction, so they run without blocks or idle skipping
+    per_instruction = args.mem_dump or args.compare
+    emulator = Emulator(
+        ROM_PATH,
+        skip_boot=args.skip_boot,
+        headless=args.headless,
+        jit=args.jit and not per_instruction,
+        skip_idle=args.skip_idle and not per_instruction,
+        use_mmap=args.mmap,
+        debug=args.debug,
+    )
+    mmu = emulator.mmu
+    R = emulator.R
+
+    if args.input:
+        InputScript(mmu.IO, os.path.abspath(args.input))
+
+    LOGS = os.path.join(os.path.dirname(os.path.realpath(__file__)), "logs")
     if args.mem_dump:
-        state_debug = []
-
-    # region Registers
-
-    cartridge = Cartridge(ROM_PATH)
-    mmu = MMU(cartridge, use_boot_rom=(not args.skip_boot), debug=args.debug)
-    R = Registers(mmu)
-    opcodes = Opcodes(mmu, R)
-
-    # endregion
+        emulator.TRACE = TraceRecorder(
+            mmu,
+            R,
+            os.path.join(LOGS, "state_dump.trace"),
+            capacity=args.trace_last or 0x10000,
+            ring=args.trace_last is not None,
+        )
+    if args.compare:
+        emulator.COMPARISON = TraceComparison(mmu, R, os.path.abspath(args.compare))
+    if args.rewind:
+        emulator.REWIND = Rewind(
+            mmu,
+            R,
+            interval=args.rewind_interval,
+            max_bytes=int(args.rewind_memory * (1 << 20)),
+        )
+    rewind = emulator.REWIND
+    shared_framebuffer = (
+        SharedFramebuffer(emulator.PPU, args.shared_framebuffer)
+        if args.shared_framebuffer
+        else None
+    )
 
     def debug(exception: Exception | None = None) -> None:
         if args.debug:
             print("------")
             R.debug()
             mmu.IO.SERIAL.get_serial()
+            if emulator.BLOCKS is not None:
+                print(emulator.BLOCKS.stats())
+            if emulator.IDLE is not None:
+                print(emulator.IDLE.stats())
+            if rewind is not None:
+                print(rewind.stats())
             print("------")
 
         if args.profile:
@@ -66,111 +159,90 @@ def main() -> None:
             traceback.print_exception(exception)
 
     def dump() -> None:
-        if args.mem_dump:
-            with open(
-                os.path.join(
-                    os.path.dirname(os.path.realpath(__file__)), "logs/state_dump.log"
-                ),
-                "w",
-            ) as f:
-                f.writelines(state_debug)
+        if shared_framebuffer is not None:
+            shared_framebuffer.close()
+        if emulator.TRACE is not None:
+            emulator.TRACE.close()
             mmu.dump()
 
-    lastTime = 0
+    # region Events
+
+    rewinding = False  # backspace held
+
+    # Run from the scheduler, the CPU loop doesn't check for them per instruction
+    def poll_events() -> None:
+        nonlocal rewinding
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                debug()
+                dump()
+                pygame.quit()
+                print("Closed App")
+                sys.exit()
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP) and (
+                event.scancode == pygame.KSCAN_BACKSPACE
+            ):
+                rewinding = event.type == pygame.KEYDOWN
+            mmu.IO.JOYP.handle_event(event)
+
+        # A savestate can't be restored from an event, the CPU loop steps back
+        if rewind is not None and rewinding:
+            rewind.REQUESTED = True
+
+        mmu.IO.SCHEDULER.schedule(POLL_EVENT, FRAME_CYCLES)
+
+    # Not pygame's clock, it's only running once pygame.init is called, which headless skips
+    lastTime = time.perf_counter()
+
+    def report_speed() -> None:
+        nonlocal lastTime
+        if time.perf_counter() - lastTime >= 1:
+            print(f"CYCLES: {mmu.IO.LCD.CYCLE_COUNTER}")
+            lastTime = time.perf_counter()
+            mmu.IO.LCD.CYCLE_COUNTER = 0
+
+        mmu.IO.SCHEDULER.schedule(REPORT_EVENT, FRAME_CYCLES)
+
+    def stop() -> None:
+        debug()
+        dump()
+        print(f"Stopped after {args.frames} frames")
+        sys.exit()
 
-    # region CPU Logic
-    try:
-        while True:
-            if args.mem_dump:
-                curr_state = f"A:{formatted_hex(R.A)} F:{formatted_hex(R.F)} B:{formatted_hex(R.B)} C:{formatted_hex(R.C)} D:{formatted_hex(R.D)} E:{formatted_hex(R.E)} H:{formatted_hex(R.H)} L:{formatted_hex(R.L)} SP:{formatted_hex(R.SP,False,True)} SPMEM:{formatted_hex(mmu.get_memory(R.SP & 0xFFFF))},{formatted_hex(mmu.get_memory((R.SP+1) & 0xFFFF))},{formatted_hex(mmu.get_memory((R.SP+2) & 0xFFFF))},{formatted_hex(mmu.get_memory((R.SP+3) & 0xFFFF))} PC:{formatted_hex(R.PC,False,True)} PCMEM:{formatted_hex(mmu.get_memory(R.PC))},{formatted_hex(mmu.get_memory(R.PC+1))},{formatted_hex(mmu.get_memory(R.PC+2))},{formatted_hex(mmu.get_memory(R.PC+3))}\n"
-                state_debug.append(curr_state)
-            if args.debug:
-                if pygame.time.get_ticks() - lastTime >= 1000:
-                    print(f"CYCLES: {mmu.IO.LCD.CYCLE_COUNTER}")
-                    lastTime = pygame.time.get_ticks()
-                    mmu.IO.LCD.CYCLE_COUNTER = 0
-
-            # region Events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    debug()
-                    dump()
-                    pygame.quit()
-                    print("Closed App")
-                    sys.exit()
-                mmu.IO.JOYP.handle_event(event)
-            # endregion
-
-            # region Interrupts
-
-            if mmu.IME:
-                if mmu.IO.IF.VBLANK == 1 and mmu.IO.IE.VBLANK == 1:
-                    mmu.IME = False
-                    mmu.IO.IF.VBLANK = 0
-                    opcodes.CALL_CD(0x40)
-                    mmu.IO.tick(20)
-                    mmu.HALT = False
-                elif mmu.IO.IF.LCD == 1 and mmu.IO.IE.LCD == 1:
-                    mmu.IME = False
-                    mmu.IO.IF.LCD = 0
-                    opcodes.CALL_CD(0x48)
-                    mmu.IO.tick(20)
-                    mmu.HALT = False
-                elif mmu.IO.IF.TIMER == 1 and mmu.IO.IE.TIMER == 1:
-                    mmu.IME = False
-                    mmu.IO.IF.TIMER = 0
-                    opcodes.CALL_CD(0x50)
-                    mmu.IO.tick(20)
-                    mmu.HALT = False
-                elif mmu.IO.IF.SERIAL == 1 and mmu.IO.IE.SERIAL == 1:
-                    mmu.IME = False
-                    mmu.IO.IF.SERIAL = 0
-                    opcodes.CALL_CD(0x58)
-                    mmu.IO.tick(20)
-                    mmu.HALT = False
-                elif mmu.IO.IF.JOYPAD == 1 and mmu.IO.IE.JOYPAD == 1:
-                    mmu.IME = False
-                    mmu.IO.IF.JOYPAD = 0
-                    opcodes.CALL_CD(0x60)
-                    mmu.IO.tick(20)
-                    mmu.HALT = False
-
-            # endregion
-
-            if mmu.HALT:
-                if mmu.IO.IF.get() & mmu.IO.IE.get() == 0:
-                    mmu.IO.tick(4)
-                    continue
-                else:
-                    mmu.HALT = False
-
-            PC_DATA = mmu.get_memory(R.PC)
-
-            if PC_DATA == 0xCB:
-                PC_DATA = mmu.get_memory(R.PC + 1) + 0x100
-                R.PC += 1
-
-            # region DEBUG
-            if OP_DEBUG:
-                print(
-                    formatted_hex(R.PC),
-                    formatted_hex(PC_DATA),
-                )
-                R.debug()
-            # endregion
-
-            cycles = opcodes.execute(PC_DATA)
-            mmu.IO.tick(cycles)
-            if args.debug:
-                mmu.IO.LCD.CYCLE_COUNTER += 1
+    if not args.headless:
+        POLL_EVENT = mmu.IO.SCHEDULER.register(poll_events)
+        mmu.IO.SCHEDULER.schedule(POLL_EVENT, 0)
+
+    if args.debug:
+        REPORT_EVENT = mmu.IO.SCHEDULER.register(report_speed)
+        mmu.IO.SCHEDULER.schedule(REPORT_EVENT, 0)
+
+    if args.frames is not None:
+        STOP_EVENT = mmu.IO.SCHEDULER.register(stop)
+        mmu.IO.SCHEDULER.schedule_at(STOP_EVENT, args.frames * FRAME_CYCLES)
 
     # endregion
 
+    try:
+        emulator.run()
+
+        # only returns when the comparison diverged
+        if emulator.DIVERGENCE is not None:
+            print(emulator.DIVERGENCE)
+            debug()
+            dump()
+            sys.exit()
+
     except Exception as e:
         debug(e)
         dump()
         print("Exiting...")
 
+    finally:
+        # the events quitting the run exit from inside it
+        if emulator.COMPARISON is not None:
+            emulator.COMPARISON.close()
+
 
 if __name__ == "__main__":
     main()
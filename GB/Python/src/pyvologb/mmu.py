@@ -2,12 +2,26 @@ import os
 import pygame
 from pyvologb.helpers import formatted_hex
 from pyvologb.cartridge import Cartridge
+from pyvologb.interrupts import Interrupts, JOYPAD, TIMER
 from pyvologb.ppu import PPU
+from pyvologb.scheduler import Scheduler
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyvologb.translator import BlockCache
+
+# Joypad buttons, as accepted by Joypad.press and Joypad.release
+BUTTONS = ("A", "B", "SELECT", "START", "RIGHT", "LEFT", "UP", "DOWN")
 
 
 class MMU:
     def __init__(
-        self, cartridge: Cartridge, use_boot_rom: bool = False, debug: bool = False
+        self,
+        cartridge: Cartridge,
+        use_boot_rom: bool = False,
+        debug: bool = False,
+        headless: bool = False,
     ) -> None:
 
         self.BOOT_ROM = "/lib/bootrom.bin"
@@ -16,12 +30,13 @@ class MMU:
         self.USE_BOOT_ROM = use_boot_rom
 
         self.DEBUG = debug
+        self.HEADLESS = headless
 
-        io = IO(self, self.DEBUG)
+        io = IO(self, self.DEBUG, self.HEADLESS)
 
         # ROM Memory is cartridge memory, and is therefore readonly unless there's an MBC chip
-        self.ROM1 = bytearray(0x4000)  # 0000 -> 3FFF
-        self.ROM2 = bytearray(0x4000)  # 4000 -> 7FFF
+        self.ROM1 = cartridge.MEMORY_BANKS[0]  # 0000 -> 3FFF
+        self.ROM2 = cartridge.MEMORY_BANKS[1]  # 4000 -> 7FFF
 
         # This memory is GB internal
         self.VRAM = bytearray(0x2000)  # 8000 -> 9FFF
@@ -36,60 +51,112 @@ class MMU:
         self.IME = False
         self.HALT = False
 
+        # Page table, one entry per 256 byte page of the address space
+        # Pages backed by a buffer are accessed directly, None routes through get/set_unpaged_memory
+        self.READ_PAGES: list[memoryview | None] = [None] * 0x100
+        self.WRITE_PAGES: list[memoryview | None] = [None] * 0x100
+
+        self.map_pages(0x80, self.VRAM, True)
+        self.map_pages(0xA0, self.ERAM, True)
+        self.map_pages(0xC0, self.WRAM, True)
+        self.map_pages(0xE0, self.ECHO, True)
+
+        # Tile data writes go through set_unpaged_memory so the PPU can invalidate its decoded tiles
+        self.WRITE_PAGES[0x80:0x98] = [None] * 0x18
+
+        # Translated code, when enabled. Counts writes so blocks can stop after one hits IO or code
+        self.BLOCKS: "BlockCache | None" = None
+        self.UNPAGED_WRITES = 0
+
         self.switch_rom_bank(0)
 
         if self.USE_BOOT_ROM and self.IO.BANK == 0:
-            with open(
-                os.path.dirname(os.path.abspath(__file__)) + self.BOOT_ROM, "rb"
-            ) as f:
-                self.ROM1[0:0x100] = f.read()
+            self.map_boot_rom()
 
         self.switch_rom_bank(1)
 
         # print(self.CARTRIDGE.HEADER.title)
 
+    def map_pages(self, page: int, buffer: bytearray, writable: bool) -> None:
+        """Point the page table entries starting at `page` at the 256 byte pages of `buffer`"""
+        view = memoryview(buffer)
+        for i in range(len(buffer) >> 8):
+            page_view = view[i << 8 : (i + 1) << 8]
+            self.READ_PAGES[page + i] = page_view
+            self.WRITE_PAGES[page + i] = page_view if writable else None
+
+    def map_boot_rom(self) -> None:
+        """The boot ROM overlays the first page of ROM until it's unmapped through FF50"""
+        with open(os.path.dirname(os.path.abspath(__file__)) + self.BOOT_ROM, "rb") as f:
+            self.READ_PAGES[0x00] = memoryview(f.read())
+        if self.BLOCKS is not None:
+            self.BLOCKS.invalidate_range(0x0000, 0x0100)
+
     def switch_rom_bank(self, bank: int) -> None:
+        # Rebinding the pages to the cartridge views, no ROM data is copied
         match bank:
             case 0:
-                bank_data = self.CARTRIDGE.MEMORY_BANKS[0].copy()
-                self.ROM1 = bank_data
+                self.ROM1 = self.CARTRIDGE.MEMORY_BANKS[0]
+                self.READ_PAGES[0x00:0x40] = self.CARTRIDGE.get_bank_pages(0)
+                if self.BLOCKS is not None:
+                    self.BLOCKS.invalidate_range(0x0000, 0x4000)  # boot ROM unmapped
             case _:
                 self.CURRENT_BANK = bank
-                bank_data = self.CARTRIDGE.MEMORY_BANKS[bank].copy()
-                self.ROM2 = bank_data
+                self.ROM2 = self.CARTRIDGE.MEMORY_BANKS[bank]
+                self.READ_PAGES[0x40:0x80] = self.CARTRIDGE.get_bank_pages(bank)
 
     def switch_ram_bank(self, bank: int) -> None:
         pass
 
     def get_memory(self, address: int) -> int:
+        page = self.READ_PAGES[address >> 8]
+        if page is None:
+            return self.get_unpaged_memory(address)
+        return page[address & 0xFF]
+
+    def set_memory(self, address: int, value: int) -> None:
+        page = self.WRITE_PAGES[address >> 8]
+        if page is None:
+            self.set_unpaged_memory(address, value)
+        else:
+            page[address & 0xFF] = value
+
+    def get_unpaged_memory(self, address: int) -> int:
         match address:
-            case addr if 0x0000 <= addr <= 0x3FFF:
-                return self.ROM1[address]
-            case addr if 0x4000 <= addr <= 0x7FFF:
-                return self.ROM2[address - 0x4000]
-            case addr if 0x8000 <= addr <= 0x9FFF:
-                return self.VRAM[address - 0x8000]
-            case addr if 0xA000 <= addr <= 0xBFFF:
-                return self.ERAM[address - 0xA000]
-            case addr if 0xC000 <= addr <= 0xDFFF:
-                return self.WRAM[address - 0xC000]
-            case addr if 0xE000 <= addr <= 0xFDFF:
-                return self.ECHO[address - 0xE000]
+            case addr if 0xFF80 <= addr <= 0xFFFE:
+                return self.HRAM[address - 0xFF80]
+            case addr if 0xFF00 <= addr <= 0xFF7F:
+                return self.IO.get(address)
             case addr if 0xFE00 <= addr <= 0xFE9F:
                 return self.OAM[address - 0xFE00]
             case addr if 0xFEA0 <= addr <= 0xFEFF:
                 return 0x00
-            case addr if 0xFF00 <= addr <= 0xFF7F:
-                return self.IO.get(address)
-            case addr if 0xFF80 <= addr <= 0xFFFE:
-                return self.HRAM[address - 0xFF80]
             case 0xFFFF:
                 return self.IO.IE.get()
             case _:
                 raise Exception("Inaccessible Memory:", formatted_hex(address))
 
-    def set_memory(self, address: int, value: int) -> None:
+    def set_unpaged_memory(self, address: int, value: int) -> None:
+        self.UNPAGED_WRITES += 1
+        if self.BLOCKS is not None and self.BLOCKS.CODE_PAGES[address >> 8]:
+            self.BLOCKS.write(address, value)
+            return
+
         match address:
+            case addr if 0xFF80 <= addr <= 0xFFFE:
+                self.HRAM[address - 0xFF80] = value
+            case addr if 0xFF00 <= addr <= 0xFF7F:
+                self.IO.set(address, value)
+            case addr if 0xFE00 <= addr <= 0xFE9F:
+                self.OAM[address - 0xFE00] = value
+            case addr if 0xFEA0 <= addr <= 0xFEFF:
+                pass  # ignore memory here??
+            case 0xFFFF:
+                self.IO.IE.set(value)
+            case addr if 0x8000 <= addr <= 0x97FF:
+                if self.VRAM[address - 0x8000] != value:
+                    self.VRAM[address - 0x8000] = value
+                    self.IO.LCD.TILES.invalidate((address - 0x8000) >> 4)
             case addr if 0x0000 <= addr <= 0x1FFF:
                 self.CARTRIDGE.toggle_ram_enable(value)
             case addr if 0x2000 <= addr <= 0x3FFF:
@@ -100,24 +167,6 @@ class MMU:
             case addr if 0x6000 <= addr <= 0x7FFF:
                 print("TODO Banking Mode Select")
                 pass
-            case addr if 0x8000 <= addr <= 0x9FFF:
-                self.VRAM[address - 0x8000] = value
-            case addr if 0xA000 <= addr <= 0xBFFF:
-                self.ERAM[address - 0xA000] = value
-            case addr if 0xC000 <= addr <= 0xDFFF:
-                self.WRAM[address - 0xC000] = value
-            case addr if 0xE000 <= addr <= 0xFDFF:
-                self.ECHO[address - 0xE000] = value
-            case addr if 0xFE00 <= addr <= 0xFE9F:
-                self.OAM[address - 0xFE00] = value
-            case addr if 0xFEA0 <= addr <= 0xFEFF:
-                pass  # ignore memory here??
-            case addr if 0xFF00 <= addr <= 0xFF7F:
-                self.IO.set(address, value)
-            case addr if 0xFF80 <= addr <= 0xFFFE:
-                self.HRAM[address - 0xFF80] = value
-            case 0xFFFF:
-                self.IO.IE.set(value)
             case _:
                 raise Exception("Inaccessible Memory:", formatted_hex(address))
 
@@ -130,8 +179,7 @@ class MMU:
             "w",
         ) as f:
             dump = bytearray.hex(
-                self.ROM1
-                + self.ROM2
+                bytearray().join(page for page in self.READ_PAGES[0x00:0x80] if page)
                 + self.VRAM
                 + self.ERAM
                 + self.WRAM
@@ -153,9 +201,10 @@ class MMU:
 
 
 class IO:
-    def __init__(self, mmu: MMU, debug: bool = False) -> None:
+    def __init__(self, mmu: MMU, debug: bool = False, headless: bool = False) -> None:
 
         self.MMU = mmu
+        self.SCHEDULER = Scheduler()
 
         self.JOYP = Joypad(self)  # FF00
         self.SERIAL = Serial(debug)  # FF01 -> FF02
@@ -165,7 +214,7 @@ class IO:
         self.AUDIO = Audio()
 
         self.WAVE = bytearray(0x10)  # FF30 -> FF3F
-        self.LCD = PPU(mmu, debug)  # FF40 -> FF4B
+        self.LCD = PPU(mmu, self.SCHEDULER, debug, headless)  # FF40 -> FF4B
         # ???
         self.BANK = (not mmu.USE_BOOT_ROM) & 1  # FF50
         self.IE = Interrupts()  # FFFF
@@ -221,9 +270,7 @@ class IO:
                 )
 
     def tick(self, cycles: int) -> None:
-        self._TIMER.tick(cycles)
-        self.LCD.tick(cycles)
-        self.AUDIO.tick(cycles)
+        self.SCHEDULER.tick(cycles)
 
     def dump(self) -> bytearray:
         data = bytearray(
@@ -261,38 +308,56 @@ class Timer:
     def __init__(self, IO: IO) -> None:
 
         self.IO = IO
+        self.SCHEDULER = IO.SCHEDULER
+        self.OVERFLOW_EVENT = self.SCHEDULER.register(self.overflow)
+
+        # DIV and TIMA are derived from the cycle counter when read
+        # the only scheduled event is the next TIMA overflow
 
-        self._DIVIDER = 0xAB00  # 16 bit register
+        self._DIVIDER_START = -0xAB00  # cycle the 16 bit divider was last 0
 
         # DIV - FF04
 
-        self.TIMA = 0x00  # FF05
+        self._TIMA = 0x00  # FF05, as of _TIMA_START
+        self._TIMA_START = 0  # cycle of the last TIMA sync, always on an increment
         self.TMA = 0x00  # FF06
 
         self._TAC_ENABLE = 0
         self._TAC_CLOCK_SELECT = 0
+        self.CLOCK = 0  # cycles per TIMA increment
 
         self.TAC = 0xF8  # FF07
 
-        self.CLOCK = 0
-
     @property
     def TAC(self) -> int:
         return 0xF << 4 | 1 << 3 | self._TAC_ENABLE << 2 | self._TAC_CLOCK_SELECT
 
     @TAC.setter
     def TAC(self, value: int) -> None:
+        self.sync_tima()
         self._TAC_ENABLE = value >> 2
         self._TAC_CLOCK_SELECT = value & 0x3
         self.reset_clock()
 
     @property
     def DIV(self) -> int:
-        return self._DIVIDER >> 8
+        return ((self.SCHEDULER.CYCLE - self._DIVIDER_START) >> 8) & 0xFF
 
     @DIV.setter
     def DIV(self, _: int) -> None:
-        self._DIVIDER = 0x0
+        self._DIVIDER_START = self.SCHEDULER.CYCLE
+
+    @property
+    def TIMA(self) -> int:
+        if self._TAC_ENABLE == 1:
+            return self._TIMA + (self.SCHEDULER.CYCLE - self._TIMA_START) // self.CLOCK
+        return self._TIMA
+
+    @TIMA.setter
+    def TIMA(self, value: int) -> None:
+        self.sync_tima()
+        self._TIMA = value
+        self.schedule_overflow()
 
     def get(self, address: int) -> int:
         match address:
@@ -328,45 +393,30 @@ class Timer:
             case 3:
                 self.CLOCK = 256
 
-    def tick(self, cycles: int) -> None:
-        for _ in range(cycles):
-            self._DIVIDER = (self._DIVIDER + 1) & 0xFFFF
-
-            if self._TAC_ENABLE == 1:
-                self.CLOCK -= 1
-
-                if self.CLOCK <= 0:
-                    self.reset_clock()
-                    calc = self.TIMA + 1
-                    if calc > 0xFF:
-                        self.IO.IF.TIMER = 1
-                        self.TIMA = self.TMA
-                        self.IO.IF.TIMER = 1
-                    else:
-                        self.TIMA = calc
-
-
-class Interrupts:
-    def __init__(self, value: int = 0x00, upper_bits: bool = False) -> None:
-        self.set(value)
-        self.UPPER_F = upper_bits
-
-    def set(self, value: int) -> None:
-        self.JOYPAD = value >> 4 & 1
-        self.SERIAL = value >> 3 & 1
-        self.TIMER = value >> 2 & 1
-        self.LCD = value >> 1 & 1
-        self.VBLANK = value & 1
+        self._TIMA_START = self.SCHEDULER.CYCLE
+        self.schedule_overflow()
+
+    def sync_tima(self) -> None:
+        """Fold the increments since the last sync into _TIMA, keeping the increment phase"""
+        if self._TAC_ENABLE == 1:
+            increments = (self.SCHEDULER.CYCLE - self._TIMA_START) // self.CLOCK
+            self._TIMA += increments
+            self._TIMA_START += increments * self.CLOCK
+
+    def schedule_overflow(self) -> None:
+        if self._TAC_ENABLE == 1:
+            self.SCHEDULER.schedule_at(
+                self.OVERFLOW_EVENT,
+                self._TIMA_START + (0x100 - self._TIMA) * self.CLOCK,
+            )
+        else:
+            self.SCHEDULER.cancel(self.OVERFLOW_EVENT)
 
-    def get(self) -> int:
-        return (
-            (7 << 5 if self.UPPER_F else 0)
-            | self.JOYPAD << 4
-            | self.SERIAL << 3
-            | self.TIMER << 2
-            | self.LCD << 1
-            | self.VBLANK
-        )
+    def overflow(self) -> None:
+        self.IO.IF.request(TIMER)
+        self._TIMA = self.TMA
+        self._TIMA_START = self.SCHEDULER.CYCLE
+        self.schedule_overflow()
 
 
 class Joypad:
@@ -422,31 +472,66 @@ class Joypad:
         self.USE_SELECT = not (value >> 5 & 1)
         self.USE_DPAD = not (value >> 4 & 1)
 
-    def set_keys(self, scancode: int, value: bool) -> None:
-        match scancode:
-            case pygame.KSCAN_DOWN:
+    def set_button(self, button: str, value: bool) -> None:
+        match button:
+            case "DOWN":
                 self.DOWN = value
-            case pygame.KSCAN_UP:
+            case "UP":
                 self.UP = value
-            case pygame.KSCAN_LEFT:
+            case "LEFT":
                 self.LEFT = value
-            case pygame.KSCAN_RIGHT:
+            case "RIGHT":
                 self.RIGHT = value
-            case pygame.KSCAN_RETURN:
+            case "START":
                 self.START = value
-            case pygame.KSCAN_LSHIFT:
+            case "SELECT":
                 self.SELECT = value
-            case pygame.KSCAN_A:
+            case "B":
                 self.B = value
-            case pygame.KSCAN_S:
+            case "A":
                 self.A = value
+            case _:
+                raise Exception("Unknown Button:", button)
+
+    def press(self, button: str) -> None:
+        """Press one of A, B, START, SELECT, UP, DOWN, LEFT, RIGHT"""
+        self.set_button(button, True)
+        self.IO.IF.request(JOYPAD)
+
+    def release(self, button: str) -> None:
+        self.set_button(button, False)
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN and event.type != pygame.KEYUP:
+            return
+
+        match event.scancode:
+            case pygame.KSCAN_DOWN:
+                button = "DOWN"
+            case pygame.KSCAN_UP:
+                button = "UP"
+            case pygame.KSCAN_LEFT:
+                button = "LEFT"
+            case pygame.KSCAN_RIGHT:
+                button = "RIGHT"
+            case pygame.KSCAN_RETURN:
+                button = "START"
+            case pygame.KSCAN_LSHIFT:
+                button = "SELECT"
+            case pygame.KSCAN_A:
+                button = "B"
+            case pygame.KSCAN_S:
+                button = "A"
+            case _:
+                # any key down raises the interrupt, mapped to a button or not
+                if event.type == pygame.KEYDOWN:
+                    self.IO.IF.request(JOYPAD)
+                return
+
         if event.type == pygame.KEYDOWN:
-            self.set_keys(event.scancode, True)
-            self.IO.IF.JOYPAD = 1
-        if event.type == pygame.KEYUP:
-            self.set_keys(event.scancode, False)
+            self.press(button)
+        else:
+            self.release(button)
 
 
 class Serial:
@@ -1,1051 +1,613 @@
+# Generated by `py -m codegen.generate` from codegen.instructions, don't edit by hand
+
+from typing import Callable
 from pyvologb.helpers import formatted_hex
 from pyvologb.mmu import MMU
 from pyvologb.registers import Registers
 
+# Cycles per opcode, branches not taken. Entries 0x100 -> 0x1FF are the CB prefixed opcodes
+CYCLES = [
+    4, 12, 8, 8, 4, 4, 8, 4, 20, 8, 8, 8, 4, 4, 8, 4,
+    4, 12, 8, 8, 4, 4, 8, 4, 12, 8, 8, 8, 4, 4, 8, 4,
+    8, 12, 8, 8, 4, 4, 8, 4, 8, 8, 8, 8, 4, 4, 8, 4,
+    8, 12, 8, 8, 12, 12, 12, 4, 8, 8, 8, 8, 4, 4, 8, 4,
+    4, 4, 4, 4, 4, 4, 8, 4, 4, 4, 4, 4, 4, 4, 8, 4,
+    4, 4, 4, 4, 4, 4, 8, 4, 4, 4, 4, 4, 4, 4, 8, 4,
+    4, 4, 4, 4, 4, 4, 8, 4, 4, 4, 4, 4, 4, 4, 8, 4,
+    8, 8, 8, 8, 8, 8, 4, 8, 4, 4, 4, 4, 4, 4, 8, 4,
+    4, 4, 4, 4, 4, 4, 8, 4, 4, 4, 4, 4, 4, 4, 8, 4,
+    4, 4, 4, 4, 4, 4, 8, 4, 4, 4, 4, 4, 4, 4, 8, 4,
+    4, 4, 4, 4, 4, 4, 8, 4, 4, 4, 4, 4, 4, 4, 8, 4,
+    4, 4, 4, 4, 4, 4, 8, 4, 4, 4, 4, 4, 4, 4, 8, 4,
+    8, 12, 12, 16, 12, 16, 8, 16, 8, 16, 12, 4, 12, 24, 8, 16,
+    8, 12, 12, 0, 12, 16, 8, 16, 8, 16, 12, 0, 12, 0, 8, 16,
+    12, 12, 8, 0, 0, 16, 8, 16, 16, 4, 16, 0, 0, 0, 8, 16,
+    12, 12, 8, 4, 0, 16, 8, 16, 12, 8, 16, 4, 0, 0, 8, 16,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 12, 8, 8, 8, 8, 8, 8, 8, 12, 8,
+    8, 8, 8, 8, 8, 8, 12, 8, 8, 8, 8, 8, 8, 8, 12, 8,
+    8, 8, 8, 8, 8, 8, 12, 8, 8, 8, 8, 8, 8, 8, 12, 8,
+    8, 8, 8, 8, 8, 8, 12, 8, 8, 8, 8, 8, 8, 8, 12, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+    8, 8, 8, 8, 8, 8, 16, 8, 8, 8, 8, 8, 8, 8, 16, 8,
+]  # fmt: skip
+
 
 class Opcodes:
     def __init__(self, mmu: MMU, registers: Registers) -> None:
         self.mmu = mmu
         self.R = registers
 
-    def read_bytes(self, count: int) -> int:
-        data = int.from_bytes(
-            bytes([self.mmu.get_memory(self.R.PC + i) for i in range(count)]),
-            "little",
-        )
-        self.R.PC += count
-        return data
+        self.DISPATCH = self.build_dispatch_table()
+
+    def fetch8(self) -> int:
+        """The byte at PC, moving PC past it"""
+        pc = self.R.PC
+        self.R.PC = pc + 1
+        page = self.mmu.READ_PAGES[pc >> 8]
+        if page is None:
+            return self.mmu.get_memory(pc)
+        return page[pc & 0xFF]
+
+    def fetch16(self) -> int:
+        """The little endian word at PC, moving PC past it"""
+        pc = self.R.PC
+        self.R.PC = pc + 2
+        offset = pc & 0xFF
+        page = self.mmu.READ_PAGES[pc >> 8]
+        if page is None or offset == 0xFF:
+            return self.mmu.get_memory(pc) | self.mmu.get_memory(pc + 1) << 8
+        return page[offset] | page[offset + 1] << 8
+
+    def build_dispatch_table(self) -> list[tuple[Callable[..., int], int]]:
+        """Build the opcode table of (handler, operand width in bytes)
+
+        Entries 0x000 -> 0x0FF are the base opcodes, 0x100 -> 0x1FF are the CB prefixed opcodes
+        """
+        return [
+            (self.NOP_00, 0),
+            (self.LD_01, 2),
+            (self.LD_02, 0),
+            (self.INC_03, 0),
+            (self.INC_04, 0),
+            (self.DEC_05, 0),
+            (self.LD_06, 1),
+            (self.RLCA_07, 0),
+            (self.LD_08, 2),
+            (self.ADD_09, 0),
+            (self.LD_0A, 0),
+            (self.DEC_0B, 0),
+            (self.INC_0C, 0),
+            (self.DEC_0D, 0),
+            (self.LD_0E, 1),
+            (self.RRCA_0F, 0),
+            (self.STOP_10, 0),
+            (self.LD_11, 2),
+            (self.LD_12, 0),
+            (self.INC_13, 0),
+            (self.INC_14, 0),
+            (self.DEC_15, 0),
+            (self.LD_16, 1),
+            (self.RLA_17, 0),
+            (self.JR_18, 1),
+            (self.ADD_19, 0),
+            (self.LD_1A, 0),
+            (self.DEC_1B, 0),
+            (self.INC_1C, 0),
+            (self.DEC_1D, 0),
+            (self.LD_1E, 1),
+            (self.RRA_1F, 0),
+            (self.JR_20, 1),
+            (self.LD_21, 2),
+            (self.LD_22, 0),
+            (self.INC_23, 0),
+            (self.INC_24, 0),
+            (self.DEC_25, 0),
+            (self.LD_26, 1),
+            (self.DAA_27, 0),
+            (self.JR_28, 1),
+            (self.ADD_29, 0),
+            (self.LD_2A, 0),
+            (self.DEC_2B, 0),
+            (self.INC_2C, 0),
+            (self.DEC_2D, 0),
+            (self.LD_2E, 1),
+            (self.CPL_2F, 0),
+            (self.JR_30, 1),
+            (self.LD_31, 2),
+            (self.LD_32, 0),
+            (self.INC_33, 0),
+            (self.INC_34, 0),
+            (self.DEC_35, 0),
+            (self.LD_36, 1),
+            (self.SCF_37, 0),
+            (self.JR_38, 1),
+            (self.ADD_39, 0),
+            (self.LD_3A, 0),
+            (self.DEC_3B, 0),
+            (self.INC_3C, 0),
+            (self.DEC_3D, 0),
+            (self.LD_3E, 1),
+            (self.CCF_3F, 0),
+            (self.LD_40, 0),
+            (self.LD_41, 0),
+            (self.LD_42, 0),
+            (self.LD_43, 0),
+            (self.LD_44, 0),
+            (self.LD_45, 0),
+            (self.LD_46, 0),
+            (self.LD_47, 0),
+            (self.LD_48, 0),
+            (self.LD_49, 0),
+            (self.LD_4A, 0),
+            (self.LD_4B, 0),
+            (self.LD_4C, 0),
+            (self.LD_4D, 0),
+            (self.LD_4E, 0),
+            (self.LD_4F, 0),
+            (self.LD_50, 0),
+            (self.LD_51, 0),
+            (self.LD_52, 0),
+            (self.LD_53, 0),
+            (self.LD_54, 0),
+            (self.LD_55, 0),
+            (self.LD_56, 0),
+            (self.LD_57, 0),
+            (self.LD_58, 0),
+            (self.LD_59, 0),
+            (self.LD_5A, 0),
+            (self.LD_5B, 0),
+            (self.LD_5C, 0),
+            (self.LD_5D, 0),
+            (self.LD_5E, 0),
+            (self.LD_5F, 0),
+            (self.LD_60, 0),
+            (self.LD_61, 0),
+            (self.LD_62, 0),
+            (self.LD_63, 0),
+            (self.LD_64, 0),
+            (self.LD_65, 0),
+            (self.LD_66, 0),
+            (self.LD_67, 0),
+            (self.LD_68, 0),
+            (self.LD_69, 0),
+            (self.LD_6A, 0),
+            (self.LD_6B, 0),
+            (self.LD_6C, 0),
+            (self.LD_6D, 0),
+            (self.LD_6E, 0),
+            (self.LD_6F, 0),
+            (self.LD_70, 0),
+            (self.LD_71, 0),
+            (self.LD_72, 0),
+            (self.LD_73, 0),
+            (self.LD_74, 0),
+            (self.LD_75, 0),
+            (self.HALT_76, 0),
+            (self.LD_77, 0),
+            (self.LD_78, 0),
+            (self.LD_79, 0),
+            (self.LD_7A, 0),
+            (self.LD_7B, 0),
+            (self.LD_7C, 0),
+            (self.LD_7D, 0),
+            (self.LD_7E, 0),
+            (self.LD_7F, 0),
+            (self.ADD_80, 0),
+            (self.ADD_81, 0),
+            (self.ADD_82, 0),
+            (self.ADD_83, 0),
+            (self.ADD_84, 0),
+            (self.ADD_85, 0),
+            (self.ADD_86, 0),
+            (self.ADD_87, 0),
+            (self.ADC_88, 0),
+            (self.ADC_89, 0),
+            (self.ADC_8A, 0),
+            (self.ADC_8B, 0),
+            (self.ADC_8C, 0),
+            (self.ADC_8D, 0),
+            (self.ADC_8E, 0),
+            (self.ADC_8F, 0),
+            (self.SUB_90, 0),
+            (self.SUB_91, 0),
+            (self.SUB_92, 0),
+            (self.SUB_93, 0),
+            (self.SUB_94, 0),
+            (self.SUB_95, 0),
+            (self.SUB_96, 0),
+            (self.SUB_97, 0),
+            (self.SBC_98, 0),
+            (self.SBC_99, 0),
+            (self.SBC_9A, 0),
+            (self.SBC_9B, 0),
+            (self.SBC_9C, 0),
+            (self.SBC_9D, 0),
+            (self.SBC_9E, 0),
+            (self.SBC_9F, 0),
+            (self.AND_A0, 0),
+            (self.AND_A1, 0),
+            (self.AND_A2, 0),
+            (self.AND_A3, 0),
+            (self.AND_A4, 0),
+            (self.AND_A5, 0),
+            (self.AND_A6, 0),
+            (self.AND_A7, 0),
+            (self.XOR_A8, 0),
+            (self.XOR_A9, 0),
+            (self.XOR_AA, 0),
+            (self.XOR_AB, 0),
+            (self.XOR_AC, 0),
+            (self.XOR_AD, 0),
+            (self.XOR_AE, 0),
+            (self.XOR_AF, 0),
+            (self.OR_B0, 0),
+            (self.OR_B1, 0),
+            (self.OR_B2, 0),
+            (self.OR_B3, 0),
+            (self.OR_B4, 0),
+            (self.OR_B5, 0),
+            (self.OR_B6, 0),
+            (self.OR_B7, 0),
+            (self.CP_B8, 0),
+            (self.CP_B9, 0),
+            (self.CP_BA, 0),
+            (self.CP_BB, 0),
+            (self.CP_BC, 0),
+            (self.CP_BD, 0),
+            (self.CP_BE, 0),
+            (self.CP_BF, 0),
+            (self.RET_C0, 0),
+            (self.POP_C1, 0),
+            (self.JP_C2, 2),
+            (self.JP_C3, 2),
+            (self.CALL_C4, 2),
+            (self.PUSH_C5, 0),
+            (self.ADD_C6, 1),
+            (self.RST_C7, 0),
+            (self.RET_C8, 0),
+            (self.RET_C9, 0),
+            (self.JP_CA, 2),
+            (self.PREFIX_CB, 1),
+            (self.CALL_CC, 2),
+            (self.CALL_CD, 2),
+            (self.ADC_CE, 1),
+            (self.RST_CF, 0),
+            (self.RET_D0, 0),
+            (self.POP_D1, 0),
+            (self.JP_D2, 2),
+            (self.ILLEGAL, 0),
+            (self.CALL_D4, 2),
+            (self.PUSH_D5, 0),
+            (self.SUB_D6, 1),
+            (self.RST_D7, 0),
+            (self.RET_D8, 0),
+            (self.RETI_D9, 0),
+            (self.JP_DA, 2),
+            (self.ILLEGAL, 0),
+            (self.CALL_DC, 2),
+            (self.ILLEGAL, 0),
+            (self.SBC_DE, 1),
+            (self.RST_DF, 0),
+            (self.LDH_E0, 1),
+            (self.POP_E1, 0),
+            (self.LDH_E2, 0),
+            (self.ILLEGAL, 0),
+            (self.ILLEGAL, 0),
+            (self.PUSH_E5, 0),
+            (self.AND_E6, 1),
+            (self.RST_E7, 0),
+            (self.ADD_E8, 1),
+            (self.JP_E9, 0),
+            (self.LD_EA, 2),
+            (self.ILLEGAL, 0),
+            (self.ILLEGAL, 0),
+            (self.ILLEGAL, 0),
+            (self.XOR_EE, 1),
+            (self.RST_EF, 0),
+            (self.LDH_F0, 1),
+            (self.POP_F1, 0),
+            (self.LDH_F2, 0),
+            (self.DI_F3, 0),
+            (self.ILLEGAL, 0),
+            (self.PUSH_F5, 0),
+            (self.OR_F6, 1),
+            (self.RST_F7, 0),
+            (self.LD_F8, 1),
+            (self.LD_F9, 0),
+            (self.LD_FA, 2),
+            (self.EI_FB, 0),
+            (self.ILLEGAL, 0),
+            (self.ILLEGAL, 0),
+            (self.CP_FE, 1),
+            (self.RST_FF, 0),
+            (self.RLC_CB00, 0),
+            (self.RLC_CB01, 0),
+            (self.RLC_CB02, 0),
+            (self.RLC_CB03, 0),
+            (self.RLC_CB04, 0),
+            (self.RLC_CB05, 0),
+            (self.RLC_CB06, 0),
+            (self.RLC_CB07, 0),
+            (self.RRC_CB08, 0),
+            (self.RRC_CB09, 0),
+            (self.RRC_CB0A, 0),
+            (self.RRC_CB0B, 0),
+            (self.RRC_CB0C, 0),
+            (self.RRC_CB0D, 0),
+            (self.RRC_CB0E, 0),
+            (self.RRC_CB0F, 0),
+            (self.RL_CB10, 0),
+            (self.RL_CB11, 0),
+            (self.RL_CB12, 0),
+            (self.RL_CB13, 0),
+            (self.RL_CB14, 0),
+            (self.RL_CB15, 0),
+            (self.RL_CB16, 0),
+            (self.RL_CB17, 0),
+            (self.RR_CB18, 0),
+            (self.RR_CB19, 0),
+            (self.RR_CB1A, 0),
+            (self.RR_CB1B, 0),
+            (self.RR_CB1C, 0),
+            (self.RR_CB1D, 0),
+            (self.RR_CB1E, 0),
+            (self.RR_CB1F, 0),
+            (self.SLA_CB20, 0),
+            (self.SLA_CB21, 0),
+            (self.SLA_CB22, 0),
+            (self.SLA_CB23, 0),
+            (self.SLA_CB24, 0),
+            (self.SLA_CB25, 0),
+            (self.SLA_CB26, 0),
+            (self.SLA_CB27, 0),
+            (self.SRA_CB28, 0),
+            (self.SRA_CB29, 0),
+            (self.SRA_CB2A, 0),
+            (self.SRA_CB2B, 0),
+            (self.SRA_CB2C, 0),
+            (self.SRA_CB2D, 0),
+            (self.SRA_CB2E, 0),
+            (self.SRA_CB2F, 0),
+            (self.SWAP_CB30, 0),
+            (self.SWAP_CB31, 0),
+            (self.SWAP_CB32, 0),
+            (self.SWAP_CB33, 0),
+            (self.SWAP_CB34, 0),
+            (self.SWAP_CB35, 0),
+            (self.SWAP_CB36, 0),
+            (self.SWAP_CB37, 0),
+            (self.SRL_CB38, 0),
+            (self.SRL_CB39, 0),
+            (self.SRL_CB3A, 0),
+            (self.SRL_CB3B, 0),
+            (self.SRL_CB3C, 0),
+            (self.SRL_CB3D, 0),
+            (self.SRL_CB3E, 0),
+            (self.SRL_CB3F, 0),
+            (self.BIT_CB40, 0),
+            (self.BIT_CB41, 0),
+            (self.BIT_CB42, 0),
+            (self.BIT_CB43, 0),
+            (self.BIT_CB44, 0),
+            (self.BIT_CB45, 0),
+            (self.BIT_CB46, 0),
+            (self.BIT_CB47, 0),
+            (self.BIT_CB48, 0),
+            (self.BIT_CB49, 0),
+            (self.BIT_CB4A, 0),
+            (self.BIT_CB4B, 0),
+            (self.BIT_CB4C, 0),
+            (self.BIT_CB4D, 0),
+            (self.BIT_CB4E, 0),
+            (self.BIT_CB4F, 0),
+            (self.BIT_CB50, 0),
+            (self.BIT_CB51, 0),
+            (self.BIT_CB52, 0),
+            (self.BIT_CB53, 0),
+            (self.BIT_CB54, 0),
+            (self.BIT_CB55, 0),
+            (self.BIT_CB56, 0),
+            (self.BIT_CB57, 0),
+            (self.BIT_CB58, 0),
+            (self.BIT_CB59, 0),
+            (self.BIT_CB5A, 0),
+            (self.BIT_CB5B, 0),
+            (self.BIT_CB5C, 0),
+            (self.BIT_CB5D, 0),
+            (self.BIT_CB5E, 0),
+            (self.BIT_CB5F, 0),
+            (self.BIT_CB60, 0),
+            (self.BIT_CB61, 0),
+            (self.BIT_CB62, 0),
+            (self.BIT_CB63, 0),
+            (self.BIT_CB64, 0),
+            (self.BIT_CB65, 0),
+            (self.BIT_CB66, 0),
+            (self.BIT_CB67, 0),
+            (self.BIT_CB68, 0),
+            (self.BIT_CB69, 0),
+            (self.BIT_CB6A, 0),
+            (self.BIT_CB6B, 0),
+            (self.BIT_CB6C, 0),
+            (self.BIT_CB6D, 0),
+            (self.BIT_CB6E, 0),
+            (self.BIT_CB6F, 0),
+            (self.BIT_CB70, 0),
+            (self.BIT_CB71, 0),
+            (self.BIT_CB72, 0),
+            (self.BIT_CB73, 0),
+            (self.BIT_CB74, 0),
+            (self.BIT_CB75, 0),
+            (self.BIT_CB76, 0),
+            (self.BIT_CB77, 0),
+            (self.BIT_CB78, 0),
+            (self.BIT_CB79, 0),
+            (self.BIT_CB7A, 0),
+            (self.BIT_CB7B, 0),
+            (self.BIT_CB7C, 0),
+            (self.BIT_CB7D, 0),
+            (self.BIT_CB7E, 0),
+            (self.BIT_CB7F, 0),
+            (self.RES_CB80, 0),
+            (self.RES_CB81, 0),
+            (self.RES_CB82, 0),
+            (self.RES_CB83, 0),
+            (self.RES_CB84, 0),
+            (self.RES_CB85, 0),
+            (self.RES_CB86, 0),
+            (self.RES_CB87, 0),
+            (self.RES_CB88, 0),
+            (self.RES_CB89, 0),
+            (self.RES_CB8A, 0),
+            (self.RES_CB8B, 0),
+            (self.RES_CB8C, 0),
+            (self.RES_CB8D, 0),
+            (self.RES_CB8E, 0),
+            (self.RES_CB8F, 0),
+            (self.RES_CB90, 0),
+            (self.RES_CB91, 0),
+            (self.RES_CB92, 0),
+            (self.RES_CB93, 0),
+            (self.RES_CB94, 0),
+            (self.RES_CB95, 0),
+            (self.RES_CB96, 0),
+            (self.RES_CB97, 0),
+            (self.RES_CB98, 0),
+            (self.RES_CB99, 0),
+            (self.RES_CB9A, 0),
+            (self.RES_CB9B, 0),
+            (self.RES_CB9C, 0),
+            (self.RES_CB9D, 0),
+            (self.RES_CB9E, 0),
+            (self.RES_CB9F, 0),
+            (self.RES_CBA0, 0),
+            (self.RES_CBA1, 0),
+            (self.RES_CBA2, 0),
+            (self.RES_CBA3, 0),
+            (self.RES_CBA4, 0),
+            (self.RES_CBA5, 0),
+            (self.RES_CBA6, 0),
+            (self.RES_CBA7, 0),
+            (self.RES_CBA8, 0),
+            (self.RES_CBA9, 0),
+            (self.RES_CBAA, 0),
+            (self.RES_CBAB, 0),
+            (self.RES_CBAC, 0),
+            (self.RES_CBAD, 0),
+            (self.RES_CBAE, 0),
+            (self.RES_CBAF, 0),
+            (self.RES_CBB0, 0),
+            (self.RES_CBB1, 0),
+            (self.RES_CBB2, 0),
+            (self.RES_CBB3, 0),
+            (self.RES_CBB4, 0),
+            (self.RES_CBB5, 0),
+            (self.RES_CBB6, 0),
+            (self.RES_CBB7, 0),
+            (self.RES_CBB8, 0),
+            (self.RES_CBB9, 0),
+            (self.RES_CBBA, 0),
+            (self.RES_CBBB, 0),
+            (self.RES_CBBC, 0),
+            (self.RES_CBBD, 0),
+            (self.RES_CBBE, 0),
+            (self.RES_CBBF, 0),
+            (self.SET_CBC0, 0),
+            (self.SET_CBC1, 0),
+            (self.SET_CBC2, 0),
+            (self.SET_CBC3, 0),
+            (self.SET_CBC4, 0),
+            (self.SET_CBC5, 0),
+            (self.SET_CBC6, 0),
+            (self.SET_CBC7, 0),
+            (self.SET_CBC8, 0),
+            (self.SET_CBC9, 0),
+            (self.SET_CBCA, 0),
+            (self.SET_CBCB, 0),
+            (self.SET_CBCC, 0),
+            (self.SET_CBCD, 0),
+            (self.SET_CBCE, 0),
+            (self.SET_CBCF, 0),
+            (self.SET_CBD0, 0),
+            (self.SET_CBD1, 0),
+            (self.SET_CBD2, 0),
+            (self.SET_CBD3, 0),
+            (self.SET_CBD4, 0),
+            (self.SET_CBD5, 0),
+            (self.SET_CBD6, 0),
+            (self.SET_CBD7, 0),
+            (self.SET_CBD8, 0),
+            (self.SET_CBD9, 0),
+            (self.SET_CBDA, 0),
+            (self.SET_CBDB, 0),
+            (self.SET_CBDC, 0),
+            (self.SET_CBDD, 0),
+            (self.SET_CBDE, 0),
+            (self.SET_CBDF, 0),
+            (self.SET_CBE0, 0),
+            (self.SET_CBE1, 0),
+            (self.SET_CBE2, 0),
+            (self.SET_CBE3, 0),
+            (self.SET_CBE4, 0),
+            (self.SET_CBE5, 0),
+            (self.SET_CBE6, 0),
+            (self.SET_CBE7, 0),
+            (self.SET_CBE8, 0),
+            (self.SET_CBE9, 0),
+            (self.SET_CBEA, 0),
+            (self.SET_CBEB, 0),
+            (self.SET_CBEC, 0),
+            (self.SET_CBED, 0),
+            (self.SET_CBEE, 0),
+            (self.SET_CBEF, 0),
+            (self.SET_CBF0, 0),
+            (self.SET_CBF1, 0),
+            (self.SET_CBF2, 0),
+            (self.SET_CBF3, 0),
+            (self.SET_CBF4, 0),
+            (self.SET_CBF5, 0),
+            (self.SET_CBF6, 0),
+            (self.SET_CBF7, 0),
+            (self.SET_CBF8, 0),
+            (self.SET_CBF9, 0),
+            (self.SET_CBFA, 0),
+            (self.SET_CBFB, 0),
+            (self.SET_CBFC, 0),
+            (self.SET_CBFD, 0),
+            (self.SET_CBFE, 0),
+            (self.SET_CBFF, 0),
+        ]
 
     def execute(self, opcode: int) -> int:
+        handler, width = self.DISPATCH[opcode]
         self.R.PC += 1
 
-        match opcode:
-            case 0x00:
-                return self.NOP_00()
-            case 0x01:
-                return self.LD_01(self.read_bytes(2))
-            case 0x02:
-                return self.LD_02()
-            case 0x03:
-                return self.INC_03()
-            case 0x04:
-                return self.INC_04()
-            case 0x05:
-                return self.DEC_05()
-            case 0x06:
-                return self.LD_06(self.read_bytes(1))
-            case 0x07:
-                return self.RLCA_07()
-            case 0x08:
-                return self.LD_08(self.read_bytes(2))
-            case 0x09:
-                return self.ADD_09()
-            case 0x0A:
-                return self.LD_0A()
-            case 0x0B:
-                return self.DEC_0B()
-            case 0x0C:
-                return self.INC_0C()
-            case 0x0D:
-                return self.DEC_0D()
-            case 0x0E:
-                return self.LD_0E(self.read_bytes(1))
-            case 0x0F:
-                return self.RRCA_0F()
-            case 0x10:
-                return self.STOP_10()
-            case 0x11:
-                return self.LD_11(self.read_bytes(2))
-            case 0x12:
-                return self.LD_12()
-            case 0x13:
-                return self.INC_13()
-            case 0x14:
-                return self.INC_14()
-            case 0x15:
-                return self.DEC_15()
-            case 0x16:
-                return self.LD_16(self.read_bytes(1))
-            case 0x17:
-                return self.RLA_17()
-            case 0x18:
-                return self.JR_18(self.read_bytes(1))
-            case 0x19:
-                return self.ADD_19()
-            case 0x1A:
-                return self.LD_1A()
-            case 0x1B:
-                return self.DEC_1B()
-            case 0x1C:
-                return self.INC_1C()
-            case 0x1D:
-                return self.DEC_1D()
-            case 0x1E:
-                return self.LD_1E(self.read_bytes(1))
-            case 0x1F:
-                return self.RRA_1F()
-            case 0x20:
-                return self.JR_20(self.read_bytes(1))
-            case 0x21:
-                return self.LD_21(self.read_bytes(2))
-            case 0x22:
-                return self.LD_22()
-            case 0x23:
-                return self.INC_23()
-            case 0x24:
-                return self.INC_24()
-            case 0x25:
-                return self.DEC_25()
-            case 0x26:
-                return self.LD_26(self.read_bytes(1))
-            case 0x27:
-                return self.DAA_27()
-            case 0x28:
-                return self.JR_28(self.read_bytes(1))
-            case 0x29:
-                return self.ADD_29()
-            case 0x2A:
-                return self.LD_2A()
-            case 0x2B:
-                return self.DEC_2B()
-            case 0x2C:
-                return self.INC_2C()
-            case 0x2D:
-                return self.DEC_2D()
-            case 0x2E:
-                return self.LD_2E(self.read_bytes(1))
-            case 0x2F:
-                return self.CPL_2F()
-            case 0x30:
-                return self.JR_30(self.read_bytes(1))
-            case 0x31:
-                return self.LD_31(self.read_bytes(2))
-            case 0x32:
-                return self.LD_32()
-            case 0x33:
-                return self.INC_33()
-            case 0x34:
-                return self.INC_34()
-            case 0x35:
-                return self.DEC_35()
-            case 0x36:
-                return self.LD_36(self.read_bytes(1))
-            case 0x37:
-                return self.SCF_37()
-            case 0x38:
-                return self.JR_38(self.read_bytes(1))
-            case 0x39:
-                return self.ADD_39()
-            case 0x3A:
-                return self.LD_3A()
-            case 0x3B:
-                return self.DEC_3B()
-            case 0x3C:
-                return self.INC_3C()
-            case 0x3D:
-                return self.DEC_3D()
-            case 0x3E:
-                return self.LD_3E(self.read_bytes(1))
-            case 0x3F:
-                return self.CCF_3F()
-            case 0x40:
-                return self.LD_40()
-            case 0x41:
-                return self.LD_41()
-            case 0x42:
-                return self.LD_42()
-            case 0x43:
-                return self.LD_43()
-            case 0x44:
-                return self.LD_44()
-            case 0x45:
-                return self.LD_45()
-            case 0x46:
-                return self.LD_46()
-            case 0x47:
-                return self.LD_47()
-            case 0x48:
-                return self.LD_48()
-            case 0x49:
-                return self.LD_49()
-            case 0x4A:
-                return self.LD_4A()
-            case 0x4B:
-                return self.LD_4B()
-            case 0x4C:
-                return self.LD_4C()
-            case 0x4D:
-                return self.LD_4D()
-            case 0x4E:
-                return self.LD_4E()
-            case 0x4F:
-                return self.LD_4F()
-            case 0x50:
-                return self.LD_50()
-            case 0x51:
-                return self.LD_51()
-            case 0x52:
-                return self.LD_52()
-            case 0x53:
-                return self.LD_53()
-            case 0x54:
-                return self.LD_54()
-            case 0x55:
-                return self.LD_55()
-            case 0x56:
-                return self.LD_56()
-            case 0x57:
-                return self.LD_57()
-            case 0x58:
-                return self.LD_58()
-            case 0x59:
-                return self.LD_59()
-            case 0x5A:
-                return self.LD_5A()
-            case 0x5B:
-                return self.LD_5B()
-            case 0x5C:
-                return self.LD_5C()
-            case 0x5D:
-                return self.LD_5D()
-            case 0x5E:
-                return self.LD_5E()
-            case 0x5F:
-                return self.LD_5F()
-            case 0x60:
-                return self.LD_60()
-            case 0x61:
-                return self.LD_61()
-            case 0x62:
-                return self.LD_62()
-            case 0x63:
-                return self.LD_63()
-            case 0x64:
-                return self.LD_64()
-            case 0x65:
-                return self.LD_65()
-            case 0x66:
-                return self.LD_66()
-            case 0x67:
-                return self.LD_67()
-            case 0x68:
-                return self.LD_68()
-            case 0x69:
-                return self.LD_69()
-            case 0x6A:
-                return self.LD_6A()
-            case 0x6B:
-                return self.LD_6B()
-            case 0x6C:
-                return self.LD_6C()
-            case 0x6D:
-                return self.LD_6D()
-            case 0x6E:
-                return self.LD_6E()
-            case 0x6F:
-                return self.LD_6F()
-            case 0x70:
-                return self.LD_70()
-            case 0x71:
-                return self.LD_71()
-            case 0x72:
-                return self.LD_72()
-            case 0x73:
-                return self.LD_73()
-            case 0x74:
-                return self.LD_74()
-            case 0x75:
-                return self.LD_75()
-            case 0x76:
-                return self.HALT_76()
-            case 0x77:
-                return self.LD_77()
-            case 0x78:
-                return self.LD_78()
-            case 0x79:
-                return self.LD_79()
-            case 0x7A:
-                return self.LD_7A()
-            case 0x7B:
-                return self.LD_7B()
-            case 0x7C:
-                return self.LD_7C()
-            case 0x7D:
-                return self.LD_7D()
-            case 0x7E:
-                return self.LD_7E()
-            case 0x7F:
-                return self.LD_7F()
-            case 0x80:
-                return self.ADD_80()
-            case 0x81:
-                return self.ADD_81()
-            case 0x82:
-                return self.ADD_82()
-            case 0x83:
-                return self.ADD_83()
-            case 0x84:
-                return self.ADD_84()
-            case 0x85:
-                return self.ADD_85()
-            case 0x86:
-                return self.ADD_86()
-            case 0x87:
-                return self.ADD_87()
-            case 0x88:
-                return self.ADC_88()
-            case 0x89:
-                return self.ADC_89()
-            case 0x8A:
-                return self.ADC_8A()
-            case 0x8B:
-                return self.ADC_8B()
-            case 0x8C:
-                return self.ADC_8C()
-            case 0x8D:
-                return self.ADC_8D()
-            case 0x8E:
-                return self.ADC_8E()
-            case 0x8F:
-                return self.ADC_8F()
-            case 0x90:
-                return self.SUB_90()
-            case 0x91:
-                return self.SUB_91()
-            case 0x92:
-                return self.SUB_92()
-            case 0x93:
-                return self.SUB_93()
-            case 0x94:
-                return self.SUB_94()
-            case 0x95:
-                return self.SUB_95()
-            case 0x96:
-                return self.SUB_96()
-            case 0x97:
-                return self.SUB_97()
-            case 0x98:
-                return self.SBC_98()
-            case 0x99:
-                return self.SBC_99()
-            case 0x9A:
-                return self.SBC_9A()
-            case 0x9B:
-                return self.SBC_9B()
-            case 0x9C:
-                return self.SBC_9C()
-            case 0x9D:
-                return self.SBC_9D()
-            case 0x9E:
-                return self.SBC_9E()
-            case 0x9F:
-                return self.SBC_9F()
-            case 0xA0:
-                return self.AND_A0()
-            case 0xA1:
-                return self.AND_A1()
-            case 0xA2:
-                return self.AND_A2()
-            case 0xA3:
-                return self.AND_A3()
-            case 0xA4:
-                return self.AND_A4()
-            case 0xA5:
-                return self.AND_A5()
-            case 0xA6:
-                return self.AND_A6()
-            case 0xA7:
-                return self.AND_A7()
-            case 0xA8:
-                return self.XOR_A8()
-            case 0xA9:
-                return self.XOR_A9()
-            case 0xAA:
-                return self.XOR_AA()
-            case 0xAB:
-                return self.XOR_AB()
-            case 0xAC:
-                return self.XOR_AC()
-            case 0xAD:
-                return self.XOR_AD()
-            case 0xAE:
-                return self.XOR_AE()
-            case 0xAF:
-                return self.XOR_AF()
-            case 0xB0:
-                return self.OR_B0()
-            case 0xB1:
-                return self.OR_B1()
-            case 0xB2:
-                return self.OR_B2()
-            case 0xB3:
-                return self.OR_B3()
-            case 0xB4:
-                return self.OR_B4()
-            case 0xB5:
-                return self.OR_B5()
-            case 0xB6:
-                return self.OR_B6()
-            case 0xB7:
-                return self.OR_B7()
-            case 0xB8:
-                return self.CP_B8()
-            case 0xB9:
-                return self.CP_B9()
-            case 0xBA:
-                return self.CP_BA()
-            case 0xBB:
-                return self.CP_BB()
-            case 0xBC:
-                return self.CP_BC()
-            case 0xBD:
-                return self.CP_BD()
-            case 0xBE:
-                return self.CP_BE()
-            case 0xBF:
-                return self.CP_BF()
-            case 0xC0:
-                return self.RET_C0()
-            case 0xC1:
-                return self.POP_C1()
-            case 0xC2:
-                return self.JP_C2(self.read_bytes(2))
-            case 0xC3:
-                return self.JP_C3(self.read_bytes(2))
-            case 0xC4:
-                return self.CALL_C4(self.read_bytes(2))
-            case 0xC5:
-                return self.PUSH_C5()
-            case 0xC6:
-                return self.ADD_C6(self.read_bytes(1))
-            case 0xC7:
-                return self.RST_C7()
-            case 0xC8:
-                return self.RET_C8()
-            case 0xC9:
-                return self.RET_C9()
-            case 0xCA:
-                return self.JP_CA(self.read_bytes(2))
-            case 0xCB:
-                raise Exception(f"Invalid Execution Order: {formatted_hex(opcode)}")
-            case 0xCC:
-                return self.CALL_CC(self.read_bytes(2))
-            case 0xCD:
-                return self.CALL_CD(self.read_bytes(2))
-            case 0xCE:
-                return self.ADC_CE(self.read_bytes(1))
-            case 0xCF:
-                return self.RST_CF()
-            case 0xD0:
-                return self.RET_D0()
-            case 0xD1:
-                return self.POP_D1()
-            case 0xD2:
-                return self.JP_D2(self.read_bytes(2))
-            case 0xD3:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xD4:
-                return self.CALL_D4(self.read_bytes(2))
-            case 0xD5:
-                return self.PUSH_D5()
-            case 0xD6:
-                return self.SUB_D6(self.read_bytes(1))
-            case 0xD7:
-                return self.RST_D7()
-            case 0xD8:
-                return self.RET_D8()
-            case 0xD9:
-                return self.RETI_D9()
-            case 0xDA:
-                return self.JP_DA(self.read_bytes(2))
-            case 0xDB:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xDC:
-                return self.CALL_DC(self.read_bytes(2))
-            case 0xDD:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xDE:
-                return self.SBC_DE(self.read_bytes(1))
-            case 0xDF:
-                return self.RST_DF()
-            case 0xE0:
-                return self.LDH_E0(self.read_bytes(1))
-            case 0xE1:
-                return self.POP_E1()
-            case 0xE2:
-                return self.LDH_E2()
-            case 0xE3:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xE4:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xE5:
-                return self.PUSH_E5()
-            case 0xE6:
-                return self.AND_E6(self.read_bytes(1))
-            case 0xE7:
-                return self.RST_E7()
-            case 0xE8:
-                return self.ADD_E8(self.read_bytes(1))
-            case 0xE9:
-                return self.JP_E9()
-            case 0xEA:
-                return self.LD_EA(self.read_bytes(2))
-            case 0xEB:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xEC:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xED:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xEE:
-                return self.XOR_EE(self.read_bytes(1))
-            case 0xEF:
-                return self.RST_EF()
-            case 0xF0:
-                return self.LDH_F0(self.read_bytes(1))
-            case 0xF1:
-                return self.POP_F1()
-            case 0xF2:
-                return self.LDH_F2()
-            case 0xF3:
-                return self.DI_F3()
-            case 0xF4:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xF5:
-                return self.PUSH_F5()
-            case 0xF6:
-                return self.OR_F6(self.read_bytes(1))
-            case 0xF7:
-                return self.RST_F7()
-            case 0xF8:
-                return self.LD_F8(self.read_bytes(1))
-            case 0xF9:
-                return self.LD_F9()
-            case 0xFA:
-                return self.LD_FA(self.read_bytes(2))
-            case 0xFB:
-                return self.EI_FB()
-            case 0xFC:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xFD:
-                raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
-            case 0xFE:
-                return self.CP_FE(self.read_bytes(1))
-            case 0xFF:
-                return self.RST_FF()
-            case 0x100:
-                return self.RLC_CB00()
-            case 0x101:
-                return self.RLC_CB01()
-            case 0x102:
-                return self.RLC_CB02()
-            case 0x103:
-                return self.RLC_CB03()
-            case 0x104:
-                return self.RLC_CB04()
-            case 0x105:
-                return self.RLC_CB05()
-            case 0x106:
-                return self.RLC_CB06()
-            case 0x107:
-                return self.RLC_CB07()
-            case 0x108:
-                return self.RRC_CB08()
-            case 0x109:
-                return self.RRC_CB09()
-            case 0x10A:
-                return self.RRC_CB0A()
-            case 0x10B:
-                return self.RRC_CB0B()
-            case 0x10C:
-                return self.RRC_CB0C()
-            case 0x10D:
-                return self.RRC_CB0D()
-            case 0x10E:
-                return self.RRC_CB0E()
-            case 0x10F:
-                return self.RRC_CB0F()
-            case 0x110:
-                return self.RL_CB10()
-            case 0x111:
-                return self.RL_CB11()
-            case 0x112:
-                return self.RL_CB12()
-            case 0x113:
-                return self.RL_CB13()
-            case 0x114:
-                return self.RL_CB14()
-            case 0x115:
-                return self.RL_CB15()
-            case 0x116:
-                return self.RL_CB16()
-            case 0x117:
-                return self.RL_CB17()
-            case 0x118:
-                return self.RR_CB18()
-            case 0x119:
-                return self.RR_CB19()
-            case 0x11A:
-                return self.RR_CB1A()
-            case 0x11B:
-                return self.RR_CB1B()
-            case 0x11C:
-                return self.RR_CB1C()
-            case 0x11D:
-                return self.RR_CB1D()
-            case 0x11E:
-                return self.RR_CB1E()
-            case 0x11F:
-                return self.RR_CB1F()
-            case 0x120:
-                return self.SLA_CB20()
-            case 0x121:
-                return self.SLA_CB21()
-            case 0x122:
-                return self.SLA_CB22()
-            case 0x123:
-                return self.SLA_CB23()
-            case 0x124:
-                return self.SLA_CB24()
-            case 0x125:
-                return self.SLA_CB25()
-            case 0x126:
-                return self.SLA_CB26()
-            case 0x127:
-                return self.SLA_CB27()
-            case 0x128:
-                return self.SRA_CB28()
-            case 0x129:
-                return self.SRA_CB29()
-            case 0x12A:
-                return self.SRA_CB2A()
-            case 0x12B:
-                return self.SRA_CB2B()
-            case 0x12C:
-                return self.SRA_CB2C()
-            case 0x12D:
-                return self.SRA_CB2D()
-            case 0x12E:
-                return self.SRA_CB2E()
-            case 0x12F:
-                return self.SRA_CB2F()
-            case 0x130:
-                return self.SWAP_CB30()
-            case 0x131:
-                return self.SWAP_CB31()
-            case 0x132:
-                return self.SWAP_CB32()
-            case 0x133:
-                return self.SWAP_CB33()
-            case 0x134:
-                return self.SWAP_CB34()
-            case 0x135:
-                return self.SWAP_CB35()
-            case 0x136:
-                return self.SWAP_CB36()
-            case 0x137:
-                return self.SWAP_CB37()
-            case 0x138:
-                return self.SRL_CB38()
-            case 0x139:
-                return self.SRL_CB39()
-            case 0x13A:
-                return self.SRL_CB3A()
-            case 0x13B:
-                return self.SRL_CB3B()
-            case 0x13C:
-                return self.SRL_CB3C()
-            case 0x13D:
-                return self.SRL_CB3D()
-            case 0x13E:
-                return self.SRL_CB3E()
-            case 0x13F:
-                return self.SRL_CB3F()
-            case 0x140:
-                return self.BIT_CB40()
-            case 0x141:
-                return self.BIT_CB41()
-            case 0x142:
-                return self.BIT_CB42()
-            case 0x143:
-                return self.BIT_CB43()
-            case 0x144:
-                return self.BIT_CB44()
-            case 0x145:
-                return self.BIT_CB45()
-            case 0x146:
-                return self.BIT_CB46()
-            case 0x147:
-                return self.BIT_CB47()
-            case 0x148:
-                return self.BIT_CB48()
-            case 0x149:
-                return self.BIT_CB49()
-            case 0x14A:
-                return self.BIT_CB4A()
-            case 0x14B:
-                return self.BIT_CB4B()
-            case 0x14C:
-                return self.BIT_CB4C()
-            case 0x14D:
-                return self.BIT_CB4D()
-            case 0x14E:
-                return self.BIT_CB4E()
-            case 0x14F:
-                return self.BIT_CB4F()
-            case 0x150:
-                return self.BIT_CB50()
-            case 0x151:
-                return self.BIT_CB51()
-            case 0x152:
-                return self.BIT_CB52()
-            case 0x153:
-                return self.BIT_CB53()
-            case 0x154:
-                return self.BIT_CB54()
-            case 0x155:
-                return self.BIT_CB55()
-            case 0x156:
-                return self.BIT_CB56()
-            case 0x157:
-                return self.BIT_CB57()
-            case 0x158:
-                return self.BIT_CB58()
-            case 0x159:
-                return self.BIT_CB59()
-            case 0x15A:
-                return self.BIT_CB5A()
-            case 0x15B:
-                return self.BIT_CB5B()
-            case 0x15C:
-                return self.BIT_CB5C()
-            case 0x15D:
-                return self.BIT_CB5D()
-            case 0x15E:
-                return self.BIT_CB5E()
-            case 0x15F:
-                return self.BIT_CB5F()
-            case 0x160:
-                return self.BIT_CB60()
-            case 0x161:
-                return self.BIT_CB61()
-            case 0x162:
-                return self.BIT_CB62()
-            case 0x163:
-                return self.BIT_CB63()
-            case 0x164:
-                return self.BIT_CB64()
-            case 0x165:
-                return self.BIT_CB65()
-            case 0x166:
-                return self.BIT_CB66()
-            case 0x167:
-                return self.BIT_CB67()
-            case 0x168:
-                return self.BIT_CB68()
-            case 0x169:
-                return self.BIT_CB69()
-            case 0x16A:
-                return self.BIT_CB6A()
-            case 0x16B:
-                return self.BIT_CB6B()
-            case 0x16C:
-                return self.BIT_CB6C()
-            case 0x16D:
-                return self.BIT_CB6D()
-            case 0x16E:
-                return self.BIT_CB6E()
-            case 0x16F:
-                return self.BIT_CB6F()
-            case 0x170:
-                return self.BIT_CB70()
-            case 0x171:
-                return self.BIT_CB71()
-            case 0x172:
-                return self.BIT_CB72()
-            case 0x173:
-                return self.BIT_CB73()
-            case 0x174:
-                return self.BIT_CB74()
-            case 0x175:
-                return self.BIT_CB75()
-            case 0x176:
-                return self.BIT_CB76()
-            case 0x177:
-                return self.BIT_CB77()
-            case 0x178:
-                return self.BIT_CB78()
-            case 0x179:
-                return self.BIT_CB79()
-            case 0x17A:
-                return self.BIT_CB7A()
-            case 0x17B:
-                return self.BIT_CB7B()
-            case 0x17C:
-                return self.BIT_CB7C()
-            case 0x17D:
-                return self.BIT_CB7D()
-            case 0x17E:
-                return self.BIT_CB7E()
-            case 0x17F:
-                return self.BIT_CB7F()
-            case 0x180:
-                return self.RES_CB80()
-            case 0x181:
-                return self.RES_CB81()
-            case 0x182:
-                return self.RES_CB82()
-            case 0x183:
-                return self.RES_CB83()
-            case 0x184:
-                return self.RES_CB84()
-            case 0x185:
-                return self.RES_CB85()
-            case 0x186:
-                return self.RES_CB86()
-            case 0x187:
-                return self.RES_CB87()
-            case 0x188:
-                return self.RES_CB88()
-            case 0x189:
-                return self.RES_CB89()
-            case 0x18A:
-                return self.RES_CB8A()
-            case 0x18B:
-                return self.RES_CB8B()
-            case 0x18C:
-                return self.RES_CB8C()
-            case 0x18D:
-                return self.RES_CB8D()
-            case 0x18E:
-                return self.RES_CB8E()
-            case 0x18F:
-                return self.RES_CB8F()
-            case 0x190:
-                return self.RES_CB90()
-            case 0x191:
-                return self.RES_CB91()
-            case 0x192:
-                return self.RES_CB92()
-            case 0x193:
-                return self.RES_CB93()
-            case 0x194:
-                return self.RES_CB94()
-            case 0x195:
-                return self.RES_CB95()
-            case 0x196:
-                return self.RES_CB96()
-            case 0x197:
-                return self.RES_CB97()
-            case 0x198:
-                return self.RES_CB98()
-            case 0x199:
-                return self.RES_CB99()
-            case 0x19A:
-                return self.RES_CB9A()
-            case 0x19B:
-                return self.RES_CB9B()
-            case 0x19C:
-                return self.RES_CB9C()
-            case 0x19D:
-                return self.RES_CB9D()
-            case 0x19E:
-                return self.RES_CB9E()
-            case 0x19F:
-                return self.RES_CB9F()
-            case 0x1A0:
-                return self.RES_CBA0()
-            case 0x1A1:
-                return self.RES_CBA1()
-            case 0x1A2:
-                return self.RES_CBA2()
-            case 0x1A3:
-                return self.RES_CBA3()
-            case 0x1A4:
-                return self.RES_CBA4()
-            case 0x1A5:
-                return self.RES_CBA5()
-            case 0x1A6:
-                return self.RES_CBA6()
-            case 0x1A7:
-                return self.RES_CBA7()
-            case 0x1A8:
-                return self.RES_CBA8()
-            case 0x1A9:
-                return self.RES_CBA9()
-            case 0x1AA:
-                return self.RES_CBAA()
-            case 0x1AB:
-                return self.RES_CBAB()
-            case 0x1AC:
-                return self.RES_CBAC()
-            case 0x1AD:
-                return self.RES_CBAD()
-            case 0x1AE:
-                return self.RES_CBAE()
-            case 0x1AF:
-                return self.RES_CBAF()
-            case 0x1B0:
-                return self.RES_CBB0()
-            case 0x1B1:
-                return self.RES_CBB1()
-            case 0x1B2:
-                return self.RES_CBB2()
-            case 0x1B3:
-                return self.RES_CBB3()
-            case 0x1B4:
-                return self.RES_CBB4()
-            case 0x1B5:
-                return self.RES_CBB5()
-            case 0x1B6:
-                return self.RES_CBB6()
-            case 0x1B7:
-                return self.RES_CBB7()
-            case 0x1B8:
-                return self.RES_CBB8()
-            case 0x1B9:
-                return self.RES_CBB9()
-            case 0x1BA:
-                return self.RES_CBBA()
-            case 0x1BB:
-                return self.RES_CBBB()
-            case 0x1BC:
-                return self.RES_CBBC()
-            case 0x1BD:
-                return self.RES_CBBD()
-            case 0x1BE:
-                return self.RES_CBBE()
-            case 0x1BF:
-                return self.RES_CBBF()
-            case 0x1C0:
-                return self.SET_CBC0()
-            case 0x1C1:
-                return self.SET_CBC1()
-            case 0x1C2:
-                return self.SET_CBC2()
-            case 0x1C3:
-                return self.SET_CBC3()
-            case 0x1C4:
-                return self.SET_CBC4()
-            case 0x1C5:
-                return self.SET_CBC5()
-            case 0x1C6:
-                return self.SET_CBC6()
-            case 0x1C7:
-                return self.SET_CBC7()
-            case 0x1C8:
-                return self.SET_CBC8()
-            case 0x1C9:
-                return self.SET_CBC9()
-            case 0x1CA:
-                return self.SET_CBCA()
-            case 0x1CB:
-                return self.SET_CBCB()
-            case 0x1CC:
-                return self.SET_CBCC()
-            case 0x1CD:
-                return self.SET_CBCD()
-            case 0x1CE:
-                return self.SET_CBCE()
-            case 0x1CF:
-                return self.SET_CBCF()
-            case 0x1D0:
-                return self.SET_CBD0()
-            case 0x1D1:
-                return self.SET_CBD1()
-            case 0x1D2:
-                return self.SET_CBD2()
-            case 0x1D3:
-                return self.SET_CBD3()
-            case 0x1D4:
-                return self.SET_CBD4()
-            case 0x1D5:
-                return self.SET_CBD5()
-            case 0x1D6:
-                return self.SET_CBD6()
-            case 0x1D7:
-                return self.SET_CBD7()
-            case 0x1D8:
-                return self.SET_CBD8()
-            case 0x1D9:
-                return self.SET_CBD9()
-            case 0x1DA:
-                return self.SET_CBDA()
-            case 0x1DB:
-                return self.SET_CBDB()
-            case 0x1DC:
-                return self.SET_CBDC()
-            case 0x1DD:
-                return self.SET_CBDD()
-            case 0x1DE:
-                return self.SET_CBDE()
-            case 0x1DF:
-                return self.SET_CBDF()
-            case 0x1E0:
-                return self.SET_CBE0()
-            case 0x1E1:
-                return self.SET_CBE1()
-            case 0x1E2:
-                return self.SET_CBE2()
-            case 0x1E3:
-                return self.SET_CBE3()
-            case 0x1E4:
-                return self.SET_CBE4()
-            case 0x1E5:
-                return self.SET_CBE5()
-            case 0x1E6:
-                return self.SET_CBE6()
-            case 0x1E7:
-                return self.SET_CBE7()
-            case 0x1E8:
-                return self.SET_CBE8()
-            case 0x1E9:
-                return self.SET_CBE9()
-            case 0x1EA:
-                return self.SET_CBEA()
-            case 0x1EB:
-                return self.SET_CBEB()
-            case 0x1EC:
-                return self.SET_CBEC()
-            case 0x1ED:
-                return self.SET_CBED()
-            case 0x1EE:
-                return self.SET_CBEE()
-            case 0x1EF:
-                return self.SET_CBEF()
-            case 0x1F0:
-                return self.SET_CBF0()
-            case 0x1F1:
-                return self.SET_CBF1()
-            case 0x1F2:
-                return self.SET_CBF2()
-            case 0x1F3:
-                return self.SET_CBF3()
-            case 0x1F4:
-                return self.SET_CBF4()
-            case 0x1F5:
-                return self.SET_CBF5()
-            case 0x1F6:
-                return self.SET_CBF6()
-            case 0x1F7:
-                return self.SET_CBF7()
-            case 0x1F8:
-                return self.SET_CBF8()
-            case 0x1F9:
-                return self.SET_CBF9()
-            case 0x1FA:
-                return self.SET_CBFA()
-            case 0x1FB:
-                return self.SET_CBFB()
-            case 0x1FC:
-                return self.SET_CBFC()
-            case 0x1FD:
-                return self.SET_CBFD()
-            case 0x1FE:
-                return self.SET_CBFE()
-            case 0x1FF:
-                return self.SET_CBFF()
+        match width:
+            case 0:
+                return handler()
+            case 1:
+                return handler(self.fetch8())
             case _:
-                raise Exception(f"Unknown Instruction: {formatted_hex(opcode)}")
+                return handler(self.fetch16())
+
+    def ILLEGAL(self) -> int:
+        """Illegal Opcode"""
+        opcode = self.mmu.get_memory(self.R.PC - 1)
+        raise Exception(f"Illegal Opcode: {formatted_hex(opcode)}")
+
+    def PREFIX_CB(self, opcode: int) -> int:
+        """PREFIX CB"""
+        return self.DISPATCH[0x100 | opcode][0]()
 
     def NOP_00(self) -> int:
         """NOP"""
@@ -1068,24 +630,22 @@ class Opcodes:
 
     def INC_04(self) -> int:
         """INC B"""
-        calc = self.R.B + 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.B
+        final = (initial + 1) & 0xFF
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.B & 0xF) + 1 > 0xF) & 1
-        calc &= 0xFF
-
-        self.R.B = calc
+        self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
         return 4
 
     def DEC_05(self) -> int:
         """DEC B"""
-        calc = self.R.B - 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.B
+        final = (initial - 1) & 0xFF
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((self.R.B & 0xF) - 1 < 0) & 1
-        calc &= 0xFF
-
-        self.R.B = calc
+        self.R.HALFCARRY = ((initial & 0xF) - 1 < 0) & 1
         return 4
 
     def LD_06(self, value: int) -> int:
@@ -1095,32 +655,30 @@ class Opcodes:
 
     def RLCA_07(self) -> int:
         """RLCA"""
-        initial = self.R.A
-        carryBit = initial >> 7
-        calc = (initial << 1) & 0b11111110 | carryBit
-        self.R.A = calc
-
+        carry = self.R.A >> 7
+        final = (self.R.A << 1) & 0xFF | carry
+        self.R.A = final
         self.R.ZERO = 0
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
+        self.R.CARRY = carry
         return 4
 
     def LD_08(self, address: int) -> int:
-        """LD [n16],SP"""
+        """LD [n16], SP"""
         self.mmu.set_memory(address, self.R.SP & 0xFF)
         self.mmu.set_memory(address + 1, self.R.SP >> 8)
         return 20
 
     def ADD_09(self) -> int:
         """ADD HL, BC"""
-        calc = self.R.HL + self.R.BC
-
+        initial = self.R.HL
+        value = self.R.BC
+        calc = initial + value
+        self.R.HL = calc & 0xFFFF
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.HL & 0xFFF) + (self.R.BC & 0xFFF) > 0xFFF) & 1
+        self.R.HALFCARRY = ((initial & 0xFFF) + (value & 0xFFF) > 0xFFF) & 1
         self.R.CARRY = (calc > 0xFFFF) & 1
-
-        self.R.HL = calc & 0xFFFF
         return 8
 
     def LD_0A(self) -> int:
@@ -1135,24 +693,22 @@ class Opcodes:
 
     def INC_0C(self) -> int:
         """INC C"""
-        calc = self.R.C + 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.C
+        final = (initial + 1) & 0xFF
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.C & 0xF) + 1 > 0xF) & 1
-        calc &= 0xFF
-
-        self.R.C = calc
+        self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
         return 4
 
     def DEC_0D(self) -> int:
         """DEC C"""
-        calc = self.R.C - 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.C
+        final = (initial - 1) & 0xFF
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((self.R.C & 0xF) - 1 < 0) & 1
-        calc &= 0xFF
-
-        self.R.C = calc
+        self.R.HALFCARRY = ((initial & 0xF) - 1 < 0) & 1
         return 4
 
     def LD_0E(self, value: int) -> int:
@@ -1162,19 +718,17 @@ class Opcodes:
 
     def RRCA_0F(self) -> int:
         """RRCA"""
-        initial = self.R.A
-        carryBit = initial & 1
-        calc = (carryBit << 7) | initial >> 1
-        self.R.A = calc
-
+        carry = self.R.A & 1
+        final = carry << 7 | self.R.A >> 1
+        self.R.A = final
         self.R.ZERO = 0
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
+        self.R.CARRY = carry
         return 4
 
     def STOP_10(self) -> int:
-        """STOP 0"""
+        """STOP"""
         return 4
 
     def LD_11(self, value: int) -> int:
@@ -1194,24 +748,22 @@ class Opcodes:
 
     def INC_14(self) -> int:
         """INC D"""
-        calc = self.R.D + 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.D
+        final = (initial + 1) & 0xFF
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.D & 0xF) + 1 > 0xF) & 1
-        calc &= 0xFF
-
-        self.R.D = calc
+        self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
         return 4
 
     def DEC_15(self) -> int:
         """DEC D"""
-        calc = self.R.D - 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.D
+        final = (initial - 1) & 0xFF
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((self.R.D & 0xF) - 1 < 0) & 1
-        calc &= 0xFF
-
-        self.R.D = calc
+        self.R.HALFCARRY = ((initial & 0xF) - 1 < 0) & 1
         return 4
 
     def LD_16(self, value: int) -> int:
@@ -1221,32 +773,29 @@ class Opcodes:
 
     def RLA_17(self) -> int:
         """RLA"""
-        initial = self.R.A
-        carryBit = initial >> 7
-        calc = (initial << 1) & 0b11111110 | self.R.CARRY
-        self.R.A = calc
-
+        carry = self.R.A >> 7
+        final = (self.R.A << 1) & 0xFF | self.R.CARRY
+        self.R.A = final
         self.R.ZERO = 0
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
+        self.R.CARRY = carry
         return 4
 
     def JR_18(self, value: int) -> int:
         """JR e8"""
-        addr = (value ^ 0x80) - 0x80
-        self.R.PC += addr
+        self.R.PC += (value ^ 0x80) - 0x80
         return 12
 
     def ADD_19(self) -> int:
         """ADD HL, DE"""
-        calc = self.R.HL + self.R.DE
-
+        initial = self.R.HL
+        value = self.R.DE
+        calc = initial + value
+        self.R.HL = calc & 0xFFFF
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.HL & 0xFFF) + (self.R.DE & 0xFFF) > 0xFFF) & 1
+        self.R.HALFCARRY = ((initial & 0xFFF) + (value & 0xFFF) > 0xFFF) & 1
         self.R.CARRY = (calc > 0xFFFF) & 1
-
-        self.R.HL = calc & 0xFFFF
         return 8
 
     def LD_1A(self) -> int:
@@ -1261,22 +810,22 @@ class Opcodes:
 
     def INC_1C(self) -> int:
         """INC E"""
-        calc = self.R.E + 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.E
+        final = (initial + 1) & 0xFF
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.E & 0xF) + 1 > 0xF) & 1
-        calc &= 0xFF
-        self.R.E = calc
+        self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
         return 4
 
     def DEC_1D(self) -> int:
         """DEC E"""
-        calc = self.R.E - 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.E
+        final = (initial - 1) & 0xFF
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((self.R.E & 0xF) - 1 < 0) & 1
-        calc &= 0xFF
-        self.R.E = calc
+        self.R.HALFCARRY = ((initial & 0xF) - 1 < 0) & 1
         return 4
 
     def LD_1E(self, value: int) -> int:
@@ -1286,21 +835,19 @@ class Opcodes:
 
     def RRA_1F(self) -> int:
         """RRA"""
-        initial = self.R.A
-        carryBit = initial & 1
-        calc = (self.R.CARRY << 7) | initial >> 1
-        self.R.A = calc
+        carry = self.R.A & 1
+        final = self.R.CARRY << 7 | self.R.A >> 1
+        self.R.A = final
         self.R.ZERO = 0
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
+        self.R.CARRY = carry
         return 4
 
     def JR_20(self, value: int) -> int:
-        """JR NZ,e8"""
+        """JR NZ, e8"""
         if self.R.ZERO == 0:
-            addr = (value ^ 0x80) - 0x80
-            self.R.PC += addr
+            self.R.PC += (value ^ 0x80) - 0x80
             return 12
         return 8
 
@@ -1310,9 +857,10 @@ class Opcodes:
         return 12
 
     def LD_22(self) -> int:
-        """LD [HLI],A"""
-        self.mmu.set_memory(self.R.HL, self.R.A)
-        self.R.HL = (self.R.HL + 1) & 0xFFFF
+        """LD [HL+], A"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.R.A)
+        self.R.HL = (hl + 1) & 0xFFFF
         return 8
 
     def INC_23(self) -> int:
@@ -1322,22 +870,22 @@ class Opcodes:
 
     def INC_24(self) -> int:
         """INC H"""
-        calc = self.R.H + 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.H
+        final = (initial + 1) & 0xFF
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.H & 0xF) + 1 > 0xF) & 1
-        calc &= 0xFF
-        self.R.H = calc
+        self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
         return 4
 
     def DEC_25(self) -> int:
         """DEC H"""
-        calc = self.R.H - 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.H
+        final = (initial - 1) & 0xFF
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((self.R.H & 0xF) - 1 < 0) & 1
-        calc &= 0xFF
-        self.R.H = calc
+        self.R.HALFCARRY = ((initial & 0xF) - 1 < 0) & 1
         return 4
 
     def LD_26(self, value: int) -> int:
@@ -1349,13 +897,13 @@ class Opcodes:
         """DAA"""
         # Credit to https://blog.ollien.com/posts/gb-daa/ for the logic
         offset = 0
-        carryBit = 0
+        carry = 0
 
         if (self.R.SUBTRACTION == 0 and self.R.A & 0xF > 0x09) or self.R.HALFCARRY == 1:
             offset |= 0x06
         if (self.R.SUBTRACTION == 0 and self.R.A > 0x99) or self.R.CARRY == 1:
             offset |= 0x60
-            carryBit = 1
+            carry = 1
 
         final = (
             (self.R.A + offset) & 0xFF
@@ -1365,30 +913,32 @@ class Opcodes:
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
+        self.R.CARRY = carry
         return 4
 
     def JR_28(self, value: int) -> int:
-        """JR Z,e8"""
+        """JR Z, e8"""
         if self.R.ZERO == 1:
-            addr = (value ^ 0x80) - 0x80
-            self.R.PC += addr
+            self.R.PC += (value ^ 0x80) - 0x80
             return 12
         return 8
 
     def ADD_29(self) -> int:
         """ADD HL, HL"""
-        calc = self.R.HL + self.R.HL
+        initial = self.R.HL
+        value = self.R.HL
+        calc = initial + value
+        self.R.HL = calc & 0xFFFF
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.HL & 0xFFF) + (self.R.HL & 0xFFF) > 0xFFF) & 1
+        self.R.HALFCARRY = ((initial & 0xFFF) + (value & 0xFFF) > 0xFFF) & 1
         self.R.CARRY = (calc > 0xFFFF) & 1
-        self.R.HL = calc & 0xFFFF
         return 8
 
     def LD_2A(self) -> int:
-        """LD A, [HLI]"""
-        self.R.A = self.mmu.get_memory(self.R.HL)
-        self.R.HL = (self.R.HL + 1) & 0xFFFF
+        """LD A, [HL+]"""
+        hl = self.R.HL
+        self.R.A = self.mmu.get_memory(hl)
+        self.R.HL = (hl + 1) & 0xFFFF
         return 8
 
     def DEC_2B(self) -> int:
@@ -1398,22 +948,22 @@ class Opcodes:
 
     def INC_2C(self) -> int:
         """INC L"""
-        calc = self.R.L + 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.L
+        final = (initial + 1) & 0xFF
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.L & 0xF) + 1 > 0xF) & 1
-        calc &= 0xFF
-        self.R.L = calc
+        self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
         return 4
 
     def DEC_2D(self) -> int:
         """DEC L"""
-        calc = self.R.L - 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.L
+        final = (initial - 1) & 0xFF
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((self.R.L & 0xF) - 1 < 0) & 1
-        calc &= 0xFF
-        self.R.L = calc
+        self.R.HALFCARRY = ((initial & 0xF) - 1 < 0) & 1
         return 4
 
     def LD_2E(self, value: int) -> int:
@@ -1429,10 +979,9 @@ class Opcodes:
         return 4
 
     def JR_30(self, value: int) -> int:
-        """JR NC,e8"""
+        """JR NC, e8"""
         if self.R.CARRY == 0:
-            addr = (value ^ 0x80) - 0x80
-            self.R.PC += addr
+            self.R.PC += (value ^ 0x80) - 0x80
             return 12
         return 8
 
@@ -1442,9 +991,10 @@ class Opcodes:
         return 12
 
     def LD_32(self) -> int:
-        """LD [HLD],A"""
-        self.mmu.set_memory(self.R.HL, self.R.A)
-        self.R.HL = (self.R.HL - 1) & 0xFFFF
+        """LD [HL-], A"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.R.A)
+        self.R.HL = (hl - 1) & 0xFFFF
         return 8
 
     def INC_33(self) -> int:
@@ -1454,9 +1004,10 @@ class Opcodes:
 
     def INC_34(self) -> int:
         """INC [HL]"""
-        initial = self.mmu.get_memory(self.R.HL)
+        hl = self.R.HL
+        initial = self.mmu.get_memory(hl)
         final = (initial + 1) & 0xFF
-        self.mmu.set_memory(self.R.HL, final)
+        self.mmu.set_memory(hl, final)
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
@@ -1464,9 +1015,10 @@ class Opcodes:
 
     def DEC_35(self) -> int:
         """DEC [HL]"""
-        initial = self.mmu.get_memory(self.R.HL)
+        hl = self.R.HL
+        initial = self.mmu.get_memory(hl)
         final = (initial - 1) & 0xFF
-        self.mmu.set_memory(self.R.HL, final)
+        self.mmu.set_memory(hl, final)
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
         self.R.HALFCARRY = ((initial & 0xF) - 1 < 0) & 1
@@ -1487,24 +1039,26 @@ class Opcodes:
     def JR_38(self, value: int) -> int:
         """JR C, e8"""
         if self.R.CARRY == 1:
-            addr = (value ^ 0x80) - 0x80
-            self.R.PC += addr
+            self.R.PC += (value ^ 0x80) - 0x80
             return 12
         return 8
 
     def ADD_39(self) -> int:
         """ADD HL, SP"""
-        calc = self.R.HL + self.R.SP
+        initial = self.R.HL
+        value = self.R.SP
+        calc = initial + value
+        self.R.HL = calc & 0xFFFF
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.HL & 0xFFF) + (self.R.SP & 0xFFF) > 0xFFF) & 1
+        self.R.HALFCARRY = ((initial & 0xFFF) + (value & 0xFFF) > 0xFFF) & 1
         self.R.CARRY = (calc > 0xFFFF) & 1
-        self.R.HL = calc & 0xFFFF
         return 8
 
     def LD_3A(self) -> int:
-        """LD A, [HLD]"""
-        self.R.A = self.mmu.get_memory(self.R.HL)
-        self.R.HL = (self.R.HL - 1) & 0xFFFF
+        """LD A, [HL-]"""
+        hl = self.R.HL
+        self.R.A = self.mmu.get_memory(hl)
+        self.R.HL = (hl - 1) & 0xFFFF
         return 8
 
     def DEC_3B(self) -> int:
@@ -1514,22 +1068,22 @@ class Opcodes:
 
     def INC_3C(self) -> int:
         """INC A"""
-        calc = self.R.A + 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.A
+        final = (initial + 1) & 0xFF
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((self.R.A & 0xF) + 1 > 0xF) & 1
-        calc &= 0xFF
-        self.R.A = calc
+        self.R.HALFCARRY = ((initial & 0xF) + 1 > 0xF) & 1
         return 4
 
     def DEC_3D(self) -> int:
         """DEC A"""
-        calc = self.R.A - 1
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        initial = self.R.A
+        final = (initial - 1) & 0xFF
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((self.R.A & 0xF) - 1 < 0) & 1
-        calc &= 0xFF
-        self.R.A = calc
+        self.R.HALFCARRY = ((initial & 0xF) - 1 < 0) & 1
         return 4
 
     def LD_3E(self, value: int) -> int:
@@ -1964,90 +1518,78 @@ class Opcodes:
     def ADC_88(self) -> int:
         """ADC A, B"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + self.R.B + carryBit
+        carry = self.R.CARRY
+        calc = initial + self.R.B + carry
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            (initial & 0xF) + (self.R.B & 0xF) + (carryBit & 0xF) > 0xF
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) + (self.R.B & 0xF) + carry > 0xF) & 1
         self.R.CARRY = (calc > 0xFF) & 1
         return 4
 
     def ADC_89(self) -> int:
         """ADC A, C"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + self.R.C + carryBit
+        carry = self.R.CARRY
+        calc = initial + self.R.C + carry
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            (initial & 0xF) + (self.R.C & 0xF) + (carryBit & 0xF) > 0xF
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) + (self.R.C & 0xF) + carry > 0xF) & 1
         self.R.CARRY = (calc > 0xFF) & 1
         return 4
 
     def ADC_8A(self) -> int:
         """ADC A, D"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + self.R.D + carryBit
+        carry = self.R.CARRY
+        calc = initial + self.R.D + carry
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            (initial & 0xF) + (self.R.D & 0xF) + (carryBit & 0xF) > 0xF
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) + (self.R.D & 0xF) + carry > 0xF) & 1
         self.R.CARRY = (calc > 0xFF) & 1
         return 4
 
     def ADC_8B(self) -> int:
         """ADC A, E"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + self.R.E + carryBit
+        carry = self.R.CARRY
+        calc = initial + self.R.E + carry
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            (initial & 0xF) + (self.R.E & 0xF) + (carryBit & 0xF) > 0xF
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) + (self.R.E & 0xF) + carry > 0xF) & 1
         self.R.CARRY = (calc > 0xFF) & 1
         return 4
 
     def ADC_8C(self) -> int:
         """ADC A, H"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + self.R.H + carryBit
+        carry = self.R.CARRY
+        calc = initial + self.R.H + carry
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            (initial & 0xF) + (self.R.H & 0xF) + (carryBit & 0xF) > 0xF
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) + (self.R.H & 0xF) + carry > 0xF) & 1
         self.R.CARRY = (calc > 0xFF) & 1
         return 4
 
     def ADC_8D(self) -> int:
         """ADC A, L"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + self.R.L + carryBit
+        carry = self.R.CARRY
+        calc = initial + self.R.L + carry
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            (initial & 0xF) + (self.R.L & 0xF) + (carryBit & 0xF) > 0xF
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) + (self.R.L & 0xF) + carry > 0xF) & 1
         self.R.CARRY = (calc > 0xFF) & 1
         return 4
 
@@ -2055,28 +1597,26 @@ class Opcodes:
         """ADC A, [HL]"""
         mem = self.mmu.get_memory(self.R.HL)
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + mem + carryBit
+        carry = self.R.CARRY
+        calc = initial + mem + carry
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = ((initial & 0xF) + (mem & 0xF) + (carryBit & 0xF) > 0xF) & 1
+        self.R.HALFCARRY = ((initial & 0xF) + (mem & 0xF) + carry > 0xF) & 1
         self.R.CARRY = (calc > 0xFF) & 1
         return 8
 
     def ADC_8F(self) -> int:
         """ADC A, A"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + self.R.A + carryBit
+        carry = self.R.CARRY
+        calc = initial + self.R.A + carry
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            (initial & 0xF) + (self.R.A & 0xF) + (carryBit & 0xF) > 0xF
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) + (self.R.A & 0xF) + carry > 0xF) & 1
         self.R.CARRY = (calc > 0xFF) & 1
         return 4
 
@@ -2180,90 +1720,78 @@ class Opcodes:
     def SBC_98(self) -> int:
         """SBC A, B"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (self.R.B + carryBit)
+        carry = self.R.CARRY
+        calc = initial - (self.R.B + carry)
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = (
-            (initial & 0xF) - ((self.R.B & 0xF) + (carryBit & 0xF)) < 0
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((self.R.B & 0xF) + carry) < 0) & 1
         self.R.CARRY = (calc < 0) & 1
         return 4
 
     def SBC_99(self) -> int:
         """SBC A, C"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (self.R.C + carryBit)
+        carry = self.R.CARRY
+        calc = initial - (self.R.C + carry)
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = (
-            (initial & 0xF) - ((self.R.C & 0xF) + (carryBit & 0xF)) < 0
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((self.R.C & 0xF) + carry) < 0) & 1
         self.R.CARRY = (calc < 0) & 1
         return 4
 
     def SBC_9A(self) -> int:
         """SBC A, D"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (self.R.D + carryBit)
+        carry = self.R.CARRY
+        calc = initial - (self.R.D + carry)
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = (
-            (initial & 0xF) - ((self.R.D & 0xF) + (carryBit & 0xF)) < 0
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((self.R.D & 0xF) + carry) < 0) & 1
         self.R.CARRY = (calc < 0) & 1
         return 4
 
     def SBC_9B(self) -> int:
         """SBC A, E"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (self.R.E + carryBit)
+        carry = self.R.CARRY
+        calc = initial - (self.R.E + carry)
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = (
-            (initial & 0xF) - ((self.R.E & 0xF) + (carryBit & 0xF)) < 0
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((self.R.E & 0xF) + carry) < 0) & 1
         self.R.CARRY = (calc < 0) & 1
         return 4
 
     def SBC_9C(self) -> int:
         """SBC A, H"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (self.R.H + carryBit)
+        carry = self.R.CARRY
+        calc = initial - (self.R.H + carry)
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = (
-            (initial & 0xF) - ((self.R.H & 0xF) + (carryBit & 0xF)) < 0
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((self.R.H & 0xF) + carry) < 0) & 1
         self.R.CARRY = (calc < 0) & 1
         return 4
 
     def SBC_9D(self) -> int:
         """SBC A, L"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (self.R.L + carryBit)
+        carry = self.R.CARRY
+        calc = initial - (self.R.L + carry)
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = (
-            (initial & 0xF) - ((self.R.L & 0xF) + (carryBit & 0xF)) < 0
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((self.R.L & 0xF) + carry) < 0) & 1
         self.R.CARRY = (calc < 0) & 1
         return 4
 
@@ -2271,37 +1799,34 @@ class Opcodes:
         """SBC A, [HL]"""
         mem = self.mmu.get_memory(self.R.HL)
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (mem + carryBit)
+        carry = self.R.CARRY
+        calc = initial - (mem + carry)
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((initial & 0xF) - ((mem & 0xF) + (carryBit & 0xF)) < 0) & 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((mem & 0xF) + carry) < 0) & 1
         self.R.CARRY = (calc < 0) & 1
         return 8
 
     def SBC_9F(self) -> int:
         """SBC A, A"""
         initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (self.R.A + carryBit)
+        carry = self.R.CARRY
+        calc = initial - (self.R.A + carry)
         final = calc & 0xFF
         self.R.A = final
         self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = (
-            (initial & 0xF) - ((self.R.A & 0xF) + (carryBit & 0xF)) < 0
-        ) & 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((self.R.A & 0xF) + carry) < 0) & 1
         self.R.CARRY = (calc < 0) & 1
         return 4
 
     def AND_A0(self) -> int:
         """AND A, B"""
-        initial = self.R.A
-        calc = initial & self.R.B
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A & self.R.B
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         self.R.CARRY = 0
@@ -2309,10 +1834,9 @@ class Opcodes:
 
     def AND_A1(self) -> int:
         """AND A, C"""
-        initial = self.R.A
-        calc = initial & self.R.C
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A & self.R.C
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         self.R.CARRY = 0
@@ -2320,10 +1844,9 @@ class Opcodes:
 
     def AND_A2(self) -> int:
         """AND A, D"""
-        initial = self.R.A
-        calc = initial & self.R.D
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A & self.R.D
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         self.R.CARRY = 0
@@ -2331,10 +1854,9 @@ class Opcodes:
 
     def AND_A3(self) -> int:
         """AND A, E"""
-        initial = self.R.A
-        calc = initial & self.R.E
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A & self.R.E
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         self.R.CARRY = 0
@@ -2342,10 +1864,9 @@ class Opcodes:
 
     def AND_A4(self) -> int:
         """AND A, H"""
-        initial = self.R.A
-        calc = initial & self.R.H
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A & self.R.H
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         self.R.CARRY = 0
@@ -2353,10 +1874,9 @@ class Opcodes:
 
     def AND_A5(self) -> int:
         """AND A, L"""
-        initial = self.R.A
-        calc = initial & self.R.L
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A & self.R.L
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         self.R.CARRY = 0
@@ -2364,11 +1884,9 @@ class Opcodes:
 
     def AND_A6(self) -> int:
         """AND A, [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        initial = self.R.A
-        calc = initial & mem
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A & self.mmu.get_memory(self.R.HL)
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         self.R.CARRY = 0
@@ -2376,10 +1894,9 @@ class Opcodes:
 
     def AND_A7(self) -> int:
         """AND A, A"""
-        initial = self.R.A
-        calc = initial & self.R.A
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A & self.R.A
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         self.R.CARRY = 0
@@ -2387,10 +1904,9 @@ class Opcodes:
 
     def XOR_A8(self) -> int:
         """XOR A, B"""
-        calc = self.R.A ^ self.R.B
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A ^ self.R.B
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2398,10 +1914,9 @@ class Opcodes:
 
     def XOR_A9(self) -> int:
         """XOR A, C"""
-        calc = self.R.A ^ self.R.C
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A ^ self.R.C
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2409,10 +1924,9 @@ class Opcodes:
 
     def XOR_AA(self) -> int:
         """XOR A, D"""
-        calc = self.R.A ^ self.R.D
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A ^ self.R.D
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2420,10 +1934,9 @@ class Opcodes:
 
     def XOR_AB(self) -> int:
         """XOR A, E"""
-        calc = self.R.A ^ self.R.E
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A ^ self.R.E
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2431,10 +1944,9 @@ class Opcodes:
 
     def XOR_AC(self) -> int:
         """XOR A, H"""
-        calc = self.R.A ^ self.R.H
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A ^ self.R.H
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2442,10 +1954,9 @@ class Opcodes:
 
     def XOR_AD(self) -> int:
         """XOR A, L"""
-        calc = self.R.A ^ self.R.L
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A ^ self.R.L
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2453,10 +1964,9 @@ class Opcodes:
 
     def XOR_AE(self) -> int:
         """XOR A, [HL]"""
-        calc = self.R.A ^ self.mmu.get_memory(self.R.HL)
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A ^ self.mmu.get_memory(self.R.HL)
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2464,10 +1974,9 @@ class Opcodes:
 
     def XOR_AF(self) -> int:
         """XOR A, A"""
-        calc = self.R.A ^ self.R.A
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A ^ self.R.A
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2475,10 +1984,9 @@ class Opcodes:
 
     def OR_B0(self) -> int:
         """OR A, B"""
-        calc = self.R.A | self.R.B
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A | self.R.B
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2486,10 +1994,9 @@ class Opcodes:
 
     def OR_B1(self) -> int:
         """OR A, C"""
-        calc = self.R.A | self.R.C
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A | self.R.C
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2497,10 +2004,9 @@ class Opcodes:
 
     def OR_B2(self) -> int:
         """OR A, D"""
-        calc = self.R.A | self.R.D
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A | self.R.D
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2508,10 +2014,9 @@ class Opcodes:
 
     def OR_B3(self) -> int:
         """OR A, E"""
-        calc = self.R.A | self.R.E
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A | self.R.E
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2519,10 +2024,9 @@ class Opcodes:
 
     def OR_B4(self) -> int:
         """OR A, H"""
-        calc = self.R.A | self.R.H
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A | self.R.H
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2530,10 +2034,9 @@ class Opcodes:
 
     def OR_B5(self) -> int:
         """OR A, L"""
-        calc = self.R.A | self.R.L
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A | self.R.L
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2541,10 +2044,9 @@ class Opcodes:
 
     def OR_B6(self) -> int:
         """OR A, [HL]"""
-        calc = self.R.A | self.mmu.get_memory(self.R.HL)
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A | self.mmu.get_memory(self.R.HL)
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2552,10 +2054,9 @@ class Opcodes:
 
     def OR_B7(self) -> int:
         """OR A, A"""
-        calc = self.R.A | self.R.A
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
+        final = self.R.A | self.R.A
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
@@ -2637,7 +2138,7 @@ class Opcodes:
     def RET_C0(self) -> int:
         """RET NZ"""
         if self.R.ZERO == 0:
-            self.JP_C3(self.R.POP())
+            self.R.PC = self.R.POP()
             return 20
         return 8
 
@@ -2647,7 +2148,7 @@ class Opcodes:
         return 12
 
     def JP_C2(self, address: int) -> int:
-        """JP NZ,n16"""
+        """JP NZ, n16"""
         if self.R.ZERO == 0:
             self.R.PC = address
             return 16
@@ -2659,7 +2160,7 @@ class Opcodes:
         return 16
 
     def CALL_C4(self, address: int) -> int:
-        """CALL NZ,n16"""
+        """CALL NZ, n16"""
         if self.R.ZERO == 0:
             self.R.PUSH(self.R.PC)
             self.R.PC = address
@@ -2685,7 +2186,8 @@ class Opcodes:
 
     def RST_C7(self) -> int:
         """RST $00"""
-        self.CALL_CD(0x00)
+        self.R.PUSH(self.R.PC)
+        self.R.PC = 0x00
         return 16
 
     def RET_C8(self) -> int:
@@ -2701,2757 +2203,2109 @@ class Opcodes:
         return 16
 
     def JP_CA(self, address: int) -> int:
-        """JP Z,n16"""
+        """JP Z, n16"""
         if self.R.ZERO == 1:
             self.R.PC = address
             return 16
         return 12
 
-    def RLC_CB00(self) -> int:
-        """RLC B"""
-        carryBit = self.R.B >> 7
-        calc = (self.R.B << 1) & 0b11111110 | carryBit
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.B = calc
-        return 8
-
-    def RLC_CB01(self) -> int:
-        """RLC C"""
-        carryBit = self.R.C >> 7
-        calc = (self.R.C << 1) & 0b11111110 | carryBit
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.C = calc
-        return 8
-
-    def RLC_CB02(self) -> int:
-        """RLC D"""
-        carryBit = self.R.D >> 7
-        calc = (self.R.D << 1) & 0b11111110 | carryBit
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.D = calc
-        return 8
-
-    def RLC_CB03(self) -> int:
-        """RLC E"""
-        carryBit = self.R.E >> 7
-        calc = (self.R.E << 1) & 0b11111110 | carryBit
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.E = calc
-        return 8
+    def CALL_CC(self, address: int) -> int:
+        """CALL Z, n16"""
+        if self.R.ZERO == 1:
+            self.R.PUSH(self.R.PC)
+            self.R.PC = address
+            return 24
+        return 12
 
-    def RLC_CB04(self) -> int:
-        """RLC H"""
-        carryBit = self.R.H >> 7
-        calc = (self.R.H << 1) & 0b11111110 | carryBit
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.H = calc
-        return 8
+    def CALL_CD(self, address: int) -> int:
+        """CALL n16"""
+        self.R.PUSH(self.R.PC)
+        self.R.PC = address
+        return 24
 
-    def RLC_CB05(self) -> int:
-        """RLC L"""
-        carryBit = self.R.L >> 7
-        calc = (self.R.L << 1) & 0b11111110 | carryBit
-        self.R.ZERO = (calc == 0) & 1
+    def ADC_CE(self, value: int) -> int:
+        """ADC A, n8"""
+        initial = self.R.A
+        carry = self.R.CARRY
+        calc = initial + value + carry
+        final = calc & 0xFF
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.L = calc
+        self.R.HALFCARRY = ((initial & 0xF) + (value & 0xF) + carry > 0xF) & 1
+        self.R.CARRY = (calc > 0xFF) & 1
         return 8
 
-    def RLC_CB06(self) -> int:
-        """RLC [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        carryBit = mem >> 7
-        calc = (mem << 1) & 0b11111110 | carryBit
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.mmu.set_memory(self.R.HL, calc)
+    def RST_CF(self) -> int:
+        """RST $08"""
+        self.R.PUSH(self.R.PC)
+        self.R.PC = 0x08
         return 16
 
-    def RLC_CB07(self) -> int:
-        """RLC A"""
-        carryBit = self.R.A >> 7
-        calc = (self.R.A << 1) & 0b11111110 | carryBit
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.A = calc
+    def RET_D0(self) -> int:
+        """RET NC"""
+        if self.R.CARRY == 0:
+            self.R.PC = self.R.POP()
+            return 20
         return 8
 
-    def RRC_CB08(self) -> int:
-        """RRC B"""
-        carryBit = self.R.B & 1
-        calc = (carryBit << 7) | self.R.B >> 1
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.B = calc
-        return 8
+    def POP_D1(self) -> int:
+        """POP DE"""
+        self.R.DE = self.R.POP()
+        return 12
 
-    def RRC_CB09(self) -> int:
+    def JP_D2(self, address: int) -> int:
+        """JP NC, n16"""
+        if self.R.CARRY == 0:
+            self.R.PC = address
+            return 16
+        return 12
+
+    def CALL_D4(self, address: int) -> int:
+        """CALL NC, n16"""
+        if self.R.CARRY == 0:
+            self.R.PUSH(self.R.PC)
+            self.R.PC = address
+            return 24
+        return 12
+
+    def PUSH_D5(self) -> int:
+        """PUSH DE"""
+        self.R.PUSH(self.R.DE)
+        return 16
+
+    def SUB_D6(self, value: int) -> int:
+        """SUB A, n8"""
+        initial = self.R.A
+        calc = initial - value
+        final = calc & 0xFF
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 1
+        self.R.HALFCARRY = ((initial & 0xF) - (value & 0xF) < 0) & 1
+        self.R.CARRY = (calc < 0) & 1
+        return 8
+
+    def RST_D7(self) -> int:
+        """RST $10"""
+        self.R.PUSH(self.R.PC)
+        self.R.PC = 0x10
+        return 16
+
+    def RET_D8(self) -> int:
+        """RET C"""
+        if self.R.CARRY == 1:
+            self.R.PC = self.R.POP()
+            return 20
+        return 8
+
+    def RETI_D9(self) -> int:
+        """RETI"""
+        self.mmu.IME = True
+        self.R.PC = self.R.POP()
+        return 16
+
+    def JP_DA(self, address: int) -> int:
+        """JP C, n16"""
+        if self.R.CARRY == 1:
+            self.R.PC = address
+            return 16
+        return 12
+
+    def CALL_DC(self, address: int) -> int:
+        """CALL C, n16"""
+        if self.R.CARRY == 1:
+            self.R.PUSH(self.R.PC)
+            self.R.PC = address
+            return 24
+        return 12
+
+    def SBC_DE(self, value: int) -> int:
+        """SBC A, n8"""
+        initial = self.R.A
+        carry = self.R.CARRY
+        calc = initial - (value + carry)
+        final = calc & 0xFF
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 1
+        self.R.HALFCARRY = ((initial & 0xF) - ((value & 0xF) + carry) < 0) & 1
+        self.R.CARRY = (calc < 0) & 1
+        return 8
+
+    def RST_DF(self) -> int:
+        """RST $18"""
+        self.R.PUSH(self.R.PC)
+        self.R.PC = 0x18
+        return 16
+
+    def LDH_E0(self, offset: int) -> int:
+        """LDH [n8], A"""
+        self.mmu.set_memory(0xFF00 + offset, self.R.A)
+        return 12
+
+    def POP_E1(self) -> int:
+        """POP HL"""
+        self.R.HL = self.R.POP()
+        return 12
+
+    def LDH_E2(self) -> int:
+        """LDH [C], A"""
+        self.mmu.set_memory(0xFF00 + self.R.C, self.R.A)
+        return 8
+
+    def PUSH_E5(self) -> int:
+        """PUSH HL"""
+        self.R.PUSH(self.R.HL)
+        return 16
+
+    def AND_E6(self, value: int) -> int:
+        """AND A, n8"""
+        final = self.R.A & value
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 1
+        self.R.CARRY = 0
+        return 8
+
+    def RST_E7(self) -> int:
+        """RST $20"""
+        self.R.PUSH(self.R.PC)
+        self.R.PC = 0x20
+        return 16
+
+    def ADD_E8(self, value: int) -> int:
+        """ADD SP, e8"""
+        initial = self.R.SP
+        offset = (value ^ 0x80) - 0x80
+        self.R.SP = (initial + offset) & 0xFFFF
+        self.R.ZERO = 0
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = ((initial & 0xF) + (offset & 0xF) > 0xF) & 1
+        self.R.CARRY = ((initial & 0xFF) + (offset & 0xFF) > 0xFF) & 1
+        return 16
+
+    def JP_E9(self) -> int:
+        """JP HL"""
+        self.R.PC = self.R.HL
+        return 4
+
+    def LD_EA(self, address: int) -> int:
+        """LD [n16], A"""
+        self.mmu.set_memory(address, self.R.A)
+        return 16
+
+    def XOR_EE(self, value: int) -> int:
+        """XOR A, n8"""
+        final = self.R.A ^ value
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = 0
+        return 8
+
+    def RST_EF(self) -> int:
+        """RST $28"""
+        self.R.PUSH(self.R.PC)
+        self.R.PC = 0x28
+        return 16
+
+    def LDH_F0(self, offset: int) -> int:
+        """LDH A, [n8]"""
+        self.R.A = self.mmu.get_memory(0xFF00 + offset)
+        return 12
+
+    def POP_F1(self) -> int:
+        """POP AF"""
+        self.R.AF = self.R.POP()
+        return 12
+
+    def LDH_F2(self) -> int:
+        """LDH A, [C]"""
+        self.R.A = self.mmu.get_memory(0xFF00 + self.R.C)
+        return 8
+
+    def DI_F3(self) -> int:
+        """DI"""
+        self.mmu.IME = False
+        return 4
+
+    def PUSH_F5(self) -> int:
+        """PUSH AF"""
+        self.R.PUSH(self.R.AF)
+        return 16
+
+    def OR_F6(self, value: int) -> int:
+        """OR A, n8"""
+        final = self.R.A | value
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = 0
+        return 8
+
+    def RST_F7(self) -> int:
+        """RST $30"""
+        self.R.PUSH(self.R.PC)
+        self.R.PC = 0x30
+        return 16
+
+    def LD_F8(self, value: int) -> int:
+        """LD HL, SP + e8"""
+        initial = self.R.SP
+        offset = (value ^ 0x80) - 0x80
+        self.R.HL = (initial + offset) & 0xFFFF
+        self.R.ZERO = 0
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = ((initial & 0xF) + (offset & 0xF) > 0xF) & 1
+        self.R.CARRY = ((initial & 0xFF) + (offset & 0xFF) > 0xFF) & 1
+        return 12
+
+    def LD_F9(self) -> int:
+        """LD SP, HL"""
+        self.R.SP = self.R.HL
+        return 8
+
+    def LD_FA(self, address: int) -> int:
+        """LD A, [n16]"""
+        self.R.A = self.mmu.get_memory(address)
+        return 16
+
+    def EI_FB(self) -> int:
+        """EI"""
+        self.mmu.IME = True
+        return 4
+
+    def CP_FE(self, value: int) -> int:
+        """CP A, n8"""
+        calc = self.R.A - value
+        self.R.ZERO = ((calc & 0xFF) == 0) & 1
+        self.R.SUBTRACTION = 1
+        self.R.HALFCARRY = ((self.R.A & 0xF) - (value & 0xF) < 0) & 1
+        self.R.CARRY = (calc < 0) & 1
+        return 8
+
+    def RST_FF(self) -> int:
+        """RST $38"""
+        self.R.PUSH(self.R.PC)
+        self.R.PC = 0x38
+        return 16
+
+    def RLC_CB00(self) -> int:
+        """RLC B"""
+        carry = self.R.B >> 7
+        final = (self.R.B << 1) & 0xFF | carry
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 8
+
+    def RLC_CB01(self) -> int:
+        """RLC C"""
+        carry = self.R.C >> 7
+        final = (self.R.C << 1) & 0xFF | carry
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 8
+
+    def RLC_CB02(self) -> int:
+        """RLC D"""
+        carry = self.R.D >> 7
+        final = (self.R.D << 1) & 0xFF | carry
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 8
+
+    def RLC_CB03(self) -> int:
+        """RLC E"""
+        carry = self.R.E >> 7
+        final = (self.R.E << 1) & 0xFF | carry
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 8
+
+    def RLC_CB04(self) -> int:
+        """RLC H"""
+        carry = self.R.H >> 7
+        final = (self.R.H << 1) & 0xFF | carry
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 8
+
+    def RLC_CB05(self) -> int:
+        """RLC L"""
+        carry = self.R.L >> 7
+        final = (self.R.L << 1) & 0xFF | carry
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 8
+
+    def RLC_CB06(self) -> int:
+        """RLC [HL]"""
+        hl = self.R.HL
+        mem = self.mmu.get_memory(hl)
+        carry = mem >> 7
+        final = (mem << 1) & 0xFF | carry
+        self.mmu.set_memory(hl, final)
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 16
+
+    def RLC_CB07(self) -> int:
+        """RLC A"""
+        carry = self.R.A >> 7
+        final = (self.R.A << 1) & 0xFF | carry
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 8
+
+    def RRC_CB08(self) -> int:
+        """RRC B"""
+        carry = self.R.B & 1
+        final = carry << 7 | self.R.B >> 1
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
+        self.R.SUBTRACTION = 0
+        self.R.HALFCARRY = 0
+        self.R.CARRY = carry
+        return 8
+
+    def RRC_CB09(self) -> int:
         """RRC C"""
-        carryBit = self.R.C & 1
-        calc = (carryBit << 7) | self.R.C >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.C & 1
+        final = carry << 7 | self.R.C >> 1
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.C = calc
+        self.R.CARRY = carry
         return 8
 
     def RRC_CB0A(self) -> int:
         """RRC D"""
-        carryBit = self.R.D & 1
-        calc = (carryBit << 7) | self.R.D >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.D & 1
+        final = carry << 7 | self.R.D >> 1
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.D = calc
+        self.R.CARRY = carry
         return 8
 
     def RRC_CB0B(self) -> int:
         """RRC E"""
-        carryBit = self.R.E & 1
-        calc = (carryBit << 7) | self.R.E >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.E & 1
+        final = carry << 7 | self.R.E >> 1
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.E = calc
+        self.R.CARRY = carry
         return 8
 
     def RRC_CB0C(self) -> int:
         """RRC H"""
-        carryBit = self.R.H & 1
-        calc = (carryBit << 7) | self.R.H >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.H & 1
+        final = carry << 7 | self.R.H >> 1
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.H = calc
+        self.R.CARRY = carry
         return 8
 
     def RRC_CB0D(self) -> int:
         """RRC L"""
-        carryBit = self.R.L & 1
-        calc = (carryBit << 7) | self.R.L >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.L & 1
+        final = carry << 7 | self.R.L >> 1
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.L = calc
+        self.R.CARRY = carry
         return 8
 
     def RRC_CB0E(self) -> int:
         """RRC [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        carryBit = mem & 1
-        calc = (carryBit << 7) | mem >> 1
-        self.R.ZERO = (calc == 0) & 1
+        hl = self.R.HL
+        mem = self.mmu.get_memory(hl)
+        carry = mem & 1
+        final = carry << 7 | mem >> 1
+        self.mmu.set_memory(hl, final)
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.mmu.set_memory(self.R.HL, calc)
+        self.R.CARRY = carry
         return 16
 
     def RRC_CB0F(self) -> int:
         """RRC A"""
-        carryBit = self.R.A & 1
-        calc = (carryBit << 7) | self.R.A >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.A & 1
+        final = carry << 7 | self.R.A >> 1
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.A = calc
+        self.R.CARRY = carry
         return 8
 
     def RL_CB10(self) -> int:
         """RL B"""
-        carryBit = self.R.B >> 7
-        calc = (self.R.B << 1) & 0b11111110 | self.R.CARRY
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.B >> 7
+        final = (self.R.B << 1) & 0xFF | self.R.CARRY
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.B = calc
+        self.R.CARRY = carry
         return 8
 
     def RL_CB11(self) -> int:
         """RL C"""
-        carryBit = self.R.C >> 7
-        calc = (self.R.C << 1) & 0b11111110 | self.R.CARRY
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.C >> 7
+        final = (self.R.C << 1) & 0xFF | self.R.CARRY
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.C = calc
+        self.R.CARRY = carry
         return 8
 
     def RL_CB12(self) -> int:
         """RL D"""
-        carryBit = self.R.D >> 7
-        calc = (self.R.D << 1) & 0b11111110 | self.R.CARRY
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.D >> 7
+        final = (self.R.D << 1) & 0xFF | self.R.CARRY
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.D = calc
+        self.R.CARRY = carry
         return 8
 
     def RL_CB13(self) -> int:
         """RL E"""
-        carryBit = self.R.E >> 7
-        calc = (self.R.E << 1) & 0b11111110 | self.R.CARRY
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.E >> 7
+        final = (self.R.E << 1) & 0xFF | self.R.CARRY
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.E = calc
+        self.R.CARRY = carry
         return 8
 
     def RL_CB14(self) -> int:
         """RL H"""
-        carryBit = self.R.H >> 7
-        calc = (self.R.H << 1) & 0b11111110 | self.R.CARRY
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.H >> 7
+        final = (self.R.H << 1) & 0xFF | self.R.CARRY
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.H = calc
+        self.R.CARRY = carry
         return 8
 
     def RL_CB15(self) -> int:
         """RL L"""
-        carryBit = self.R.L >> 7
-        calc = (self.R.L << 1) & 0b11111110 | self.R.CARRY
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.L >> 7
+        final = (self.R.L << 1) & 0xFF | self.R.CARRY
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.L = calc
+        self.R.CARRY = carry
         return 8
 
     def RL_CB16(self) -> int:
         """RL [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        carryBit = mem >> 7
-        calc = (mem << 1) & 0b11111110 | self.R.CARRY
-        self.R.ZERO = (calc == 0) & 1
+        hl = self.R.HL
+        mem = self.mmu.get_memory(hl)
+        carry = mem >> 7
+        final = (mem << 1) & 0xFF | self.R.CARRY
+        self.mmu.set_memory(hl, final)
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.mmu.set_memory(self.R.HL, calc)
+        self.R.CARRY = carry
         return 16
 
     def RL_CB17(self) -> int:
         """RL A"""
-        carryBit = self.R.A >> 7
-        calc = (self.R.A << 1) & 0b11111110 | self.R.CARRY
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.A >> 7
+        final = (self.R.A << 1) & 0xFF | self.R.CARRY
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.A = calc
+        self.R.CARRY = carry
         return 8
 
     def RR_CB18(self) -> int:
         """RR B"""
-        carryBit = self.R.B & 1
-        calc = (self.R.CARRY << 7) | self.R.B >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.B & 1
+        final = self.R.CARRY << 7 | self.R.B >> 1
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.B = calc
+        self.R.CARRY = carry
         return 8
 
     def RR_CB19(self) -> int:
         """RR C"""
-        carryBit = self.R.C & 1
-        calc = (self.R.CARRY << 7) | self.R.C >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.C & 1
+        final = self.R.CARRY << 7 | self.R.C >> 1
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.C = calc
+        self.R.CARRY = carry
         return 8
 
     def RR_CB1A(self) -> int:
         """RR D"""
-        carryBit = self.R.D & 1
-        calc = (self.R.CARRY << 7) | self.R.D >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.D & 1
+        final = self.R.CARRY << 7 | self.R.D >> 1
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.D = calc
+        self.R.CARRY = carry
         return 8
 
     def RR_CB1B(self) -> int:
         """RR E"""
-        carryBit = self.R.E & 1
-        calc = (self.R.CARRY << 7) | self.R.E >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.E & 1
+        final = self.R.CARRY << 7 | self.R.E >> 1
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.E = calc
+        self.R.CARRY = carry
         return 8
 
     def RR_CB1C(self) -> int:
         """RR H"""
-        carryBit = self.R.H & 1
-        calc = (self.R.CARRY << 7) | self.R.H >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.H & 1
+        final = self.R.CARRY << 7 | self.R.H >> 1
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.H = calc
+        self.R.CARRY = carry
         return 8
 
     def RR_CB1D(self) -> int:
         """RR L"""
-        carryBit = self.R.L & 1
-        calc = (self.R.CARRY << 7) | self.R.L >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.L & 1
+        final = self.R.CARRY << 7 | self.R.L >> 1
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.L = calc
+        self.R.CARRY = carry
         return 8
 
     def RR_CB1E(self) -> int:
         """RR [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        carryBit = mem & 1
-        calc = (self.R.CARRY << 7) | mem >> 1
-        self.R.ZERO = (calc == 0) & 1
+        hl = self.R.HL
+        mem = self.mmu.get_memory(hl)
+        carry = mem & 1
+        final = self.R.CARRY << 7 | mem >> 1
+        self.mmu.set_memory(hl, final)
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.mmu.set_memory(self.R.HL, calc)
+        self.R.CARRY = carry
         return 16
 
     def RR_CB1F(self) -> int:
         """RR A"""
-        carryBit = self.R.A & 1
-        calc = (self.R.CARRY << 7) | self.R.A >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.A & 1
+        final = self.R.CARRY << 7 | self.R.A >> 1
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.A = calc
+        self.R.CARRY = carry
         return 8
 
     def SLA_CB20(self) -> int:
         """SLA B"""
-        carryBit = self.R.B >> 7
-        calc = (self.R.B << 1) & 0b11111110
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.B >> 7
+        final = (self.R.B << 1) & 0xFF
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.B = calc
+        self.R.CARRY = carry
         return 8
 
     def SLA_CB21(self) -> int:
         """SLA C"""
-        carryBit = self.R.C >> 7
-        calc = (self.R.C << 1) & 0b11111110
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.C >> 7
+        final = (self.R.C << 1) & 0xFF
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.C = calc
+        self.R.CARRY = carry
         return 8
 
     def SLA_CB22(self) -> int:
         """SLA D"""
-        carryBit = self.R.D >> 7
-        calc = (self.R.D << 1) & 0b11111110
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.D >> 7
+        final = (self.R.D << 1) & 0xFF
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.D = calc
+        self.R.CARRY = carry
         return 8
 
     def SLA_CB23(self) -> int:
         """SLA E"""
-        carryBit = self.R.E >> 7
-        calc = (self.R.E << 1) & 0b11111110
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.E >> 7
+        final = (self.R.E << 1) & 0xFF
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.E = calc
+        self.R.CARRY = carry
         return 8
 
     def SLA_CB24(self) -> int:
         """SLA H"""
-        carryBit = self.R.H >> 7
-        calc = (self.R.H << 1) & 0b11111110
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.H >> 7
+        final = (self.R.H << 1) & 0xFF
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.H = calc
+        self.R.CARRY = carry
         return 8
 
     def SLA_CB25(self) -> int:
         """SLA L"""
-        carryBit = self.R.L >> 7
-        calc = (self.R.L << 1) & 0b11111110
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.L >> 7
+        final = (self.R.L << 1) & 0xFF
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.L = calc
+        self.R.CARRY = carry
         return 8
 
     def SLA_CB26(self) -> int:
         """SLA [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        carryBit = mem >> 7
-        calc = (mem << 1) & 0b11111110
-        self.R.ZERO = (calc == 0) & 1
+        hl = self.R.HL
+        mem = self.mmu.get_memory(hl)
+        carry = mem >> 7
+        final = (mem << 1) & 0xFF
+        self.mmu.set_memory(hl, final)
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.mmu.set_memory(self.R.HL, calc)
+        self.R.CARRY = carry
         return 16
 
     def SLA_CB27(self) -> int:
         """SLA A"""
-        carryBit = self.R.A >> 7
-        calc = (self.R.A << 1) & 0b11111110
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.A >> 7
+        final = (self.R.A << 1) & 0xFF
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.A = calc
+        self.R.CARRY = carry
         return 8
 
     def SRA_CB28(self) -> int:
         """SRA B"""
-        carryBit = self.R.B & 1
-        calc = (self.R.B >> 7) << 7 | self.R.B >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.B & 1
+        final = self.R.B & 0x80 | self.R.B >> 1
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.B = calc
+        self.R.CARRY = carry
         return 8
 
     def SRA_CB29(self) -> int:
         """SRA C"""
-        carryBit = self.R.C & 1
-        calc = (self.R.C >> 7) << 7 | self.R.C >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.C & 1
+        final = self.R.C & 0x80 | self.R.C >> 1
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.C = calc
+        self.R.CARRY = carry
         return 8
 
     def SRA_CB2A(self) -> int:
         """SRA D"""
-        carryBit = self.R.D & 1
-        calc = (self.R.D >> 7) << 7 | self.R.D >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.D & 1
+        final = self.R.D & 0x80 | self.R.D >> 1
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.D = calc
+        self.R.CARRY = carry
         return 8
 
     def SRA_CB2B(self) -> int:
         """SRA E"""
-        carryBit = self.R.E & 1
-        calc = (self.R.E >> 7) << 7 | self.R.E >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.E & 1
+        final = self.R.E & 0x80 | self.R.E >> 1
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.E = calc
+        self.R.CARRY = carry
         return 8
 
     def SRA_CB2C(self) -> int:
         """SRA H"""
-        carryBit = self.R.H & 1
-        calc = (self.R.H >> 7) << 7 | self.R.H >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.H & 1
+        final = self.R.H & 0x80 | self.R.H >> 1
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.H = calc
+        self.R.CARRY = carry
         return 8
 
     def SRA_CB2D(self) -> int:
         """SRA L"""
-        carryBit = self.R.L & 1
-        calc = (self.R.L >> 7) << 7 | self.R.L >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.L & 1
+        final = self.R.L & 0x80 | self.R.L >> 1
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.L = calc
+        self.R.CARRY = carry
         return 8
 
     def SRA_CB2E(self) -> int:
         """SRA [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        carryBit = mem & 1
-        calc = (mem >> 7) << 7 | mem >> 1
-        self.R.ZERO = (calc == 0) & 1
+        hl = self.R.HL
+        mem = self.mmu.get_memory(hl)
+        carry = mem & 1
+        final = mem & 0x80 | mem >> 1
+        self.mmu.set_memory(hl, final)
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.mmu.set_memory(self.R.HL, calc)
+        self.R.CARRY = carry
         return 16
 
     def SRA_CB2F(self) -> int:
         """SRA A"""
-        carryBit = self.R.A & 1
-        calc = (self.R.A >> 7) << 7 | self.R.A >> 1
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.A & 1
+        final = self.R.A & 0x80 | self.R.A >> 1
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.A = calc
+        self.R.CARRY = carry
         return 8
 
     def SWAP_CB30(self) -> int:
         """SWAP B"""
-        calc = (self.R.B & 0b1111) << 4 | (self.R.B >> 4)
-        self.R.ZERO = (calc == 0) & 1
+        final = (self.R.B & 0xF) << 4 | self.R.B >> 4
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
-        self.R.B = calc
         return 8
 
     def SWAP_CB31(self) -> int:
         """SWAP C"""
-        calc = (self.R.C & 0b1111) << 4 | (self.R.C >> 4)
-        self.R.ZERO = (calc == 0) & 1
+        final = (self.R.C & 0xF) << 4 | self.R.C >> 4
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
-        self.R.C = calc
         return 8
 
     def SWAP_CB32(self) -> int:
         """SWAP D"""
-        calc = (self.R.D & 0b1111) << 4 | (self.R.D >> 4)
-        self.R.ZERO = (calc == 0) & 1
+        final = (self.R.D & 0xF) << 4 | self.R.D >> 4
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
-        self.R.D = calc
         return 8
 
     def SWAP_CB33(self) -> int:
         """SWAP E"""
-        calc = (self.R.E & 0b1111) << 4 | (self.R.E >> 4)
-        self.R.ZERO = (calc == 0) & 1
+        final = (self.R.E & 0xF) << 4 | self.R.E >> 4
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
-        self.R.E = calc
         return 8
 
     def SWAP_CB34(self) -> int:
         """SWAP H"""
-        calc = (self.R.H & 0b1111) << 4 | (self.R.H >> 4)
-        self.R.ZERO = (calc == 0) & 1
+        final = (self.R.H & 0xF) << 4 | self.R.H >> 4
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
-        self.R.H = calc
         return 8
 
     def SWAP_CB35(self) -> int:
         """SWAP L"""
-        calc = (self.R.L & 0b1111) << 4 | (self.R.L >> 4)
-        self.R.ZERO = (calc == 0) & 1
+        final = (self.R.L & 0xF) << 4 | self.R.L >> 4
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
-        self.R.L = calc
         return 8
 
     def SWAP_CB36(self) -> int:
         """SWAP [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        calc = (mem & 0b1111) << 4 | (mem >> 4)
-        self.R.ZERO = (calc == 0) & 1
+        hl = self.R.HL
+        mem = self.mmu.get_memory(hl)
+        final = (mem & 0xF) << 4 | mem >> 4
+        self.mmu.set_memory(hl, final)
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
-        self.mmu.set_memory(self.R.HL, calc)
         return 16
 
     def SWAP_CB37(self) -> int:
         """SWAP A"""
-        calc = (self.R.A & 0b1111) << 4 | (self.R.A >> 4)
-        self.R.ZERO = (calc == 0) & 1
+        final = (self.R.A & 0xF) << 4 | self.R.A >> 4
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
         self.R.CARRY = 0
-        self.R.A = calc
         return 8
 
     def SRL_CB38(self) -> int:
         """SRL B"""
-        carryBit = self.R.B & 1
-        calc = self.R.B >> 1 & 0b011111111
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.B & 1
+        final = self.R.B >> 1
+        self.R.B = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.B = calc
+        self.R.CARRY = carry
         return 8
 
     def SRL_CB39(self) -> int:
         """SRL C"""
-        carryBit = self.R.C & 1
-        calc = self.R.C >> 1 & 0b011111111
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.C & 1
+        final = self.R.C >> 1
+        self.R.C = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.C = calc
+        self.R.CARRY = carry
         return 8
 
     def SRL_CB3A(self) -> int:
         """SRL D"""
-        carryBit = self.R.D & 1
-        calc = self.R.D >> 1 & 0b011111111
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.D & 1
+        final = self.R.D >> 1
+        self.R.D = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.D = calc
+        self.R.CARRY = carry
         return 8
 
     def SRL_CB3B(self) -> int:
         """SRL E"""
-        carryBit = self.R.E & 1
-        calc = self.R.E >> 1 & 0b011111111
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.E & 1
+        final = self.R.E >> 1
+        self.R.E = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.E = calc
+        self.R.CARRY = carry
         return 8
 
     def SRL_CB3C(self) -> int:
         """SRL H"""
-        carryBit = self.R.H & 1
-        calc = self.R.H >> 1 & 0b011111111
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.H & 1
+        final = self.R.H >> 1
+        self.R.H = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.H = calc
+        self.R.CARRY = carry
         return 8
 
     def SRL_CB3D(self) -> int:
         """SRL L"""
-        carryBit = self.R.L & 1
-        calc = self.R.L >> 1 & 0b011111111
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.L & 1
+        final = self.R.L >> 1
+        self.R.L = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.L = calc
+        self.R.CARRY = carry
         return 8
 
     def SRL_CB3E(self) -> int:
         """SRL [HL]"""
-        mem = self.mmu.get_memory(self.R.HL)
-        carryBit = mem & 1
-        calc = mem >> 1 & 0b011111111
-        self.R.ZERO = (calc == 0) & 1
+        hl = self.R.HL
+        mem = self.mmu.get_memory(hl)
+        carry = mem & 1
+        final = mem >> 1
+        self.mmu.set_memory(hl, final)
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.mmu.set_memory(self.R.HL, calc)
+        self.R.CARRY = carry
         return 16
 
     def SRL_CB3F(self) -> int:
         """SRL A"""
-        carryBit = self.R.A & 1
-        calc = self.R.A >> 1 & 0b011111111
-        self.R.ZERO = (calc == 0) & 1
+        carry = self.R.A & 1
+        final = self.R.A >> 1
+        self.R.A = final
+        self.R.ZERO = (final == 0) & 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 0
-        self.R.CARRY = carryBit
-        self.R.A = calc
+        self.R.CARRY = carry
         return 8
 
     def BIT_CB40(self) -> int:
-        """BIT 0,B"""
-        value = 0
-        calc = self.R.B >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 0, B"""
+        self.R.ZERO = (self.R.B >> 0 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB41(self) -> int:
-        """BIT 0,C"""
-        value = 0
-        calc = self.R.C >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 0, C"""
+        self.R.ZERO = (self.R.C >> 0 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB42(self) -> int:
-        """BIT 0,D"""
-        value = 0
-        calc = self.R.D >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 0, D"""
+        self.R.ZERO = (self.R.D >> 0 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB43(self) -> int:
-        """BIT 0,E"""
-        value = 0
-        calc = self.R.E >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 0, E"""
+        self.R.ZERO = (self.R.E >> 0 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB44(self) -> int:
-        """BIT 0,H"""
-        value = 0
-        calc = self.R.H >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 0, H"""
+        self.R.ZERO = (self.R.H >> 0 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB45(self) -> int:
-        """BIT 0,L"""
-        value = 0
-        calc = self.R.L >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 0, L"""
+        self.R.ZERO = (self.R.L >> 0 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB46(self) -> int:
-        """BIT 0,[HL]"""
-        value = 0
-        calc = self.mmu.get_memory(self.R.HL) >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 0, [HL]"""
+        self.R.ZERO = (self.mmu.get_memory(self.R.HL) >> 0 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 12
 
     def BIT_CB47(self) -> int:
-        """BIT 0,A"""
-        value = 0
-        calc = self.R.A >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 0, A"""
+        self.R.ZERO = (self.R.A >> 0 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB48(self) -> int:
-        """BIT 1,B"""
-        value = 1
-        calc = self.R.B >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 1, B"""
+        self.R.ZERO = (self.R.B >> 1 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB49(self) -> int:
-        """BIT 1,C"""
-        value = 1
-        calc = self.R.C >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 1, C"""
+        self.R.ZERO = (self.R.C >> 1 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB4A(self) -> int:
-        """BIT 1,D"""
-        value = 1
-        calc = self.R.D >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 1, D"""
+        self.R.ZERO = (self.R.D >> 1 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB4B(self) -> int:
-        """BIT 1,E"""
-        value = 1
-        calc = self.R.E >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 1, E"""
+        self.R.ZERO = (self.R.E >> 1 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB4C(self) -> int:
-        """BIT 1,H"""
-        value = 1
-        calc = self.R.H >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 1, H"""
+        self.R.ZERO = (self.R.H >> 1 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB4D(self) -> int:
-        """BIT 1,L"""
-        value = 1
-        calc = self.R.L >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 1, L"""
+        self.R.ZERO = (self.R.L >> 1 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB4E(self) -> int:
-        """BIT 1,[HL]"""
-        value = 1
-        calc = self.mmu.get_memory(self.R.HL) >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 1, [HL]"""
+        self.R.ZERO = (self.mmu.get_memory(self.R.HL) >> 1 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 12
 
     def BIT_CB4F(self) -> int:
-        """BIT 1,A"""
-        value = 1
-        calc = self.R.A >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 1, A"""
+        self.R.ZERO = (self.R.A >> 1 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB50(self) -> int:
-        """BIT 2,B"""
-        value = 2
-        calc = self.R.B >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 2, B"""
+        self.R.ZERO = (self.R.B >> 2 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB51(self) -> int:
-        """BIT 2,C"""
-        value = 2
-        calc = self.R.C >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 2, C"""
+        self.R.ZERO = (self.R.C >> 2 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB52(self) -> int:
-        """BIT 2,D"""
-        value = 2
-        calc = self.R.D >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 2, D"""
+        self.R.ZERO = (self.R.D >> 2 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB53(self) -> int:
-        """BIT 2,E"""
-        value = 2
-        calc = self.R.E >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 2, E"""
+        self.R.ZERO = (self.R.E >> 2 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB54(self) -> int:
-        """BIT 2,H"""
-        value = 2
-        calc = self.R.H >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 2, H"""
+        self.R.ZERO = (self.R.H >> 2 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB55(self) -> int:
-        """BIT 2,L"""
-        value = 2
-        calc = self.R.L >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 2, L"""
+        self.R.ZERO = (self.R.L >> 2 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB56(self) -> int:
-        """BIT 2,[HL]"""
-        value = 2
-        calc = self.mmu.get_memory(self.R.HL) >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 2, [HL]"""
+        self.R.ZERO = (self.mmu.get_memory(self.R.HL) >> 2 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 12
 
     def BIT_CB57(self) -> int:
-        """BIT 2,A"""
-        value = 2
-        calc = self.R.A >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 2, A"""
+        self.R.ZERO = (self.R.A >> 2 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB58(self) -> int:
-        """BIT 3,B"""
-        value = 3
-        calc = self.R.B >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 3, B"""
+        self.R.ZERO = (self.R.B >> 3 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB59(self) -> int:
-        """BIT 3,C"""
-        value = 3
-        calc = self.R.C >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 3, C"""
+        self.R.ZERO = (self.R.C >> 3 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB5A(self) -> int:
-        """BIT 3,D"""
-        value = 3
-        calc = self.R.D >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 3, D"""
+        self.R.ZERO = (self.R.D >> 3 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB5B(self) -> int:
-        """BIT 3,E"""
-        value = 3
-        calc = self.R.E >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 3, E"""
+        self.R.ZERO = (self.R.E >> 3 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB5C(self) -> int:
-        """BIT 3,H"""
-        value = 3
-        calc = self.R.H >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 3, H"""
+        self.R.ZERO = (self.R.H >> 3 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB5D(self) -> int:
-        """BIT 3,L"""
-        value = 3
-        calc = self.R.L >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 3, L"""
+        self.R.ZERO = (self.R.L >> 3 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB5E(self) -> int:
-        """BIT 3,[HL]"""
-        value = 3
-        calc = self.mmu.get_memory(self.R.HL) >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 3, [HL]"""
+        self.R.ZERO = (self.mmu.get_memory(self.R.HL) >> 3 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 12
 
     def BIT_CB5F(self) -> int:
-        """BIT 3,A"""
-        value = 3
-        calc = self.R.A >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 3, A"""
+        self.R.ZERO = (self.R.A >> 3 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB60(self) -> int:
-        """BIT 4,B"""
-        value = 4
-        calc = self.R.B >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 4, B"""
+        self.R.ZERO = (self.R.B >> 4 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB61(self) -> int:
-        """BIT 4,C"""
-        value = 4
-        calc = self.R.C >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 4, C"""
+        self.R.ZERO = (self.R.C >> 4 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB62(self) -> int:
-        """BIT 4,D"""
-        value = 4
-        calc = self.R.D >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 4, D"""
+        self.R.ZERO = (self.R.D >> 4 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB63(self) -> int:
-        """BIT 4,E"""
-        value = 4
-        calc = self.R.E >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 4, E"""
+        self.R.ZERO = (self.R.E >> 4 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB64(self) -> int:
-        """BIT 4,H"""
-        value = 4
-        calc = self.R.H >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 4, H"""
+        self.R.ZERO = (self.R.H >> 4 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB65(self) -> int:
-        """BIT 4,L"""
-        value = 4
-        calc = self.R.L >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 4, L"""
+        self.R.ZERO = (self.R.L >> 4 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB66(self) -> int:
-        """BIT 4,[HL]"""
-        value = 4
-        calc = self.mmu.get_memory(self.R.HL) >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 4, [HL]"""
+        self.R.ZERO = (self.mmu.get_memory(self.R.HL) >> 4 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 12
 
     def BIT_CB67(self) -> int:
-        """BIT 4,A"""
-        value = 4
-        calc = self.R.A >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 4, A"""
+        self.R.ZERO = (self.R.A >> 4 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB68(self) -> int:
-        """BIT 5,B"""
-        value = 5
-        calc = self.R.B >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 5, B"""
+        self.R.ZERO = (self.R.B >> 5 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB69(self) -> int:
-        """BIT 5,C"""
-        value = 5
-        calc = self.R.C >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 5, C"""
+        self.R.ZERO = (self.R.C >> 5 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB6A(self) -> int:
-        """BIT 5,D"""
-        value = 5
-        calc = self.R.D >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 5, D"""
+        self.R.ZERO = (self.R.D >> 5 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB6B(self) -> int:
-        """BIT 5,E"""
-        value = 5
-        calc = self.R.E >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 5, E"""
+        self.R.ZERO = (self.R.E >> 5 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB6C(self) -> int:
-        """BIT 5,H"""
-        value = 5
-        calc = self.R.H >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 5, H"""
+        self.R.ZERO = (self.R.H >> 5 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB6D(self) -> int:
-        """BIT 5,L"""
-        value = 5
-        calc = self.R.L >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 5, L"""
+        self.R.ZERO = (self.R.L >> 5 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB6E(self) -> int:
-        """BIT 5,[HL]"""
-        value = 5
-        calc = self.mmu.get_memory(self.R.HL) >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 5, [HL]"""
+        self.R.ZERO = (self.mmu.get_memory(self.R.HL) >> 5 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 12
 
     def BIT_CB6F(self) -> int:
-        """BIT 5,A"""
-        value = 5
-        calc = self.R.A >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 5, A"""
+        self.R.ZERO = (self.R.A >> 5 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB70(self) -> int:
-        """BIT 6,B"""
-        value = 6
-        calc = self.R.B >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 6, B"""
+        self.R.ZERO = (self.R.B >> 6 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB71(self) -> int:
-        """BIT 6,C"""
-        value = 6
-        calc = self.R.C >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 6, C"""
+        self.R.ZERO = (self.R.C >> 6 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB72(self) -> int:
-        """BIT 6,D"""
-        value = 6
-        calc = self.R.D >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 6, D"""
+        self.R.ZERO = (self.R.D >> 6 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB73(self) -> int:
-        """BIT 6,E"""
-        value = 6
-        calc = self.R.E >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 6, E"""
+        self.R.ZERO = (self.R.E >> 6 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB74(self) -> int:
-        """BIT 6,H"""
-        value = 6
-        calc = self.R.H >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 6, H"""
+        self.R.ZERO = (self.R.H >> 6 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB75(self) -> int:
-        """BIT 6,L"""
-        value = 6
-        calc = self.R.L >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 6, L"""
+        self.R.ZERO = (self.R.L >> 6 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB76(self) -> int:
-        """BIT 6,[HL]"""
-        value = 6
-        calc = self.mmu.get_memory(self.R.HL) >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 6, [HL]"""
+        self.R.ZERO = (self.mmu.get_memory(self.R.HL) >> 6 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 12
 
     def BIT_CB77(self) -> int:
-        """BIT 6,A"""
-        value = 6
-        calc = self.R.A >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 6, A"""
+        self.R.ZERO = (self.R.A >> 6 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB78(self) -> int:
-        """BIT 7,B"""
-        value = 7
-        calc = self.R.B >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 7, B"""
+        self.R.ZERO = (self.R.B >> 7 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB79(self) -> int:
-        """BIT 7,C"""
-        value = 7
-        calc = self.R.C >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 7, C"""
+        self.R.ZERO = (self.R.C >> 7 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB7A(self) -> int:
-        """BIT 7,D"""
-        value = 7
-        calc = self.R.D >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 7, D"""
+        self.R.ZERO = (self.R.D >> 7 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB7B(self) -> int:
-        """BIT 7,E"""
-        value = 7
-        calc = self.R.E >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 7, E"""
+        self.R.ZERO = (self.R.E >> 7 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB7C(self) -> int:
-        """BIT 7,H"""
-        value = 7
-        calc = self.R.H >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 7, H"""
+        self.R.ZERO = (self.R.H >> 7 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB7D(self) -> int:
-        """BIT 7,L"""
-        value = 7
-        calc = self.R.L >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 7, L"""
+        self.R.ZERO = (self.R.L >> 7 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def BIT_CB7E(self) -> int:
-        """BIT 7,[HL]"""
-        value = 7
-        calc = self.mmu.get_memory(self.R.HL) >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 7, [HL]"""
+        self.R.ZERO = (self.mmu.get_memory(self.R.HL) >> 7 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 12
 
     def BIT_CB7F(self) -> int:
-        """BIT 7,A"""
-        value = 7
-        calc = self.R.A >> (value) & 0b1
-        self.R.ZERO = (calc == 0) & 1
+        """BIT 7, A"""
+        self.R.ZERO = (self.R.A >> 7 & 1) ^ 1
         self.R.SUBTRACTION = 0
         self.R.HALFCARRY = 1
         return 8
 
     def RES_CB80(self) -> int:
-        """RES 0,B"""
-        value = 0
-        higher = self.R.B >> value + 1 << value + 1
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """RES 0, B"""
+        self.R.B = self.R.B & ~(1 << 0)
         return 8
 
     def RES_CB81(self) -> int:
-        """RES 0,C"""
-        value = 0
-        higher = self.R.C >> value + 1 << value + 1
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """RES 0, C"""
+        self.R.C = self.R.C & ~(1 << 0)
         return 8
 
     def RES_CB82(self) -> int:
-        """RES 0,D"""
-        value = 0
-        higher = self.R.D >> value + 1 << value + 1
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """RES 0, D"""
+        self.R.D = self.R.D & ~(1 << 0)
         return 8
 
     def RES_CB83(self) -> int:
-        """RES 0,E"""
-        value = 0
-        higher = self.R.E >> value + 1 << value + 1
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """RES 0, E"""
+        self.R.E = self.R.E & ~(1 << 0)
         return 8
 
     def RES_CB84(self) -> int:
-        """RES 0,H"""
-        value = 0
-        higher = self.R.H >> value + 1 << value + 1
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """RES 0, H"""
+        self.R.H = self.R.H & ~(1 << 0)
         return 8
 
     def RES_CB85(self) -> int:
-        """RES 0,L"""
-        value = 0
-        higher = self.R.L >> value + 1 << value + 1
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """RES 0, L"""
+        self.R.L = self.R.L & ~(1 << 0)
         return 8
 
     def RES_CB86(self) -> int:
-        """RES 0,[HL]"""
-        value = 0
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = mem >> value + 1 << value + 1
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """RES 0, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) & ~(1 << 0))
         return 16
 
     def RES_CB87(self) -> int:
-        """RES 0,A"""
-        value = 0
-        higher = self.R.A >> value + 1 << value + 1
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """RES 0, A"""
+        self.R.A = self.R.A & ~(1 << 0)
         return 8
 
     def RES_CB88(self) -> int:
-        """RES 1,B"""
-        value = 1
-        higher = self.R.B >> value + 1 << value + 1
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """RES 1, B"""
+        self.R.B = self.R.B & ~(1 << 1)
         return 8
 
     def RES_CB89(self) -> int:
-        """RES 1,C"""
-        value = 1
-        higher = self.R.C >> value + 1 << value + 1
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """RES 1, C"""
+        self.R.C = self.R.C & ~(1 << 1)
         return 8
 
     def RES_CB8A(self) -> int:
-        """RES 1,D"""
-        value = 1
-        higher = self.R.D >> value + 1 << value + 1
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """RES 1, D"""
+        self.R.D = self.R.D & ~(1 << 1)
         return 8
 
     def RES_CB8B(self) -> int:
-        """RES 1,E"""
-        value = 1
-        higher = self.R.E >> value + 1 << value + 1
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """RES 1, E"""
+        self.R.E = self.R.E & ~(1 << 1)
         return 8
 
     def RES_CB8C(self) -> int:
-        """RES 1,H"""
-        value = 1
-        higher = self.R.H >> value + 1 << value + 1
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """RES 1, H"""
+        self.R.H = self.R.H & ~(1 << 1)
         return 8
 
     def RES_CB8D(self) -> int:
-        """RES 1,L"""
-        value = 1
-        higher = self.R.L >> value + 1 << value + 1
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """RES 1, L"""
+        self.R.L = self.R.L & ~(1 << 1)
         return 8
 
     def RES_CB8E(self) -> int:
-        """RES 1,[HL]"""
-        value = 1
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = mem >> value + 1 << value + 1
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """RES 1, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) & ~(1 << 1))
         return 16
 
     def RES_CB8F(self) -> int:
-        """RES 1,A"""
-        value = 1
-        higher = self.R.A >> value + 1 << value + 1
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """RES 1, A"""
+        self.R.A = self.R.A & ~(1 << 1)
         return 8
 
     def RES_CB90(self) -> int:
-        """RES 2,B"""
-        value = 2
-        higher = self.R.B >> value + 1 << value + 1
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """RES 2, B"""
+        self.R.B = self.R.B & ~(1 << 2)
         return 8
 
     def RES_CB91(self) -> int:
-        """RES 2,C"""
-        value = 2
-        higher = self.R.C >> value + 1 << value + 1
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """RES 2, C"""
+        self.R.C = self.R.C & ~(1 << 2)
         return 8
 
     def RES_CB92(self) -> int:
-        """RES 2,D"""
-        value = 2
-        higher = self.R.D >> value + 1 << value + 1
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """RES 2, D"""
+        self.R.D = self.R.D & ~(1 << 2)
         return 8
 
     def RES_CB93(self) -> int:
-        """RES 2,E"""
-        value = 2
-        higher = self.R.E >> value + 1 << value + 1
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """RES 2, E"""
+        self.R.E = self.R.E & ~(1 << 2)
         return 8
 
     def RES_CB94(self) -> int:
-        """RES 2,H"""
-        value = 2
-        higher = self.R.H >> value + 1 << value + 1
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """RES 2, H"""
+        self.R.H = self.R.H & ~(1 << 2)
         return 8
 
     def RES_CB95(self) -> int:
-        """RES 2,L"""
-        value = 2
-        higher = self.R.L >> value + 1 << value + 1
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """RES 2, L"""
+        self.R.L = self.R.L & ~(1 << 2)
         return 8
 
     def RES_CB96(self) -> int:
-        """RES 2,[HL]"""
-        value = 2
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = mem >> value + 1 << value + 1
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """RES 2, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) & ~(1 << 2))
         return 16
 
     def RES_CB97(self) -> int:
-        """RES 2,A"""
-        value = 2
-        higher = self.R.A >> value + 1 << value + 1
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """RES 2, A"""
+        self.R.A = self.R.A & ~(1 << 2)
         return 8
 
     def RES_CB98(self) -> int:
-        """RES 3,B"""
-        value = 3
-        higher = self.R.B >> value + 1 << value + 1
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """RES 3, B"""
+        self.R.B = self.R.B & ~(1 << 3)
         return 8
 
     def RES_CB99(self) -> int:
-        """RES 3,C"""
-        value = 3
-        higher = self.R.C >> value + 1 << value + 1
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """RES 3, C"""
+        self.R.C = self.R.C & ~(1 << 3)
         return 8
 
     def RES_CB9A(self) -> int:
-        """RES 3,D"""
-        value = 3
-        higher = self.R.D >> value + 1 << value + 1
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """RES 3, D"""
+        self.R.D = self.R.D & ~(1 << 3)
         return 8
 
     def RES_CB9B(self) -> int:
-        """RES 3,E"""
-        value = 3
-        higher = self.R.E >> value + 1 << value + 1
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """RES 3, E"""
+        self.R.E = self.R.E & ~(1 << 3)
         return 8
 
     def RES_CB9C(self) -> int:
-        """RES 3,H"""
-        value = 3
-        higher = self.R.H >> value + 1 << value + 1
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """RES 3, H"""
+        self.R.H = self.R.H & ~(1 << 3)
         return 8
 
     def RES_CB9D(self) -> int:
-        """RES 3,L"""
-        value = 3
-        higher = self.R.L >> value + 1 << value + 1
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """RES 3, L"""
+        self.R.L = self.R.L & ~(1 << 3)
         return 8
 
     def RES_CB9E(self) -> int:
-        """RES 3,[HL]"""
-        value = 3
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = mem >> value + 1 << value + 1
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """RES 3, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) & ~(1 << 3))
         return 16
 
     def RES_CB9F(self) -> int:
-        """RES 3,A"""
-        value = 3
-        higher = self.R.A >> value + 1 << value + 1
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """RES 3, A"""
+        self.R.A = self.R.A & ~(1 << 3)
         return 8
 
     def RES_CBA0(self) -> int:
-        """RES 4,B"""
-        value = 4
-        higher = self.R.B >> value + 1 << value + 1
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """RES 4, B"""
+        self.R.B = self.R.B & ~(1 << 4)
         return 8
 
     def RES_CBA1(self) -> int:
-        """RES 4,C"""
-        value = 4
-        higher = self.R.C >> value + 1 << value + 1
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """RES 4, C"""
+        self.R.C = self.R.C & ~(1 << 4)
         return 8
 
     def RES_CBA2(self) -> int:
-        """RES 4,D"""
-        value = 4
-        higher = self.R.D >> value + 1 << value + 1
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """RES 4, D"""
+        self.R.D = self.R.D & ~(1 << 4)
         return 8
 
     def RES_CBA3(self) -> int:
-        """RES 4,E"""
-        value = 4
-        higher = self.R.E >> value + 1 << value + 1
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """RES 4, E"""
+        self.R.E = self.R.E & ~(1 << 4)
         return 8
 
     def RES_CBA4(self) -> int:
-        """RES 4,H"""
-        value = 4
-        higher = self.R.H >> value + 1 << value + 1
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """RES 4, H"""
+        self.R.H = self.R.H & ~(1 << 4)
         return 8
 
     def RES_CBA5(self) -> int:
-        """RES 4,L"""
-        value = 4
-        higher = self.R.L >> value + 1 << value + 1
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """RES 4, L"""
+        self.R.L = self.R.L & ~(1 << 4)
         return 8
 
     def RES_CBA6(self) -> int:
-        """RES 4,[HL]"""
-        value = 4
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = mem >> value + 1 << value + 1
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """RES 4, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) & ~(1 << 4))
         return 16
 
     def RES_CBA7(self) -> int:
-        """RES 4,A"""
-        value = 4
-        higher = self.R.A >> value + 1 << value + 1
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """RES 4, A"""
+        self.R.A = self.R.A & ~(1 << 4)
         return 8
 
     def RES_CBA8(self) -> int:
-        """RES 5,B"""
-        value = 5
-        higher = self.R.B >> value + 1 << value + 1
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """RES 5, B"""
+        self.R.B = self.R.B & ~(1 << 5)
         return 8
 
     def RES_CBA9(self) -> int:
-        """RES 5,C"""
-        value = 5
-        higher = self.R.C >> value + 1 << value + 1
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """RES 5, C"""
+        self.R.C = self.R.C & ~(1 << 5)
         return 8
 
     def RES_CBAA(self) -> int:
-        """RES 5,D"""
-        value = 5
-        higher = self.R.D >> value + 1 << value + 1
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """RES 5, D"""
+        self.R.D = self.R.D & ~(1 << 5)
         return 8
 
     def RES_CBAB(self) -> int:
-        """RES 5,E"""
-        value = 5
-        higher = self.R.E >> value + 1 << value + 1
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """RES 5, E"""
+        self.R.E = self.R.E & ~(1 << 5)
         return 8
 
     def RES_CBAC(self) -> int:
-        """RES 5,H"""
-        value = 5
-        higher = self.R.H >> value + 1 << value + 1
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """RES 5, H"""
+        self.R.H = self.R.H & ~(1 << 5)
         return 8
 
     def RES_CBAD(self) -> int:
-        """RES 5,L"""
-        value = 5
-        higher = self.R.L >> value + 1 << value + 1
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """RES 5, L"""
+        self.R.L = self.R.L & ~(1 << 5)
         return 8
 
     def RES_CBAE(self) -> int:
-        """RES 5,[HL]"""
-        value = 5
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = mem >> value + 1 << value + 1
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """RES 5, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) & ~(1 << 5))
         return 16
 
     def RES_CBAF(self) -> int:
-        """RES 5,A"""
-        value = 5
-        higher = self.R.A >> value + 1 << value + 1
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """RES 5, A"""
+        self.R.A = self.R.A & ~(1 << 5)
         return 8
 
     def RES_CBB0(self) -> int:
-        """RES 6,B"""
-        value = 6
-        higher = self.R.B >> value + 1 << value + 1
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """RES 6, B"""
+        self.R.B = self.R.B & ~(1 << 6)
         return 8
 
     def RES_CBB1(self) -> int:
-        """RES 6,C"""
-        value = 6
-        higher = self.R.C >> value + 1 << value + 1
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """RES 6, C"""
+        self.R.C = self.R.C & ~(1 << 6)
         return 8
 
     def RES_CBB2(self) -> int:
-        """RES 6,D"""
-        value = 6
-        higher = self.R.D >> value + 1 << value + 1
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """RES 6, D"""
+        self.R.D = self.R.D & ~(1 << 6)
         return 8
 
     def RES_CBB3(self) -> int:
-        """RES 6,E"""
-        value = 6
-        higher = self.R.E >> value + 1 << value + 1
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """RES 6, E"""
+        self.R.E = self.R.E & ~(1 << 6)
         return 8
 
     def RES_CBB4(self) -> int:
-        """RES 6,H"""
-        value = 6
-        higher = self.R.H >> value + 1 << value + 1
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """RES 6, H"""
+        self.R.H = self.R.H & ~(1 << 6)
         return 8
 
     def RES_CBB5(self) -> int:
-        """RES 6,L"""
-        value = 6
-        higher = self.R.L >> value + 1 << value + 1
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """RES 6, L"""
+        self.R.L = self.R.L & ~(1 << 6)
         return 8
 
     def RES_CBB6(self) -> int:
-        """RES 6,[HL]"""
-        value = 6
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = mem >> value + 1 << value + 1
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """RES 6, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) & ~(1 << 6))
         return 16
 
     def RES_CBB7(self) -> int:
-        """RES 6,A"""
-        value = 6
-        higher = self.R.A >> value + 1 << value + 1
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """RES 6, A"""
+        self.R.A = self.R.A & ~(1 << 6)
         return 8
 
     def RES_CBB8(self) -> int:
-        """RES 7,B"""
-        value = 7
-        higher = self.R.B >> value + 1 << value + 1
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """RES 7, B"""
+        self.R.B = self.R.B & ~(1 << 7)
         return 8
 
     def RES_CBB9(self) -> int:
-        """RES 7,C"""
-        value = 7
-        higher = self.R.C >> value + 1 << value + 1
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """RES 7, C"""
+        self.R.C = self.R.C & ~(1 << 7)
         return 8
 
     def RES_CBBA(self) -> int:
-        """RES 7,D"""
-        value = 7
-        higher = self.R.D >> value + 1 << value + 1
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """RES 7, D"""
+        self.R.D = self.R.D & ~(1 << 7)
         return 8
 
     def RES_CBBB(self) -> int:
-        """RES 7,E"""
-        value = 7
-        higher = self.R.E >> value + 1 << value + 1
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """RES 7, E"""
+        self.R.E = self.R.E & ~(1 << 7)
         return 8
 
     def RES_CBBC(self) -> int:
-        """RES 7,H"""
-        value = 7
-        higher = self.R.H >> value + 1 << value + 1
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """RES 7, H"""
+        self.R.H = self.R.H & ~(1 << 7)
         return 8
 
     def RES_CBBD(self) -> int:
-        """RES 7,L"""
-        value = 7
-        higher = self.R.L >> value + 1 << value + 1
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """RES 7, L"""
+        self.R.L = self.R.L & ~(1 << 7)
         return 8
 
     def RES_CBBE(self) -> int:
-        """RES 7,[HL]"""
-        value = 7
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = mem >> value + 1 << value + 1
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """RES 7, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) & ~(1 << 7))
         return 16
 
     def RES_CBBF(self) -> int:
-        """RES 7,A"""
-        value = 7
-        higher = self.R.A >> value + 1 << value + 1
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """RES 7, A"""
+        self.R.A = self.R.A & ~(1 << 7)
         return 8
 
     def SET_CBC0(self) -> int:
-        """SET 0,B"""
-        value = 0
-        higher = ((self.R.B >> value) | 1) << value
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """SET 0, B"""
+        self.R.B = self.R.B | 1 << 0
         return 8
 
     def SET_CBC1(self) -> int:
-        """SET 0,C"""
-        value = 0
-        higher = ((self.R.C >> value) | 1) << value
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """SET 0, C"""
+        self.R.C = self.R.C | 1 << 0
         return 8
 
     def SET_CBC2(self) -> int:
-        """SET 0,D"""
-        value = 0
-        higher = ((self.R.D >> value) | 1) << value
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """SET 0, D"""
+        self.R.D = self.R.D | 1 << 0
         return 8
 
     def SET_CBC3(self) -> int:
-        """SET 0,E"""
-        value = 0
-        higher = ((self.R.E >> value) | 1) << value
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """SET 0, E"""
+        self.R.E = self.R.E | 1 << 0
         return 8
 
     def SET_CBC4(self) -> int:
-        """SET 0,H"""
-        value = 0
-        higher = ((self.R.H >> value) | 1) << value
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """SET 0, H"""
+        self.R.H = self.R.H | 1 << 0
         return 8
 
     def SET_CBC5(self) -> int:
-        """SET 0,L"""
-        value = 0
-        higher = ((self.R.L >> value) | 1) << value
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """SET 0, L"""
+        self.R.L = self.R.L | 1 << 0
         return 8
 
     def SET_CBC6(self) -> int:
-        """SET 0,[HL]"""
-        value = 0
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = ((mem >> value) | 1) << value
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """SET 0, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) | 1 << 0)
         return 16
 
     def SET_CBC7(self) -> int:
-        """SET 0,A"""
-        value = 0
-        higher = ((self.R.A >> value) | 1) << value
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """SET 0, A"""
+        self.R.A = self.R.A | 1 << 0
         return 8
 
     def SET_CBC8(self) -> int:
-        """SET 1,B"""
-        value = 1
-        higher = ((self.R.B >> value) | 1) << value
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """SET 1, B"""
+        self.R.B = self.R.B | 1 << 1
         return 8
 
     def SET_CBC9(self) -> int:
-        """SET 1,C"""
-        value = 1
-        higher = ((self.R.C >> value) | 1) << value
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """SET 1, C"""
+        self.R.C = self.R.C | 1 << 1
         return 8
 
     def SET_CBCA(self) -> int:
-        """SET 1,D"""
-        value = 1
-        higher = ((self.R.D >> value) | 1) << value
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """SET 1, D"""
+        self.R.D = self.R.D | 1 << 1
         return 8
 
     def SET_CBCB(self) -> int:
-        """SET 1,E"""
-        value = 1
-        higher = ((self.R.E >> value) | 1) << value
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """SET 1, E"""
+        self.R.E = self.R.E | 1 << 1
         return 8
 
     def SET_CBCC(self) -> int:
-        """SET 1,H"""
-        value = 1
-        higher = ((self.R.H >> value) | 1) << value
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """SET 1, H"""
+        self.R.H = self.R.H | 1 << 1
         return 8
 
     def SET_CBCD(self) -> int:
-        """SET 1,L"""
-        value = 1
-        higher = ((self.R.L >> value) | 1) << value
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """SET 1, L"""
+        self.R.L = self.R.L | 1 << 1
         return 8
 
     def SET_CBCE(self) -> int:
-        """SET 1,[HL]"""
-        value = 1
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = ((mem >> value) | 1) << value
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """SET 1, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) | 1 << 1)
         return 16
 
     def SET_CBCF(self) -> int:
-        """SET 1,A"""
-        value = 1
-        higher = ((self.R.A >> value) | 1) << value
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """SET 1, A"""
+        self.R.A = self.R.A | 1 << 1
         return 8
 
     def SET_CBD0(self) -> int:
-        """SET 2,B"""
-        value = 2
-        higher = ((self.R.B >> value) | 1) << value
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """SET 2, B"""
+        self.R.B = self.R.B | 1 << 2
         return 8
 
     def SET_CBD1(self) -> int:
-        """SET 2,C"""
-        value = 2
-        higher = ((self.R.C >> value) | 1) << value
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """SET 2, C"""
+        self.R.C = self.R.C | 1 << 2
         return 8
 
     def SET_CBD2(self) -> int:
-        """SET 2,D"""
-        value = 2
-        higher = ((self.R.D >> value) | 1) << value
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """SET 2, D"""
+        self.R.D = self.R.D | 1 << 2
         return 8
 
     def SET_CBD3(self) -> int:
-        """SET 2,E"""
-        value = 2
-        higher = ((self.R.E >> value) | 1) << value
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """SET 2, E"""
+        self.R.E = self.R.E | 1 << 2
         return 8
 
     def SET_CBD4(self) -> int:
-        """SET 2,H"""
-        value = 2
-        higher = ((self.R.H >> value) | 1) << value
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """SET 2, H"""
+        self.R.H = self.R.H | 1 << 2
         return 8
 
     def SET_CBD5(self) -> int:
-        """SET 2,L"""
-        value = 2
-        higher = ((self.R.L >> value) | 1) << value
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """SET 2, L"""
+        self.R.L = self.R.L | 1 << 2
         return 8
 
     def SET_CBD6(self) -> int:
-        """SET 2,[HL]"""
-        value = 2
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = ((mem >> value) | 1) << value
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """SET 2, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) | 1 << 2)
         return 16
 
     def SET_CBD7(self) -> int:
-        """SET 2,A"""
-        value = 2
-        higher = ((self.R.A >> value) | 1) << value
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """SET 2, A"""
+        self.R.A = self.R.A | 1 << 2
         return 8
 
     def SET_CBD8(self) -> int:
-        """SET 3,B"""
-        value = 3
-        higher = ((self.R.B >> value) | 1) << value
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """SET 3, B"""
+        self.R.B = self.R.B | 1 << 3
         return 8
 
     def SET_CBD9(self) -> int:
-        """SET 3,C"""
-        value = 3
-        higher = ((self.R.C >> value) | 1) << value
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """SET 3, C"""
+        self.R.C = self.R.C | 1 << 3
         return 8
 
     def SET_CBDA(self) -> int:
-        """SET 3,D"""
-        value = 3
-        higher = ((self.R.D >> value) | 1) << value
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """SET 3, D"""
+        self.R.D = self.R.D | 1 << 3
         return 8
 
     def SET_CBDB(self) -> int:
-        """SET 3,E"""
-        value = 3
-        higher = ((self.R.E >> value) | 1) << value
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """SET 3, E"""
+        self.R.E = self.R.E | 1 << 3
         return 8
 
     def SET_CBDC(self) -> int:
-        """SET 3,H"""
-        value = 3
-        higher = ((self.R.H >> value) | 1) << value
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """SET 3, H"""
+        self.R.H = self.R.H | 1 << 3
         return 8
 
     def SET_CBDD(self) -> int:
-        """SET 3,L"""
-        value = 3
-        higher = ((self.R.L >> value) | 1) << value
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """SET 3, L"""
+        self.R.L = self.R.L | 1 << 3
         return 8
 
     def SET_CBDE(self) -> int:
-        """SET 3,[HL]"""
-        value = 3
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = ((mem >> value) | 1) << value
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """SET 3, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) | 1 << 3)
         return 16
 
     def SET_CBDF(self) -> int:
-        """SET 3,A"""
-        value = 3
-        higher = ((self.R.A >> value) | 1) << value
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """SET 3, A"""
+        self.R.A = self.R.A | 1 << 3
         return 8
 
     def SET_CBE0(self) -> int:
-        """SET 4,B"""
-        value = 4
-        higher = ((self.R.B >> value) | 1) << value
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """SET 4, B"""
+        self.R.B = self.R.B | 1 << 4
         return 8
 
     def SET_CBE1(self) -> int:
-        """SET 4,C"""
-        value = 4
-        higher = ((self.R.C >> value) | 1) << value
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """SET 4, C"""
+        self.R.C = self.R.C | 1 << 4
         return 8
 
     def SET_CBE2(self) -> int:
-        """SET 4,D"""
-        value = 4
-        higher = ((self.R.D >> value) | 1) << value
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """SET 4, D"""
+        self.R.D = self.R.D | 1 << 4
         return 8
 
     def SET_CBE3(self) -> int:
-        """SET 4,E"""
-        value = 4
-        higher = ((self.R.E >> value) | 1) << value
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """SET 4, E"""
+        self.R.E = self.R.E | 1 << 4
         return 8
 
     def SET_CBE4(self) -> int:
-        """SET 4,H"""
-        value = 4
-        higher = ((self.R.H >> value) | 1) << value
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """SET 4, H"""
+        self.R.H = self.R.H | 1 << 4
         return 8
 
     def SET_CBE5(self) -> int:
-        """SET 4,L"""
-        value = 4
-        higher = ((self.R.L >> value) | 1) << value
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """SET 4, L"""
+        self.R.L = self.R.L | 1 << 4
         return 8
 
     def SET_CBE6(self) -> int:
-        """SET 4,[HL]"""
-        value = 4
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = ((mem >> value) | 1) << value
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """SET 4, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) | 1 << 4)
         return 16
 
     def SET_CBE7(self) -> int:
-        """SET 4,A"""
-        value = 4
-        higher = ((self.R.A >> value) | 1) << value
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """SET 4, A"""
+        self.R.A = self.R.A | 1 << 4
         return 8
 
     def SET_CBE8(self) -> int:
-        """SET 5,B"""
-        value = 5
-        higher = ((self.R.B >> value) | 1) << value
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """SET 5, B"""
+        self.R.B = self.R.B | 1 << 5
         return 8
 
     def SET_CBE9(self) -> int:
-        """SET 5,C"""
-        value = 5
-        higher = ((self.R.C >> value) | 1) << value
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """SET 5, C"""
+        self.R.C = self.R.C | 1 << 5
         return 8
 
     def SET_CBEA(self) -> int:
-        """SET 5,D"""
-        value = 5
-        higher = ((self.R.D >> value) | 1) << value
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """SET 5, D"""
+        self.R.D = self.R.D | 1 << 5
         return 8
 
     def SET_CBEB(self) -> int:
-        """SET 5,E"""
-        value = 5
-        higher = ((self.R.E >> value) | 1) << value
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """SET 5, E"""
+        self.R.E = self.R.E | 1 << 5
         return 8
 
     def SET_CBEC(self) -> int:
-        """SET 5,H"""
-        value = 5
-        higher = ((self.R.H >> value) | 1) << value
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """SET 5, H"""
+        self.R.H = self.R.H | 1 << 5
         return 8
 
     def SET_CBED(self) -> int:
-        """SET 5,L"""
-        value = 5
-        higher = ((self.R.L >> value) | 1) << value
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """SET 5, L"""
+        self.R.L = self.R.L | 1 << 5
         return 8
 
     def SET_CBEE(self) -> int:
-        """SET 5,[HL]"""
-        value = 5
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = ((mem >> value) | 1) << value
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """SET 5, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) | 1 << 5)
         return 16
 
     def SET_CBEF(self) -> int:
-        """SET 5,A"""
-        value = 5
-        higher = ((self.R.A >> value) | 1) << value
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """SET 5, A"""
+        self.R.A = self.R.A | 1 << 5
         return 8
 
     def SET_CBF0(self) -> int:
-        """SET 6,B"""
-        value = 6
-        higher = ((self.R.B >> value) | 1) << value
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """SET 6, B"""
+        self.R.B = self.R.B | 1 << 6
         return 8
 
     def SET_CBF1(self) -> int:
-        """SET 6,C"""
-        value = 6
-        higher = ((self.R.C >> value) | 1) << value
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """SET 6, C"""
+        self.R.C = self.R.C | 1 << 6
         return 8
 
     def SET_CBF2(self) -> int:
-        """SET 6,D"""
-        value = 6
-        higher = ((self.R.D >> value) | 1) << value
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """SET 6, D"""
+        self.R.D = self.R.D | 1 << 6
         return 8
 
     def SET_CBF3(self) -> int:
-        """SET 6,E"""
-        value = 6
-        higher = ((self.R.E >> value) | 1) << value
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """SET 6, E"""
+        self.R.E = self.R.E | 1 << 6
         return 8
 
     def SET_CBF4(self) -> int:
-        """SET 6,H"""
-        value = 6
-        higher = ((self.R.H >> value) | 1) << value
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """SET 6, H"""
+        self.R.H = self.R.H | 1 << 6
         return 8
 
     def SET_CBF5(self) -> int:
-        """SET 6,L"""
-        value = 6
-        higher = ((self.R.L >> value) | 1) << value
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """SET 6, L"""
+        self.R.L = self.R.L | 1 << 6
         return 8
 
     def SET_CBF6(self) -> int:
-        """SET 6,[HL]"""
-        value = 6
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = ((mem >> value) | 1) << value
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """SET 6, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) | 1 << 6)
         return 16
 
     def SET_CBF7(self) -> int:
-        """SET 6,A"""
-        value = 6
-        higher = ((self.R.A >> value) | 1) << value
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
+        """SET 6, A"""
+        self.R.A = self.R.A | 1 << 6
         return 8
 
     def SET_CBF8(self) -> int:
-        """SET 7,B"""
-        value = 7
-        higher = ((self.R.B >> value) | 1) << value
-        lower = ((self.R.B << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.B = calc
+        """SET 7, B"""
+        self.R.B = self.R.B | 1 << 7
         return 8
 
     def SET_CBF9(self) -> int:
-        """SET 7,C"""
-        value = 7
-        higher = ((self.R.C >> value) | 1) << value
-        lower = ((self.R.C << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.C = calc
+        """SET 7, C"""
+        self.R.C = self.R.C | 1 << 7
         return 8
 
     def SET_CBFA(self) -> int:
-        """SET 7,D"""
-        value = 7
-        higher = ((self.R.D >> value) | 1) << value
-        lower = ((self.R.D << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.D = calc
+        """SET 7, D"""
+        self.R.D = self.R.D | 1 << 7
         return 8
 
     def SET_CBFB(self) -> int:
-        """SET 7,E"""
-        value = 7
-        higher = ((self.R.E >> value) | 1) << value
-        lower = ((self.R.E << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.E = calc
+        """SET 7, E"""
+        self.R.E = self.R.E | 1 << 7
         return 8
 
     def SET_CBFC(self) -> int:
-        """SET 7,H"""
-        value = 7
-        higher = ((self.R.H >> value) | 1) << value
-        lower = ((self.R.H << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.H = calc
+        """SET 7, H"""
+        self.R.H = self.R.H | 1 << 7
         return 8
 
     def SET_CBFD(self) -> int:
-        """SET 7,L"""
-        value = 7
-        higher = ((self.R.L >> value) | 1) << value
-        lower = ((self.R.L << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.L = calc
+        """SET 7, L"""
+        self.R.L = self.R.L | 1 << 7
         return 8
 
     def SET_CBFE(self) -> int:
-        """SET 7,[HL]"""
-        value = 7
-        mem = self.mmu.get_memory(self.R.HL)
-        higher = ((mem >> value) | 1) << value
-        lower = ((mem << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.mmu.set_memory(self.R.HL, calc)
+        """SET 7, [HL]"""
+        hl = self.R.HL
+        self.mmu.set_memory(hl, self.mmu.get_memory(hl) | 1 << 7)
         return 16
 
     def SET_CBFF(self) -> int:
-        """SET 7,A"""
-        value = 7
-        higher = ((self.R.A >> value) | 1) << value
-        lower = ((self.R.A << 8 - value) & 0xFF) >> 8 - value
-        calc = higher | lower
-        self.R.A = calc
-        return 8
-
-    def CALL_CC(self, value: int) -> int:
-        """CALL Z,n16"""
-        if self.R.ZERO == 1:
-            self.R.PUSH(self.R.PC)
-            self.R.PC = value
-            return 24
-        return 12
-
-    def CALL_CD(self, address: int) -> int:
-        """CALL n16"""
-        self.R.PUSH(self.R.PC)
-        # NOTE: Must ensure PC is currently the address after CALL
-        self.R.PC = address
-        return 24
-
-    def ADC_CE(self, value: int) -> int:
-        """ADC A, n8"""
-        initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial + value + carryBit
-        final = calc & 0xFF
-        self.R.A = final
-        self.R.ZERO = (final == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            (initial & 0xF) + (value & 0xF) + (carryBit & 0xF) > 0xF
-        ) & 1
-        self.R.CARRY = (calc > 0xFF) & 1
-        return 8
-
-    def RST_CF(self) -> int:
-        """RST $08"""
-        self.CALL_CD(0x08)
-        return 16
-
-    def RET_D0(self) -> int:
-        """RET NC"""
-        if self.R.CARRY == 0:
-            self.R.PC = self.R.POP()
-            return 20
-        return 8
-
-    def POP_D1(self) -> int:
-        """POP DE"""
-        self.R.DE = self.R.POP()
-        return 12
-
-    def JP_D2(self, address: int) -> int:
-        """JP NC,n16"""
-        if self.R.CARRY == 0:
-            self.R.PC = address
-            return 16
-        return 12
-
-    def CALL_D4(self, address: int) -> int:
-        """CALL NC,n16"""
-        if self.R.CARRY == 0:
-            self.R.PUSH(self.R.PC)
-            self.R.PC = address
-            return 24
-        return 12
-
-    def PUSH_D5(self) -> int:
-        """PUSH DE"""
-        self.R.PUSH(self.R.DE)
-        return 16
-
-    def SUB_D6(self, value: int) -> int:
-        """SUB A, n8"""
-        initial = self.R.A
-        calc = initial - value
-        final = calc & 0xFF
-        self.R.A = final
-        self.R.ZERO = (final == 0) & 1
-        self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((initial & 0xF) - (value & 0xF) < 0) & 1
-        self.R.CARRY = (calc < 0) & 1
-        return 8
-
-    def RST_D7(self) -> int:
-        """RST $10"""
-        self.CALL_CD(0x10)
-        return 16
-
-    def RET_D8(self) -> int:
-        """RET C"""
-        if self.R.CARRY == 1:
-            self.R.PC = self.R.POP()
-            return 20
-        return 8
-
-    def RETI_D9(self) -> int:
-        """RETI"""
-        self.EI_FB()
-        self.RET_C9()
-        return 16
-
-    def JP_DA(self, address: int) -> int:
-        """JP C, n16"""
-        if self.R.CARRY == 1:
-            self.R.PC = address
-            return 16
-        return 12
-
-    def CALL_DC(self, address: int) -> int:
-        """CALL C,n16"""
-        if self.R.CARRY == 1:
-            self.R.PUSH(self.R.PC)
-            self.R.PC = address
-            return 24
-        return 12
-
-    def SBC_DE(self, value: int) -> int:
-        """SBC A, n8"""
-        initial = self.R.A
-        carryBit = self.R.CARRY
-        calc = initial - (value + carryBit)
-        final = calc & 0xFF
-        self.R.A = final
-        self.R.ZERO = (final == 0) & 1
-        self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = (
-            (initial & 0xF) - ((value & 0xF) + (carryBit & 0xF)) < 0
-        ) & 1
-        self.R.CARRY = (calc < 0) & 1
-        return 8
-
-    def RST_DF(self) -> int:
-        """RST $18"""
-        self.CALL_CD(0x18)
-        return 16
-
-    def LDH_E0(self, offset: int) -> int:
-        """LDH [n8],A"""
-        self.mmu.set_memory(0xFF00 + offset, self.R.A)
-        return 12
-
-    def POP_E1(self) -> int:
-        """POP HL"""
-        self.R.HL = self.R.POP()
-        return 12
-
-    def LDH_E2(self) -> int:
-        """LDH [C], A"""
-        self.mmu.set_memory(0xFF00 + self.R.C, self.R.A)
-        return 8
-
-    def PUSH_E5(self) -> int:
-        """PUSH HL"""
-        self.R.PUSH(self.R.HL)
-        return 16
-
-    def AND_E6(self, value: int) -> int:
-        """AND A, n8"""
-        initial = self.R.A
-        calc = initial & value
-        self.R.A = calc
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 1
-        self.R.CARRY = 0
-        return 8
-
-    def RST_E7(self) -> int:
-        """RST $20"""
-        self.CALL_CD(0x20)
-        return 16
-
-    def ADD_E8(self, value: int) -> int:
-        """ADD SP, e8"""
-        initial = self.R.SP
-        calc = (value ^ 0x80) - 0x80
-        final = (initial + calc) & 0xFFFF
-        self.R.SP = final
-
-        self.R.ZERO = 0
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            ((initial & 0xF) + (calc & 0xF) > 0xF)
-            or ((initial & 0xF) + (calc & 0xF) < 0)
-        ) & 1
-        self.R.CARRY = ((initial & 0xFF) + (calc & 0xFF) > 0xFF) or (
-            (initial & 0xFF) + (calc & 0xFF) < 0
-        )
-        return 16
-
-    def JP_E9(self) -> int:
-        """JP HL"""
-        self.R.PC = self.R.HL
-        return 4
-
-    def LD_EA(self, address: int) -> int:
-        """LD [n16],A"""
-        self.mmu.set_memory(address, self.R.A)
-        return 16
-
-    def XOR_EE(self, value: int) -> int:
-        """XOR A, n8"""
-        calc = self.R.A ^ value
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = 0
-        return 8
-
-    def RST_EF(self) -> int:
-        """RST $28"""
-        self.CALL_CD(0x28)
-        return 16
-
-    def LDH_F0(self, offset: int) -> int:
-        """LDH A, [n8]"""
-        self.R.A = self.mmu.get_memory(0xFF00 + offset)
-        return 12
-
-    def POP_F1(self) -> int:
-        """POP AF"""
-        self.R.AF = self.R.POP()
-        return 12
-
-    def LDH_F2(self) -> int:
-        """LDH A, [C]"""
-        self.R.A = self.mmu.get_memory(0xFF00 + self.R.C)
-        return 8
-
-    def DI_F3(self) -> int:
-        """DI"""
-        self.mmu.IME = False
-        return 4
-
-    def PUSH_F5(self) -> int:
-        """PUSH AF"""
-        self.R.PUSH(self.R.AF)
-        return 16
-
-    def OR_F6(self, value: int) -> int:
-        """OR A, n8"""
-        calc = self.R.A | value
-        self.R.A = calc
-
-        self.R.ZERO = (calc == 0) & 1
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = 0
-        self.R.CARRY = 0
-        return 8
-
-    def RST_F7(self) -> int:
-        """RST $30"""
-        self.CALL_CD(0x30)
-        return 16
-
-    def LD_F8(self, value: int) -> int:
-        """LD HL, SP + e8"""
-        addr = (value ^ 0x80) - 0x80
-        calc = self.R.SP + addr
-        final = calc & 0xFFFF
-        self.R.HL = final
-
-        self.R.ZERO = 0
-        self.R.SUBTRACTION = 0
-        self.R.HALFCARRY = (
-            ((self.R.SP & 0xF) + (addr & 0xF) > 0xF)
-            or ((self.R.SP & 0xF) + (addr & 0xF) < 0)
-        ) & 1
-        self.R.CARRY = ((self.R.SP & 0xFF) + (addr & 0xFF) > 0xFF) or (
-            (self.R.SP & 0xFF) + (addr & 0xFF) < 0
-        )
-
-        return 12
-
-    def LD_F9(self) -> int:
-        """LD SP, HL"""
-        self.R.SP = self.R.HL
-        return 8
-
-    def LD_FA(self, address: int) -> int:
-        """LD A, [n16]"""
-        self.R.A = self.mmu.get_memory(address)
-        return 16
-
-    def EI_FB(self) -> int:
-        """EI"""
-        self.mmu.IME = True
-        return 4
-
-    def CP_FE(self, value: int) -> int:
-        """CP A, n8"""
-        calc = self.R.A - value
-        self.R.ZERO = ((calc & 0xFF) == 0) & 1
-        self.R.SUBTRACTION = 1
-        self.R.HALFCARRY = ((self.R.A & 0xF) - (value & 0xF) < 0) & 1
-        self.R.CARRY = (calc < 0) & 1
+        """SET 7, A"""
+        self.R.A = self.R.A | 1 << 7
         return 8
-
-    def RST_FF(self) -> int:
-        """RST $38"""
-        self.CALL_CD(0x38)
-        return 16
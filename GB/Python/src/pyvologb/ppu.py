@@ -1,16 +1,43 @@
 import pygame
 from pyvologb.helpers import formatted_hex
+from pyvologb.interrupts import LCD, VBLANK
 
-from typing import TYPE_CHECKING
+from pyvologb.scheduler import Scheduler
+
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from pyvologb.mmu import MMU
 
+# Cycles spent in each PPU mode, per line for V-Blank
+MODE_CYCLES = [204, 456, 80, 172]
+
+# 154 lines per frame
+FRAME_CYCLES = 154 * 456
+
+# 8000 -> 97FF, 3 blocks of 128 tiles
+TILE_COUNT = 384
+
+# bytes.translate tables from colour index to palette colour, for each palette register value
+PALETTE_LOOKUP = [
+    bytes([palette >> (i * 2) & 3 for i in range(4)]) + bytes(252)
+    for palette in range(0x100)
+]
+
 
 class PPU:
-    def __init__(self, mmu: "MMU", debugging=False) -> None:
+    def __init__(
+        self,
+        mmu: "MMU",
+        scheduler: Scheduler,
+        debugging: bool = False,
+        headless: bool = False,
+    ) -> None:
         self.mmu = mmu
+        self.SCHEDULER = scheduler
+        self.MODE_EVENT = scheduler.register(self.next_mode)
         self.DEBUGGING_MODE = False  # debugging
+        self.HEADLESS = headless  # render into FRAMEBUFFER only, without a display
 
         self.LCDC = LCDC(0x91)  # FF40
         self.STAT = STAT(0x85)  # FF41
@@ -27,16 +54,26 @@ class PPU:
 
         self._MODE = 2
         self._LX = 0x0
-        self._CLOCK = 0
+
+        self.TILES = TileCache()
+
+        # Called at the end of each frame, after it's presented
+        self.FRAME_CALLBACKS: list[Callable[[], None]] = []
 
         self.PALETTE = [
             (255, 246, 211),
             (249, 168, 117),
             (235, 107, 111),
             (124, 63, 88),
+            (255, 255, 255),  # cleared display
         ]
 
-        self.init_pygame()
+        self.init_framebuffer()
+        if not self.HEADLESS:
+            self.init_pygame()
+
+        if self.LCDC.LCD_ENABLE == 1:
+            self.start_mode_clock()
 
     @property
     def PPU_MODE(self) -> int:
@@ -49,13 +86,13 @@ class PPU:
         match value:
             case 0:
                 if self.STAT.MODE_0_SELECT:
-                    self.mmu.IO.IF.LCD = 1
+                    self.mmu.IO.IF.request(LCD)
             case 1:
                 if self.STAT.MODE_1_SELECT:
-                    self.mmu.IO.IF.LCD = 1
+                    self.mmu.IO.IF.request(LCD)
             case 2:
                 if self.STAT.MODE_2_SELECT:
-                    self.mmu.IO.IF.LCD = 1
+                    self.mmu.IO.IF.request(LCD)
 
     @property
     def DMA(self) -> int:
@@ -76,68 +113,66 @@ class PPU:
         self._LY = value
         self.check_lyc()
 
-    def init_pygame(self) -> None:
-        pygame.init()
+    def init_framebuffer(self) -> None:
         self.CYCLE_COUNTER = 0
-
-        self.PIXEL_SIZE = 3
-        self.TILE_SIZE = 1
+        self.FRAME_COUNT = 0
 
         # 160 x 144 screen size
         self.SCREEN_X = 160
         self.SCREEN_Y = 144
 
-        self.CANVAS_SIZE = (
-            self.SCREEN_X * self.PIXEL_SIZE,
-            self.SCREEN_Y * self.PIXEL_SIZE,
-        )
-
         if self.DEBUGGING_MODE:
-            self.PIXEL_SIZE = 2
             # 2 (256 x 256) tilemaps
             # Tilemap 1 9800 -> 9BFF
             # Tilemap 2 9C00 -> 9FFF
             self.DEBUG_SCREEN_X = 256 * 2
             self.DEBUG_SCREEN_Y = 256
-            self.DEBUG_CANVAS_SIZE = (
-                (self.SCREEN_X + self.DEBUG_SCREEN_X) * self.PIXEL_SIZE,
-                self.DEBUG_SCREEN_Y * self.PIXEL_SIZE,
-            )
-            self.CANVAS = pygame.display.set_mode(self.DEBUG_CANVAS_SIZE)
+            self.FRAME_WIDTH = self.SCREEN_X + self.DEBUG_SCREEN_X
+            self.FRAME_HEIGHT = self.DEBUG_SCREEN_Y
         else:
-            self.CANVAS = pygame.display.set_mode(self.CANVAS_SIZE)
+            self.FRAME_WIDTH = self.SCREEN_X
+            self.FRAME_HEIGHT = self.SCREEN_Y
+
+        # Palette indices, one byte per pixel. The screen is the top left SCREEN_X x SCREEN_Y
+        self.FRAMEBUFFER = bytearray(self.FRAME_WIDTH * self.FRAME_HEIGHT)
+        self.clear_display()
+
+    def init_pygame(self) -> None:
+        pygame.init()
+
+        self.PIXEL_SIZE = 2 if self.DEBUGGING_MODE else 3
+        self.TILE_SIZE = 1
+
+        self.CANVAS_SIZE = (
+            self.FRAME_WIDTH * self.PIXEL_SIZE,
+            self.FRAME_HEIGHT * self.PIXEL_SIZE,
+        )
+        self.CANVAS = pygame.display.set_mode(self.CANVAS_SIZE)
 
         pygame.display.set_caption("PY-VOLO GB")
 
-        self.clear_display()
-        pygame.display.flip()
+        # Surfaces share the framebuffer memory, and are scaled onto the canvas once per frame
+        self.FRAME_SURFACE = pygame.image.frombuffer(
+            self.FRAMEBUFFER, (self.FRAME_WIDTH, self.FRAME_HEIGHT), "P"
+        )
+        self.FRAME_SURFACE.set_palette(self.PALETTE)
+        self.SCALED_SURFACE = pygame.Surface(self.CANVAS.get_size(), depth=8)
+        self.SCALED_SURFACE.set_palette(self.PALETTE)
+
+        self.present()
 
     def debug(self) -> None:
         offset_x = self.SCREEN_X
-        offset_y = 0
+        lookup = PALETTE_LOOKUP[self.BGP]
 
-        vram_block = 0x1000
+        self.TILES.update(self.mmu.VRAM)
 
         for y in range(256):
-            yPos = offset_y + y
+            start = y * self.FRAME_WIDTH + offset_x
             for z in range(2):
                 bg_tilemap = 0x1C00 if z == 1 else 0x1800
-                for x in range(0, 256, 8):
-                    xPos = offset_x + x + (256 * z)
-                    bg_tile_index = self.mmu.VRAM[
-                        bg_tilemap + ((y // 8) * 32) + ((x & 0xFF) // 8)
-                    ]
-                    bg_vram_block_offset = ((bg_tile_index ^ 0x80) - 0x80) * 16
-                    bg_tile = self.mmu.VRAM[
-                        vram_block
-                        + bg_vram_block_offset : vram_block
-                        + bg_vram_block_offset
-                        + 16
-                    ]
-                    bg_colours = self.get_tile_colours(bg_tile, yPos % 8)
-
-                    for xi in range(8):
-                        self.draw_pixel(xPos + xi, yPos, bg_colours[xi])
+                pixels = self.get_tilemap_row(bg_tilemap, y).translate(lookup)
+                self.FRAMEBUFFER[start + 256 * z : start + 256 * (z + 1)] = pixels
 
     def dump(self) -> bytearray:
         return bytearray(
@@ -189,7 +224,13 @@ class PPU:
     def set(self, addr: int, value: int) -> None:
         match addr:
             case 0xFF40:
+                lcd_enable = self.LCDC.LCD_ENABLE
                 self.LCDC.set(value)
+                if self.LCDC.LCD_ENABLE != lcd_enable:
+                    if self.LCDC.LCD_ENABLE == 1:
+                        self.start_mode_clock()
+                    else:
+                        self.disable_lcd()
             case 0xFF41:
                 self.STAT.set(value)
             case 0xFF42:
@@ -215,57 +256,57 @@ class PPU:
             case _:
                 raise Exception("Unknown IO Register:", formatted_hex(addr))
 
-    def tick(self, cycles: int) -> None:
-        if self.LCDC.LCD_ENABLE == 1:
-            for _ in range(cycles):
-
-                match self.PPU_MODE:
-                    case 2:  # OAM
-                        if self._CLOCK == 80:
-                            self.PPU_MODE = 3
-                            self._CLOCK = 0
-                    case 3:  # Pixel
-                        if self._CLOCK == 172:
-                            self.PPU_MODE = 0
-                            self._CLOCK = 0
-
-                            self.drawline()
-                            if self.LCDC.OBJ_ENABLE == 1:
-                                self.draw_oam_line()
-                    case 0:  # H-Blank
-                        if self._CLOCK == 204:
-                            self.LY += 1
-
-                            if self.LY == 143:
-                                self.mmu.IO.IF.VBLANK = 1
-                                self.PPU_MODE = 1
-                            else:
-                                self.PPU_MODE = 2
-                            self._CLOCK = 0
-                    case 1:  # V-Blank
-                        if self._CLOCK == 456:
-                            self.LY += 1
-                            self._CLOCK = 0
-
-                            if self.LY > 153:
-                                self.PPU_MODE = 2
-                                self.LY = 0
-
-                                # update screen
-                                pygame.display.flip()
-                self._CLOCK += 1
-        else:
-            self.LY = 0
-            self.STAT.set_lyc_equal(0)
-            self._CLOCK = 0
-            self.STAT.set_mode(0)
-            self.clear_display()
+    def start_mode_clock(self) -> None:
+        """Start the current mode from its first cycle"""
+        self.SCHEDULER.schedule(self.MODE_EVENT, MODE_CYCLES[self.PPU_MODE] + 1)
+
+    def next_mode(self) -> None:
+        """Scheduled at the end of each mode, and each V-Blank line"""
+        match self.PPU_MODE:
+            case 2:  # OAM
+                self.PPU_MODE = 3
+            case 3:  # Pixel
+                self.PPU_MODE = 0
+
+                self.TILES.update(self.mmu.VRAM)
+                self.drawline()
+                if self.LCDC.OBJ_ENABLE == 1:
+                    self.draw_oam_line()
+            case 0:  # H-Blank
+                self.LY += 1
+
+                if self.LY == 143:
+                    self.mmu.IO.IF.request(VBLANK)
+                    self.PPU_MODE = 1
+                else:
+                    self.PPU_MODE = 2
+            case 1:  # V-Blank
+                self.LY += 1
+
+                if self.LY > 153:
+                    self.PPU_MODE = 2
+                    self.LY = 0
+
+                    # update screen
+                    self.FRAME_COUNT += 1
+                    self.present()
+                    for callback in self.FRAME_CALLBACKS:
+                        callback()
+
+        self.SCHEDULER.schedule(self.MODE_EVENT, MODE_CYCLES[self.PPU_MODE])
+
+    def disable_lcd(self) -> None:
+        self.SCHEDULER.cancel(self.MODE_EVENT)
+        self.LY = 0
+        self.STAT.set_lyc_equal(0)
+        self.STAT.set_mode(0)
+        self.clear_display()
 
     def check_lyc(self):
         if self.LYC == self.LY:
             self.STAT.set_lyc_equal(1)
             if self.STAT.LYC_SELECT == 1:
-                self.mmu.IO.IF.LCD = 1
+                self.mmu.IO.IF.request(LCD)
         else:
             self.STAT.set_lyc_equal(0)
 
@@ -279,130 +320,60 @@ class PPU:
         if colourId is None:
             return
 
-        pygame.draw.rect(
-            self.CANVAS,
-            self.PALETTE[colourId],
-            [
-                x * self.PIXEL_SIZE,
-                y * self.PIXEL_SIZE,
-                self.PIXEL_SIZE,
-                self.PIXEL_SIZE,
-            ],
-        )
-
-    def get_tile_colours(
-        self, tile_bytes: bytearray, tileY: int, attributes: int | None = None
-    ) -> list[int | None]:
-        """Convert byte data into tile data"""
+        self.FRAMEBUFFER[y * self.FRAME_WIDTH + x] = colourId
 
-        # priority = 0
-        yFlip = 0
-        xFlip = 0
-        palette = self.BGP
-        transparent: int | None = None
-
-        tileY *= 2
+    def present(self) -> None:
+        """Scale the framebuffer onto the display"""
+        if self.HEADLESS:
+            return
 
-        if attributes is not None:
-            # priority = attributes >> 7 & 1
-            yFlip = attributes >> 6 & 1
-            xFlip = attributes >> 5 & 1
-            palette = self.OBP1 if attributes >> 4 & 1 == 1 else self.OBP0
-            transparent = palette & 3
-
-        return [
-            None if transparent == c else c
-            for c in [
-                palette
-                >> (
-                    (
-                        (
-                            tile_bytes[15 - (tileY + 1) if yFlip else (tileY + 1)]
-                            >> (i if xFlip else (7 - i))
-                            & 1
-                        )
-                        << 1
-                    )
-                    | (
-                        tile_bytes[15 - tileY if yFlip else tileY]
-                        >> (i if xFlip else (7 - i))
-                        & 1
-                    )
-                )
-                * 2
-                & 3
-                for i in range(8)
-            ]
-        ]
+        pygame.transform.scale(
+            self.FRAME_SURFACE, self.SCALED_SURFACE.get_size(), self.SCALED_SURFACE
+        )
+        self.CANVAS.blit(self.SCALED_SURFACE, (0, 0))
+        pygame.display.flip()
 
     def drawline(self) -> None:
         """Draw the current scanline"""
         y = self.LY
-        scrollY = (y + self.SCY) & 0xFF
 
-        # attempting to reduce the number of tile calcs by stepping 8 pixels at a time
-        # performance drop at max SCX is negligable compared to recalculating tiles per pixel
-        # i'm sure there's a better way to do this but here we are
         if self.LCDC.BG_WIN_ENABLE == 1:
-            for x in range(0, self.SCREEN_X + self.SCX, 8):
-                use_alt_vram_block = self.LCDC.ALT_BG_WIN_TILES == 1
-
-                vram_block = 0x0000 if use_alt_vram_block else 0x1000
-                bg_tilemap = 0x1C00 if self.LCDC.ALT_BG_TILEMAP == 1 else 0x1800
-                win_tilemap = 0x1C00 if self.LCDC.ALT_WIN_TILEMAP == 1 else 0x1800
-
-                # BG
-                bg_tile_index = self.mmu.VRAM[
-                    bg_tilemap + ((scrollY // 8) * 32) + ((x & 0xFF) // 8)
-                ]
-                bg_vram_block_offset = (
-                    bg_tile_index
-                    if use_alt_vram_block == 1
-                    else (bg_tile_index ^ 0x80) - 0x80
-                ) * 16
-                bg_tile = self.mmu.VRAM[
-                    vram_block
-                    + bg_vram_block_offset : vram_block
-                    + bg_vram_block_offset
-                    + 16
-                ]
-                bg_colours = self.get_tile_colours(bg_tile, scrollY % 8)
-
-                # WIN
-                if self.LCDC.WIN_ENABLE == 1:
-                    win_tile_index = self.mmu.VRAM[
-                        win_tilemap + ((y // 8) * 32) + ((x & 0xFF) // 8)
-                    ]
-                    win_vram_block_offset = (
-                        win_tile_index
-                        if use_alt_vram_block == 1
-                        else (win_tile_index ^ 0x80) - 0x80
-                    ) * 16
-                    win_tile = self.mmu.VRAM[
-                        vram_block
-                        + win_vram_block_offset : vram_block
-                        + win_vram_block_offset
-                        + 16
-                    ]
-
-                    win_colours = self.get_tile_colours(win_tile, y % 8)
-
-                # reducing draw calls by discarding pixels offscreen
-                for xi in range(8):
-                    if self.LCDC.WIN_ENABLE == 1:
-                        pixelX = x + xi
-                        if 0 <= pixelX < self.SCREEN_X:
-                            self.draw_pixel(pixelX, y, win_colours[xi])
-                    else:
-                        pixelX = (x + xi) - self.SCX
-                        if 0 <= pixelX < self.SCREEN_X:
-                            self.draw_pixel(pixelX, y, bg_colours[xi])
+            # the window replaces the background, and isn't scrolled
+            if self.LCDC.WIN_ENABLE == 1:
+                tilemap = 0x1C00 if self.LCDC.ALT_WIN_TILEMAP == 1 else 0x1800
+                tileY = y
+            else:
+                tilemap = 0x1C00 if self.LCDC.ALT_BG_TILEMAP == 1 else 0x1800
+                tileY = (y + self.SCY) & 0xFF
+
+            pixels = self.get_tilemap_row(tilemap, tileY)
+            if self.LCDC.WIN_ENABLE == 0:
+                pixels = pixels[self.SCX :] + pixels[: self.SCX]
+
+            line = pixels[: self.SCREEN_X].translate(PALETTE_LOOKUP[self.BGP])
         else:
-            for x in range(self.SCREEN_X):
-                self.draw_pixel(x, y, 0)
+            line = bytes(self.SCREEN_X)
+
+        start = y * self.FRAME_WIDTH
+        self.FRAMEBUFFER[start : start + self.SCREEN_X] = line
+
+    def get_tilemap_row(self, tilemap: int, tileY: int) -> bytes:
+        """Colour indices of one 256 pixel row of a tilemap"""
+        rows = self.TILES.ROWS
+        row = tileY & 7
+        tiles = self.mmu.VRAM[tilemap + (tileY >> 3) * 32 : tilemap + (tileY >> 3) * 32 + 32]
+
+        if self.LCDC.ALT_BG_WIN_TILES == 1:
+            return b"".join([rows[tile << 3 | row] for tile in tiles])
+
+        # signed indexing from 9000, tiles 0x00 -> 0x7F are the last block of the cache
+        return b"".join(
+            [rows[(tile if tile & 0x80 else tile | 0x100) << 3 | row] for tile in tiles]
+        )
 
     def draw_oam_line(self) -> None:
         line = self.LY
+        start = line * self.FRAME_WIDTH
 
         tall_tile = bool(self.LCDC.OBJ_SIZE)
 
@@ -433,19 +404,57 @@ class PPU:
             elif tall_tile:
                 tileIndex |= 0x01
 
-            tile = self.mmu.VRAM[tileIndex * 16 : (tileIndex * 16) + 16]
-            colours = self.get_tile_colours(tile, (line - yPos) % 8, attributes)
+            tileY = (line - yPos) % 8
+            if attributes >> 6 & 1:
+                tileY = 7 - tileY
+
+            rows = self.TILES.FLIPPED_ROWS if attributes >> 5 & 1 else self.TILES.ROWS
+            indices = rows[tileIndex << 3 | tileY]
+            palette = self.OBP1 if attributes >> 4 & 1 == 1 else self.OBP0
+            colours = indices.translate(PALETTE_LOOKUP[palette])
 
             for lineX in range(8):
                 xPixel = xPos + lineX
-                if 0 <= xPixel < self.SCREEN_X and 0 <= line < self.SCREEN_Y:
-                    self.draw_pixel(xPixel, line, colours[lineX])
+                # colour index 0 is transparent
+                if indices[lineX] and 0 <= xPixel < self.SCREEN_X:
+                    self.FRAMEBUFFER[start + xPixel] = colours[lineX]
 
     def clear_display(self) -> None:
-        """Clear the canvas"""
-        self.CANVAS.fill(
-            (255, 255, 255), pygame.Rect(0, 0, self.CANVAS_SIZE[0], self.CANVAS_SIZE[1])
-        )
+        """Clear the framebuffer"""
+        self.FRAMEBUFFER[:] = bytes([4]) * len(self.FRAMEBUFFER)
+
+
+class TileCache:
+    """Decoded colour indices of the VRAM tiles
+
+    A tile is decoded when it's next drawn after a write, with a mirrored copy for X flipped sprites.
+    Each row is 8 bytes, at ROWS[tile << 3 | y]
+    """
+
+    def __init__(self) -> None:
+        self.ROWS = [bytes(8)] * (TILE_COUNT * 8)
+        self.FLIPPED_ROWS = [bytes(8)] * (TILE_COUNT * 8)
+        self.DIRTY: set[int] = set()
+
+    def invalidate(self, tile: int) -> None:
+        self.DIRTY.add(tile)
+
+    def invalidate_all(self) -> None:
+        self.DIRTY.update(range(TILE_COUNT))
+
+    def update(self, vram: bytearray) -> None:
+        """Decode the tiles written since the last update"""
+        for tile in self.DIRTY:
+            for y in range(8):
+                low = vram[tile * 16 + y * 2]
+                high = vram[tile * 16 + y * 2 + 1]
+                row = bytes(
+                    [(high >> bit & 1) << 1 | low >> bit & 1 for bit in range(7, -1, -1)]
+                )
+                self.ROWS[tile << 3 | y] = row
+                self.FLIPPED_ROWS[tile << 3 | y] = row[::-1]
+
+        self.DIRTY.clear()
 
 
 class LCDC:
@@ -3,6 +3,24 @@ from pyvologb.mmu import MMU
 
 
 class Registers:
+    # A fixed register set. No faster than a __dict__ on CPython 3.12, see benchmarks.registers
+    __slots__ = (
+        "mmu",
+        "A",
+        "B",
+        "C",
+        "D",
+        "E",
+        "H",
+        "L",
+        "PC",
+        "SP",
+        "ZERO",
+        "SUBTRACTION",
+        "HALFCARRY",
+        "CARRY",
+    )
+
     def __init__(self, mmu: MMU) -> None:
 
         self.mmu = mmu
@@ -34,17 +52,27 @@ class Registers:
             | self.CARRY << 4
         )
 
+    @F.setter
+    def F(self, value: int) -> None:
+        self.ZERO = value >> 7 & 1
+        self.SUBTRACTION = value >> 6 & 1
+        self.HALFCARRY = value >> 5 & 1
+        self.CARRY = value >> 4 & 1
+
     @property
     def AF(self) -> int:
-        return self.A << 8 | self.F
+        return (
+            self.A << 8
+            | self.ZERO << 7
+            | self.SUBTRACTION << 6
+            | self.HALFCARRY << 5
+            | self.CARRY << 4
+        )
 
     @AF.setter
     def AF(self, value: int) -> None:
         self.A = value >> 8
-        self.ZERO = value >> 7 & 1
-        self.SUBTRACTION = value >> 6 & 1
-        self.HALFCARRY = value >> 5 & 1
-        self.CARRY = value >> 4 & 1
+        self.F = value
 
     @property
     def BC(self) -> int:
@@ -0,0 +1,91 @@
+import collections
+import time
+import zlib
+
+from pyvologb.mmu import MMU
+from pyvologb.ppu import FRAME_CYCLES
+from pyvologb.registers import Registers
+from pyvologb.savestate import restore, snapshot
+
+
+def xor(a: bytes, b: bytes) -> bytes:
+    """Bytewise XOR of two savestates of the same size, as one big integer operation"""
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(
+        len(a), "little"
+    )
+
+
+class Rewind:
+    """Savestates every `interval` frames, for stepping back through recent history
+
+    Only the newest state is held whole. Each older state is the XOR of itself and the state
+    after it, compressed, which is mostly zeros between nearby frames. The oldest deltas are
+    dropped once they take more than `max_bytes`.
+
+    Recording runs from the scheduler, `step_back` restores the state before the newest and
+    has to be called from the CPU loop, not from an event. A front-end sets REQUESTED instead
+    """
+
+    def __init__(
+        self,
+        mmu: MMU,
+        R: Registers,
+        interval: int = 10,
+        max_bytes: int = 4 << 20,
+        level: int = 1,
+    ) -> None:
+        self.mmu = mmu
+        self.R = R
+        self.INTERVAL = interval
+        self.MAX_BYTES = max_bytes
+        self.LEVEL = level  # zlib compression level
+
+        self.LAST = b""
+        self.DELTAS: collections.deque[bytes] = collections.deque()
+        self.SIZE = 0  # compressed bytes held in DELTAS
+        self.REQUESTED = False
+
+        self.RECORDS = 0
+        self.RECORD_TIME = 0.0
+        self.REWINDS = 0
+
+        self.SCHEDULER = mmu.IO.SCHEDULER
+        self.RECORD_EVENT = self.SCHEDULER.register(self.record)
+        self.SCHEDULER.schedule(self.RECORD_EVENT, 0)
+
+    def record(self) -> None:
+        start = time.perf_counter()
+
+        state = snapshot(self.mmu, self.R)
+        if self.LAST:
+            delta = zlib.compress(xor(self.LAST, state), self.LEVEL)
+            self.DELTAS.append(delta)
+            self.SIZE += len(delta)
+            while self.SIZE > self.MAX_BYTES:
+                self.SIZE -= len(self.DELTAS.popleft())
+        self.LAST = state
+
+        self.RECORDS += 1
+        self.RECORD_TIME += time.perf_counter() - start
+        self.SCHEDULER.schedule(self.RECORD_EVENT, self.INTERVAL * FRAME_CYCLES)
+
+    def step_back(self) -> bool:
+        """Restore the state recorded before the newest, False when there's no more history"""
+        self.REQUESTED = False
+        if not self.DELTAS:
+            return False
+
+        delta = self.DELTAS.pop()
+        self.SIZE -= len(delta)
+        self.LAST = xor(self.LAST, zlib.decompress(delta))
+        restore(self.mmu, self.R, self.LAST)
+        self.REWINDS += 1
+        return True
+
+    def stats(self) -> str:
+        frame_time = self.RECORD_TIME / max(self.RECORDS, 1) / self.INTERVAL
+        return (
+            f"rewind: {len(self.DELTAS)} states, {len(self.DELTAS) * self.INTERVAL} frames, "
+            f"{self.SIZE / 1024:.0f} of {self.MAX_BYTES / 1024:.0f} KiB "
+            f"recording: {frame_time * 1e6:.1f} us/frame rewinds: {self.REWINDS}"
+        )
@@ -0,0 +1,191 @@
+import struct
+
+from pyvologb.mmu import MMU
+from pyvologb.registers import Registers
+from pyvologb.scheduler import NEVER
+
+MAGIC = b"PVGB"
+VERSION = 1
+
+HEADER = struct.Struct("<4sH")
+
+# Everything that isn't a memory region, in the order of `fields`
+STATE = struct.Struct(
+    "<"
+    "8B2H"  # A F B C D E H L, SP, PC
+    "2?HB?"  # IME, HALT, ROM bank, FF50 boot ROM unmapped, cartridge RAM enable
+    "3q"  # scheduler cycle, timer overflow and PPU mode deadlines
+    "qHqBBBH"  # timer divider start, TIMA, TIMA start, TMA, TAC enable, clock select, clock
+    "2B"  # IF, IE
+    "10?"  # joypad select, dpad, START SELECT B A DOWN UP LEFT RIGHT
+    "2B"  # serial SB, SC
+    "12BI"  # LCDC STAT SCY SCX LY LYC BGP OBP0 OBP1 WY WX, PPU mode, frame count
+    "4BH1B"  # pulse duty, length, volume, envelope direction, period, length enable
+)
+
+
+def regions(mmu: MMU) -> list[bytearray]:
+    """The memory saved after the fields, each restored in place so page views stay valid"""
+    return [
+        mmu.VRAM,
+        mmu.ERAM,
+        mmu.WRAM,
+        mmu.ECHO,
+        mmu.OAM,
+        mmu.EMPTY,
+        mmu.HRAM,
+        mmu.IO.WAVE,
+        mmu.IO.LCD.FRAMEBUFFER,
+    ]
+
+
+def fields(mmu: MMU, R: Registers) -> tuple[int | bool, ...]:
+    IO = mmu.IO
+    timer = IO._TIMER
+    joypad = IO.JOYP
+    ppu = IO.LCD
+    pulse = IO.AUDIO.PULSE_CHANNEL
+    scheduler = IO.SCHEDULER
+
+    return (
+        R.A, R.F, R.B, R.C, R.D, R.E, R.H, R.L, R.SP, R.PC,
+        mmu.IME, mmu.HALT, mmu.CURRENT_BANK, IO.BANK, mmu.CARTRIDGE.RAM_ENABLE,
+        scheduler.CYCLE,
+        scheduler.deadline(timer.OVERFLOW_EVENT),
+        scheduler.deadline(ppu.MODE_EVENT),
+        timer._DIVIDER_START, timer._TIMA, timer._TIMA_START, timer.TMA,
+        timer._TAC_ENABLE, timer._TAC_CLOCK_SELECT, timer.CLOCK,
+        IO.IF.FLAGS, IO.IE.FLAGS,
+        joypad.USE_SELECT, joypad.USE_DPAD, joypad.START, joypad.SELECT, joypad.B, joypad.A,
+        joypad.DOWN, joypad.UP, joypad.LEFT, joypad.RIGHT,
+        IO.SERIAL.BUFFER_LAST, IO.SERIAL.SC,
+        ppu.LCDC.get(), ppu.STAT.get(), ppu.SCY, ppu.SCX, ppu._LY, ppu.LYC,
+        ppu.BGP, ppu.OBP0, ppu.OBP1, ppu.WY, ppu.WX, ppu._MODE, ppu.FRAME_COUNT,
+        pulse.WAVE_DUTY, pulse.LENGTH_INIT, pulse.VOL_INIT, pulse.ENV_DIR, pulse.PERIOD,
+        pulse.LENGTH_ENABLE,
+    )  # fmt: skip
+
+
+def snapshot(mmu: MMU, R: Registers) -> bytes:
+    """The emulator state as a versioned binary savestate"""
+    return b"".join(
+        [
+            HEADER.pack(MAGIC, VERSION),
+            STATE.pack(*fields(mmu, R)),
+            *regions(mmu),
+        ]
+    )
+
+
+def restore(mmu: MMU, R: Registers, data: bytes) -> None:
+    """Put the emulator back in the state of a savestate from `snapshot`
+
+    Front-end events, like window polling or input scripts, keep the cycles they had left
+    """
+    memory = regions(mmu)
+    if len(data) != HEADER.size + STATE.size + sum(len(region) for region in memory):
+        raise Exception("Savestate size doesn't match this emulator")
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise Exception(f"Unsupported savestate version {version}", magic)
+
+    (
+        R.A, R.F, R.B, R.C, R.D, R.E, R.H, R.L, R.SP, R.PC,
+        IME, HALT, rom_bank, boot_unmapped, ram_enable,
+        cycle, overflow_deadline, mode_deadline,
+        divider_start, tima, tima_start, tma, tac_enable, clock_select, clock,
+        interrupt_flags, interrupt_enable,
+        use_select, use_dpad, start, select, b, a, down, up, left, right,
+        serial_data, serial_control,
+        lcdc, stat, scy, scx, ly, lyc, bgp, obp0, obp1, wy, wx, ppu_mode, frame_count,
+        duty, length, volume, envelope, period, length_enable,
+    ) = STATE.unpack_from(data, HEADER.size)  # fmt: skip
+
+    offset = HEADER.size + STATE.size
+    view = memoryview(data)
+    for region in memory:
+        region[:] = view[offset : offset + len(region)]
+        offset += len(region)
+
+    mmu.IME = IME
+    mmu.HALT = HALT
+    mmu.CARTRIDGE.RAM_ENABLE = ram_enable
+
+    IO = mmu.IO
+    if boot_unmapped != IO.BANK:
+        IO.BANK = boot_unmapped
+        if boot_unmapped:
+            mmu.switch_rom_bank(0)
+        else:
+            mmu.map_boot_rom()
+    if rom_bank != mmu.CURRENT_BANK:
+        mmu.switch_rom_bank(rom_bank)
+
+    # Blocks and decoded tiles were built from the memory just replaced
+    if mmu.BLOCKS is not None:
+        mmu.BLOCKS.invalidate_range(0x8000, 0x10000)
+    IO.LCD.TILES.invalidate_all()
+
+    scheduler = IO.SCHEDULER
+    scheduler.rebase(cycle)
+
+    timer = IO._TIMER
+    timer._DIVIDER_START = divider_start
+    timer._TIMA = tima
+    timer._TIMA_START = tima_start
+    timer.TMA = tma
+    timer._TAC_ENABLE = tac_enable
+    timer._TAC_CLOCK_SELECT = clock_select
+    timer.CLOCK = clock
+
+    IO.IF.FLAGS = interrupt_flags
+    IO.IE.FLAGS = interrupt_enable
+
+    joypad = IO.JOYP
+    joypad.USE_SELECT = use_select
+    joypad.USE_DPAD = use_dpad
+    joypad.START = start
+    joypad.SELECT = select
+    joypad.B = b
+    joypad.A = a
+    joypad.DOWN = down
+    joypad.UP = up
+    joypad.LEFT = left
+    joypad.RIGHT = right
+
+    IO.SERIAL.BUFFER_LAST = serial_data
+    IO.SERIAL.SC = serial_control
+
+    ppu = IO.LCD
+    ppu.LCDC.set(lcdc)
+    ppu.STAT.set(stat)
+    ppu.STAT.set_lyc_equal(stat >> 2)
+    ppu.STAT.set_mode(stat)
+    ppu.SCY = scy
+    ppu.SCX = scx
+    ppu._LY = ly
+    ppu.LYC = lyc
+    ppu.BGP = bgp
+    ppu.OBP0 = obp0
+    ppu.OBP1 = obp1
+    ppu.WY = wy
+    ppu.WX = wx
+    ppu._MODE = ppu_mode
+    ppu.FRAME_COUNT = frame_count
+
+    pulse = IO.AUDIO.PULSE_CHANNEL
+    pulse.WAVE_DUTY = duty
+    pulse.LENGTH_INIT = length
+    pulse.VOL_INIT = volume
+    pulse.ENV_DIR = envelope
+    pulse.PERIOD = period
+    pulse.LENGTH_ENABLE = length_enable
+
+    for event, deadline in (
+        (timer.OVERFLOW_EVENT, overflow_deadline),
+        (ppu.MODE_EVENT, mode_deadline),
+    ):
+        if deadline == NEVER:
+            scheduler.cancel(event)
+        else:
+            scheduler.schedule_at(event, deadline)
@@ -0,0 +1,96 @@
+import heapq
+from typing import Callable
+
+NEVER = 1 << 62
+
+
+class Scheduler:
+    """Runs component events once the cycle counter reaches their deadline
+
+    Each event has at most one pending deadline, rescheduling replaces it.
+    Stale heap entries are skipped when they're popped.
+    """
+
+    def __init__(self) -> None:
+        self.CYCLE = 0  # cycles since power on
+        self.NEXT_DEADLINE = NEVER  # earliest deadline in the heap
+
+        self._EVENTS: list[tuple[int, int]] = []  # heap of (deadline, event)
+        self._DEADLINES: list[int] = []
+        self._CALLBACKS: list[Callable[[], None]] = []
+
+    def register(self, callback: Callable[[], None]) -> int:
+        """Register an event callback, returns the event id"""
+        self._CALLBACKS.append(callback)
+        self._DEADLINES.append(NEVER)
+        return len(self._CALLBACKS) - 1
+
+    def schedule(self, event: int, cycles: int) -> None:
+        """Schedule an event `cycles` after the current cycle
+
+        Inside a callback the current cycle is the deadline of the event being run, so periodic
+        events don't drift with instruction length
+        """
+        self.schedule_at(event, self.CYCLE + cycles)
+
+    def schedule_at(self, event: int, deadline: int) -> None:
+        """Schedule an event at an absolute cycle"""
+        self._DEADLINES[event] = deadline
+        heapq.heappush(self._EVENTS, (deadline, event))
+        if deadline < self.NEXT_DEADLINE:
+            self.NEXT_DEADLINE = deadline
+
+    def cancel(self, event: int) -> None:
+        self._DEADLINES[event] = NEVER
+
+    def deadline(self, event: int) -> int:
+        """Absolute cycle an event is due, NEVER if it isn't scheduled"""
+        return self._DEADLINES[event]
+
+    def rebase(self, cycle: int) -> None:
+        """Move the cycle counter to `cycle`, each pending event keeps the cycles it had left
+
+        Not from inside an event callback, run_events puts the cycle it ran to back afterwards
+        """
+        offset = cycle - self.CYCLE
+        self.CYCLE = cycle
+        self._DEADLINES = [
+            deadline if deadline == NEVER else deadline + offset
+            for deadline in self._DEADLINES
+        ]
+        self._EVENTS[:] = [
+            (deadline, event)
+            for event, deadline in enumerate(self._DEADLINES)
+            if deadline != NEVER
+        ]
+        heapq.heapify(self._EVENTS)
+        self.NEXT_DEADLINE = self._EVENTS[0][0] if self._EVENTS else NEVER
+
+    def cycles_to_deadline(self, step: int) -> int:
+        """Cycles, in whole steps, until the next deadline is reached. One step if none is set"""
+        if self.NEXT_DEADLINE == NEVER:
+            return step
+        steps = -(-(self.NEXT_DEADLINE - self.CYCLE) // step)
+        return max(steps, 1) * step
+
+    def tick(self, cycles: int) -> None:
+        self.CYCLE += cycles
+        if self.CYCLE >= self.NEXT_DEADLINE:
+            self.run_events()
+
+    def run_events(self) -> None:
+        """Run every event due by the current cycle, in deadline order"""
+        target = self.CYCLE
+        events = self._EVENTS
+
+        while events and events[0][0] <= target:
+            deadline, event = heapq.heappop(events)
+            if self._DEADLINES[event] != deadline:
+                continue  # cancelled or rescheduled
+
+            self._DEADLINES[event] = NEVER
+            self.CYCLE = deadline
+            self._CALLBACKS[event]()
+
+        self.CYCLE = target
+        self.NEXT_DEADLINE = events[0][0] if events else NEVER
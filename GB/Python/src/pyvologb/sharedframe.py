@@ -0,0 +1,101 @@
+import struct
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from pyvologb.ppu import PPU
+
+# Frame counter, framebuffer width and height, then two framebuffers
+HEADER = struct.Struct("<QHH4x")
+COUNTER = struct.Struct("<Q")
+
+# Blocks created by this process
+CREATED: set[str] = set()
+
+
+class SharedFramebuffer:
+    """Copies each finished frame of the PPU into shared memory, for other processes to read
+    through SharedFramebufferReader
+
+    The block is double-buffered. Frame n is written into buffer n % 2 before the frame counter in
+    the header is set to n, so the buffer the counter points to is complete and isn't written
+    again until frame n + 2
+    """
+
+    def __init__(self, ppu: PPU, name: str | None = None) -> None:
+        self.ppu = ppu
+        self.SIZE = len(ppu.FRAMEBUFFER)
+        self.SOURCE = memoryview(ppu.FRAMEBUFFER)
+        self.COUNT = 0
+
+        self.SHARED = SharedMemory(name=name, create=True, size=HEADER.size + 2 * self.SIZE)
+        self.NAME = self.SHARED.name
+        CREATED.add(self.NAME)
+        buffer = self.SHARED.buf
+        assert buffer is not None
+        self.BUFFER = buffer
+        HEADER.pack_into(buffer, 0, 0, ppu.FRAME_WIDTH, ppu.FRAME_HEIGHT)
+
+        ppu.FRAME_CALLBACKS.append(self.write)
+
+    def write(self) -> None:
+        """Called at the end of each frame, after it's presented"""
+        count = self.COUNT + 1
+        offset = HEADER.size + (count & 1) * self.SIZE
+        self.BUFFER[offset : offset + self.SIZE] = self.SOURCE
+        COUNTER.pack_into(self.BUFFER, 0, count)
+        self.COUNT = count
+
+    def close(self) -> None:
+        self.ppu.FRAME_CALLBACKS.remove(self.write)
+        try:
+            self.BUFFER.release()
+        finally:
+            try:
+                self.SHARED.close()
+            finally:
+                self.SHARED.unlink()
+                CREATED.discard(self.NAME)
+
+
+class SharedFramebufferReader:
+    """Reads the frames of a SharedFramebuffer from another process, without copying them
+
+    `copy_latest` returns a copy of the latest frame. A view from `latest` stays valid for about a
+    frame, until the buffer is reused two frames on, so copy it, or check `count` hasn't moved on
+    by 2 once done with it. Views have to be released before `close`, or it raises BufferError
+    """
+
+    def __init__(self, name: str) -> None:
+        self.SHARED = SharedMemory(name=name)
+        # Only the process that created the block unlinks it, not the resource tracker at our exit
+        if name not in CREATED:
+            resource_tracker.unregister(self.SHARED._name, "shared_memory")  # type: ignore[attr-defined]
+
+        buffer = self.SHARED.buf
+        assert buffer is not None
+        self.BUFFER = buffer
+        _, self.WIDTH, self.HEIGHT = HEADER.unpack_from(buffer)
+        self.SIZE = self.WIDTH * self.HEIGHT
+
+    def count(self) -> int:
+        """Frames written so far, 0 before the first"""
+        count: int = COUNTER.unpack_from(self.BUFFER)[0]
+        return count
+
+    def latest(self) -> tuple[int, memoryview]:
+        """The frame counter and a view of that frame, palette indices WIDTH per row"""
+        count = self.count()
+        offset = HEADER.size + (count & 1) * self.SIZE
+        return count, self.BUFFER[offset : offset + self.SIZE]
+
+    def copy_latest(self) -> tuple[int, bytes]:
+        """The frame counter and a copy of that frame, which stays valid after `close`"""
+        count, view = self.latest()
+        with view:
+            return count, bytes(view)
+
+    def close(self) -> None:
+        try:
+            self.BUFFER.release()
+        finally:
+            self.SHARED.close()
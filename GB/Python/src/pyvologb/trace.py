@@ -0,0 +1,213 @@
+import argparse
+import os
+import struct
+import sys
+from typing import TYPE_CHECKING, Iterator
+
+# Only for annotations, rendering a trace offline doesn't need pygame
+if TYPE_CHECKING:
+    from pyvologb.mmu import MMU
+    from pyvologb.registers import Registers
+
+# A F B C D E H L, SP, PC, 4 bytes from PC, 4 bytes from SP
+RECORD = struct.Struct("<8B2H8B")
+
+
+class TraceRecorder:
+    """Records the CPU state before each instruction as fixed size binary records
+
+    Records are packed into a preallocated buffer of `capacity` records. Streamed, the buffer
+    is written to `path` whenever it fills. As a ring, only the last `capacity` records are
+    kept and written on close. Render the file as text with `py -m pyvologb.trace`
+    """
+
+    def __init__(
+        self,
+        mmu: "MMU",
+        R: "Registers",
+        path: str,
+        capacity: int = 0x10000,
+        ring: bool = False,
+    ) -> None:
+        self.mmu = mmu
+        self.R = R
+        self.RING = ring
+        self.WRAPPED = False
+
+        self.BUFFER = bytearray(RECORD.size * capacity)
+        self.END = len(self.BUFFER)
+        self.OFFSET = 0
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.FILE = open(path, "wb")
+
+    def record(self) -> None:
+        R = self.R
+        PAGES = self.mmu.READ_PAGES
+        PC = R.PC
+        SP = R.SP
+
+        # Index the pages directly unless the 4 bytes cross into the next one or aren't paged
+        PC_MEM: memoryview | bytes | None = PAGES[PC >> 8]
+        PC_LOW = PC & 0xFF
+        if PC_MEM is None or PC_LOW > 0xFC:
+            PC_MEM = self.read_memory(PC)
+            PC_LOW = 0
+        SP_MEM: memoryview | bytes | None = PAGES[SP >> 8]
+        SP_LOW = SP & 0xFF
+        if SP_MEM is None or SP_LOW > 0xFC:
+            SP_MEM = self.read_memory(SP)
+            SP_LOW = 0
+
+        RECORD.pack_into(
+            self.BUFFER,
+            self.OFFSET,
+            R.A,
+            R.F,
+            R.B,
+            R.C,
+            R.D,
+            R.E,
+            R.H,
+            R.L,
+            SP,
+            PC,
+            PC_MEM[PC_LOW],
+            PC_MEM[PC_LOW + 1],
+            PC_MEM[PC_LOW + 2],
+            PC_MEM[PC_LOW + 3],
+            SP_MEM[SP_LOW],
+            SP_MEM[SP_LOW + 1],
+            SP_MEM[SP_LOW + 2],
+            SP_MEM[SP_LOW + 3],
+        )
+        self.OFFSET += RECORD.size
+        if self.OFFSET == self.END:
+            self.OFFSET = 0
+            if self.RING:
+                self.WRAPPED = True
+            else:
+                self.FILE.write(self.BUFFER)
+
+    def read_memory(self, address: int) -> bytes:
+        """The 4 bytes from `address` through get_memory"""
+        get_memory = self.mmu.get_memory
+        return bytes([get_memory((address + i) & 0xFFFF) for i in range(4)])
+
+    def close(self) -> None:
+        """Writes out the records still buffered, oldest first"""
+        if self.WRAPPED:
+            self.FILE.write(memoryview(self.BUFFER)[self.OFFSET :])
+        self.FILE.write(memoryview(self.BUFFER)[: self.OFFSET])
+        self.FILE.close()
+
+
+def format_record(record: tuple[int, ...], sp_mem: bool = False) -> str:
+    """One unpacked record as a Gameboy Doctor log line, SPMEM is not part of the format"""
+    A, F, B, C, D, E, H, L, SP, PC, *MEM = record
+    line = (
+        f"A:{A:02X} F:{F:02X} B:{B:02X} C:{C:02X} D:{D:02X} E:{E:02X} H:{H:02X} L:{L:02X} "
+        f"SP:{SP:04X} PC:{PC:04X} PCMEM:{MEM[0]:02X},{MEM[1]:02X},{MEM[2]:02X},{MEM[3]:02X}"
+    )
+    if sp_mem:
+        line += f" SPMEM:{MEM[4]:02X},{MEM[5]:02X},{MEM[6]:02X},{MEM[7]:02X}"
+    return line
+
+
+def fields(line: str) -> dict[str, str]:
+    """Fields of a Gameboy Doctor log line by name, e.g. {"A": "01", "PCMEM": "00,C3,50,01"}"""
+    return {name: value for name, _, value in (field.partition(":") for field in line.split())}
+
+
+class TraceComparison:
+    """Checks the CPU state before each instruction against a Gameboy Doctor log
+
+    The log is read a line at a time alongside execution. Only the fields in the reference
+    line are compared, so logs without PCMEM still work
+    """
+
+    def __init__(self, mmu: "MMU", R: "Registers", path: str) -> None:
+        self.mmu = mmu
+        self.R = R
+        self.FILE = open(path)
+        self.COUNT = 0
+        self.PREVIOUS = ""
+
+    def state(self) -> str:
+        R = self.R
+        get_memory = self.mmu.get_memory
+        PC = R.PC
+        SP = R.SP
+        return format_record(
+            (R.A, R.F, R.B, R.C, R.D, R.E, R.H, R.L, SP, PC)
+            + tuple(get_memory((PC + i) & 0xFFFF) for i in range(4))
+            + tuple(get_memory((SP + i) & 0xFFFF) for i in range(4)),
+            sp_mem=True,
+        )
+
+    def check(self) -> str | None:
+        """Returns a description of the first divergence or of the reference log ending, None
+        while they match"""
+        reference = self.FILE.readline()
+        if not reference:
+            return f"Reference log ended, {self.COUNT} instructions matched"
+        reference = reference.strip()
+        state = self.state()
+
+        if not state.startswith(reference):
+            expected = fields(reference)
+            actual = fields(state)
+            diff = [
+                f"  {name:<6}expected {value:<12} got {actual.get(name, '-')}"
+                for name, value in expected.items()
+                if actual.get(name) != value
+            ]
+            if diff:
+                return "\n".join(
+                    [
+                        f"Diverged from the reference log at line {self.COUNT + 1}",
+                        f"  after   {self.PREVIOUS}",
+                        f"  state   {state}",
+                        *diff,
+                    ]
+                )
+
+        self.COUNT += 1
+        self.PREVIOUS = state
+        return None
+
+    def close(self) -> None:
+        self.FILE.close()
+
+
+def read_trace(path: str) -> Iterator[tuple[int, ...]]:
+    """Unpacked records of a trace file, read in chunks"""
+    chunk = RECORD.size * 0x1000
+    with open(path, "rb") as f:
+        while data := f.read(chunk):
+            yield from RECORD.iter_unpack(data[: len(data) - len(data) % RECORD.size])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Render a binary trace from --mem-dump as a Gameboy Doctor log"
+    )
+    parser.add_argument("trace")
+    parser.add_argument("-o", "--output", help="log file, standard output by default")
+    parser.add_argument("--sp-mem", action="store_true", default=False)
+    args = parser.parse_args()
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for record in read_trace(args.trace):
+            out.write(format_record(record, args.sp_mem) + "\n")
+    except BrokenPipeError:
+        # piped into head or similar
+        sys.stderr.close()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
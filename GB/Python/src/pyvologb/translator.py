@@ -0,0 +1,470 @@
+import re
+from bisect import bisect_left
+from typing import Callable
+from pyvologb.mmu import MMU
+from pyvologb.opcodes import CYCLES, Opcodes
+from pyvologb.scheduler import Scheduler
+
+ILLEGAL_OPCODES = {0xD3, 0xDB, 0xDD, 0xE3, 0xE4, 0xEB, 0xEC, 0xED, 0xF4, 0xFC, 0xFD}
+
+# Jumps, calls, returns, and anything changing IME or HALT, ends a block
+BLOCK_END_OPCODES = {
+    0x10, 0x18, 0x20, 0x28, 0x30, 0x38, 0x76,
+    0xC0, 0xC2, 0xC3, 0xC4, 0xC7, 0xC8, 0xC9, 0xCA, 0xCC, 0xCD, 0xCF,
+    0xD0, 0xD2, 0xD4, 0xD7, 0xD8, 0xD9, 0xDA, 0xDC, 0xDF,
+    0xE7, 0xE9, 0xEF, 0xF3, 0xF7, 0xFB, 0xFF,
+}  # fmt: skip
+
+# Opcodes writing memory, through an address or the stack
+WRITE_OPCODES = {
+    0x02, 0x08, 0x12, 0x22, 0x32, 0x34, 0x35, 0x36,
+    0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x77,
+    0xC5, 0xD5, 0xE5, 0xF5, 0xE0, 0xE2, 0xEA,
+} | {0x100 | opcode for opcode in range(0x100) if opcode & 7 == 6 and not 0x40 <= opcode < 0x80}  # fmt: skip
+
+# Opcodes reading or writing memory
+MEMORY_OPCODES = WRITE_OPCODES | {
+    0x0A, 0x1A, 0x2A, 0x3A, 0xC1, 0xD1, 0xE1, 0xF1, 0xF0, 0xF2, 0xFA,
+} | {opcode for opcode in range(0x40, 0xC0) if opcode & 7 == 6 and opcode != 0x76} | {
+    0x100 | opcode for opcode in range(0x100) if opcode & 7 == 6
+}  # fmt: skip
+
+MAX_BLOCK_LENGTH = 64
+
+# Register operands, by the low 3 bits of an opcode. 6 is [HL]
+REGISTERS = ["B", "C", "D", "E", "H", "L", "", "A"]
+PAIRS = ["B", "D", "H"]
+
+HL = "R.H << 8 | R.L"
+
+FLAGS = ["ZERO", "SUBTRACTION", "HALFCARRY", "CARRY"]
+FLAG_WRITE = re.compile(r"R\.(ZERO|SUBTRACTION|HALFCARRY|CARRY) = (.*)")
+FLAG_READ = re.compile(r"R\.(ZERO|SUBTRACTION|HALFCARRY|CARRY)\b(?! = )")
+TEMPLATE_LOCALS = re.compile(r"\b([acvk])\b")
+
+
+def flush_flags(flags: dict[str, str], indent: str) -> list[str]:
+    """Assignments for the deferred flags"""
+    return [f"{indent}R.{flag} = {flags[flag]}" for flag in FLAGS if flag in flags]
+
+
+def alu_lines(operation: int, value: str) -> list[str]:
+    """ADD, ADC, SUB, SBC, AND, XOR, OR, CP of A and `value`, as the Opcodes handlers compute them"""
+    match operation:
+        case 0 | 1:
+            carry = " + k" if operation == 1 else ""
+            return [
+                "k = R.CARRY" if operation == 1 else "",
+                "a = R.A",
+                f"v = {value}",
+                f"c = a + v{carry}",
+                "R.A = c & 0xFF",
+                "R.ZERO = (c & 0xFF == 0) & 1",
+                "R.SUBTRACTION = 0",
+                f"R.HALFCARRY = ((a & 0xF) + (v & 0xF){carry} > 0xF) & 1",
+                "R.CARRY = (c > 0xFF) & 1",
+            ]
+        case 2 | 3 | 7:
+            carry = " + k" if operation == 3 else ""
+            result = "" if operation == 7 else "R.A = c & 0xFF"
+            return [
+                "k = R.CARRY" if operation == 3 else "",
+                "a = R.A",
+                f"v = {value}",
+                f"c = a - (v{carry})",
+                result,
+                "R.ZERO = (c & 0xFF == 0) & 1",
+                "R.SUBTRACTION = 1",
+                f"R.HALFCARRY = ((a & 0xF) - ((v & 0xF){carry}) < 0) & 1",
+                "R.CARRY = (c < 0) & 1",
+            ]
+        case _:
+            operator = {4: "&", 5: "^", 6: "|"}[operation]
+            return [
+                f"c = R.A {operator} {value}",
+                "R.A = c",
+                "R.ZERO = (c == 0) & 1",
+                "R.SUBTRACTION = 0",
+                f"R.HALFCARRY = {1 if operation == 4 else 0}",
+                "R.CARRY = 0",
+            ]
+
+
+def inline_lines(index: int, operand: int) -> list[str] | None:
+    """Source for an instruction inside a block, None to call its handler instead"""
+    match index:
+        case 0x00:
+            return []
+        case 0x01 | 0x11 | 0x21:
+            pair = PAIRS[index >> 4]
+            low = REGISTERS[REGISTERS.index(pair) + 1]
+            return [f"R.{pair} = {operand >> 8:#x}", f"R.{low} = {operand & 0xFF:#x}"]
+        case 0x31:
+            return [f"R.SP = {operand:#x}"]
+        case 0x03 | 0x13 | 0x23 | 0x0B | 0x1B | 0x2B:
+            pair = PAIRS[index >> 4]
+            low = REGISTERS[REGISTERS.index(pair) + 1]
+            step = "+" if index & 0x08 == 0 else "-"
+            return [
+                f"v = ((R.{pair} << 8 | R.{low}) {step} 1) & 0xFFFF",
+                f"R.{pair} = v >> 8",
+                f"R.{low} = v & 0xFF",
+            ]
+        case 0x33 | 0x3B:
+            return [f"R.SP = (R.SP {'+' if index == 0x33 else '-'} 1) & 0xFFFF"]
+        case 0x22 | 0x32 | 0x2A | 0x3A:
+            if index & 0x08:
+                access = "R.A = mmu.get_memory(v)"
+            else:
+                access = "mmu.set_memory(v, R.A)"
+            return [
+                f"v = {HL}",
+                access,
+                f"v = (v {'+' if index & 0x10 == 0 else '-'} 1) & 0xFFFF",
+                "R.H = v >> 8",
+                "R.L = v & 0xFF",
+            ]
+        case 0x0A | 0x1A:
+            pair = PAIRS[index >> 4]
+            low = REGISTERS[REGISTERS.index(pair) + 1]
+            return [f"R.A = mmu.get_memory(R.{pair} << 8 | R.{low})"]
+        case 0x02 | 0x12:
+            pair = PAIRS[index >> 4]
+            low = REGISTERS[REGISTERS.index(pair) + 1]
+            return [f"mmu.set_memory(R.{pair} << 8 | R.{low}, R.A)"]
+        case 0xE0:
+            return [f"mmu.set_memory({0xFF00 + operand:#x}, R.A)"]
+        case 0xF0:
+            return [f"R.A = mmu.get_memory({0xFF00 + operand:#x})"]
+        case 0xEA:
+            return [f"mmu.set_memory({operand:#x}, R.A)"]
+        case 0xFA:
+            return [f"R.A = mmu.get_memory({operand:#x})"]
+        case 0x36:
+            return [f"mmu.set_memory({HL}, {operand:#x})"]
+        case _ if index < 0x40 and index & 7 in (4, 5) and index != 0x34 and index != 0x35:
+            register = REGISTERS[index >> 3]
+            if index & 7 == 4:
+                return [
+                    f"v = R.{register}",
+                    "R.ZERO = ((v + 1) & 0xFF == 0) & 1",
+                    "R.SUBTRACTION = 0",
+                    "R.HALFCARRY = ((v & 0xF) + 1 > 0xF) & 1",
+                    f"R.{register} = (v + 1) & 0xFF",
+                ]
+            return [
+                f"v = R.{register}",
+                "R.ZERO = ((v - 1) & 0xFF == 0) & 1",
+                "R.SUBTRACTION = 1",
+                "R.HALFCARRY = ((v & 0xF) - 1 < 0) & 1",
+                f"R.{register} = (v - 1) & 0xFF",
+            ]
+        case _ if index < 0x40 and index & 7 == 6 and index != 0x36:
+            return [f"R.{REGISTERS[index >> 3]} = {operand:#x}"]
+        case _ if 0x40 <= index < 0x80 and index != 0x76:
+            target = REGISTERS[index >> 3 & 7]
+            source = REGISTERS[index & 7]
+            if not target:
+                return [f"mmu.set_memory({HL}, R.{source})"]
+            if not source:
+                return [f"R.{target} = mmu.get_memory({HL})"]
+            return [f"R.{target} = R.{source}"]
+        case 0x87 | 0x8F:
+            # ADD_87 and ADC_8F take the half carry from the updated A, keep their handlers
+            return None
+        case _ if 0x80 <= index < 0xC0:
+            source = REGISTERS[index & 7]
+            return alu_lines(index >> 3 & 7, f"R.{source}" if source else f"mmu.get_memory({HL})")
+        case _ if index < 0x100 and index & 0xC7 == 0xC6:
+            return alu_lines(index >> 3 & 7, f"{operand:#x}")
+    return None
+
+
+def inline_branch(index: int, operand: int, next_pc: int, elapsed: int) -> list[str] | None:
+    """Source for a jump ending a block, including its return. None to call its handler instead"""
+    conditions = {0: "R.ZERO == 0", 1: "R.ZERO == 1", 2: "R.CARRY == 0", 3: "R.CARRY == 1"}
+    match index:
+        case 0x18 | 0x20 | 0x28 | 0x30 | 0x38:
+            # JR adds to PC without wrapping, as JR_18
+            target = next_pc + ((operand ^ 0x80) - 0x80)
+            taken, not_taken = 12, 8
+        case 0xC3 | 0xC2 | 0xCA | 0xD2 | 0xDA:
+            target = operand
+            taken, not_taken = 16, 12
+        case _:
+            return None
+
+    jump = [f"R.PC = {target:#x}", f"return {elapsed + taken}"]
+    if index in (0x18, 0xC3):
+        return jump
+    return (
+        [f"if {conditions[index >> 3 & 3]}:"]
+        + ["    " + line for line in jump]
+        + [f"R.PC = {next_pc:#x}", f"return {elapsed + not_taken}"]
+    )
+
+
+class Block:
+    def __init__(self, run: Callable[[], int], start: int, end: int, starts: list[int]) -> None:
+        self.RUN = run  # executes the block, returns the cycles to tick
+        self.START = start
+        self.END = end
+        self.STARTS = starts  # cycles into the block each instruction starts at
+
+    def instructions(self, cycles: int) -> int:
+        """Instructions executed by a run returning `cycles`
+
+        A run returns either where an instruction starts, or past the start of the last one
+        """
+        return bisect_left(self.STARTS, cycles)
+
+
+class BlockCache:
+    """Translates straight-line runs of instructions into one generated function each
+
+    Blocks are cached by PC, and ROM bank for 4000 -> 7FFF. A block never crosses a 256 byte page.
+    Common instructions are generated inline from `inline_lines`, the rest call their Opcodes
+    handlers with the operands decoded once. Either way there's no fetch, dispatch, interrupt
+    check or IO.tick in between.
+
+    Flags set by inline instructions are evaluated lazily. Their assignments are held back until a
+    flag is read, a handler is called, or the block returns, so flags overwritten before then are
+    never computed.
+
+    A block returns before any instruction the next scheduler event is due before, so the cycles
+    are ticked once at the end. The scheduler cycle is moved forward before memory accesses for
+    IO reads, and the block returns early after a write outside the page table.
+
+    Writes to RAM pages holding blocks are routed through `write` by removing the page from the
+    MMU write page table, so modified code is retranslated.
+    """
+
+    def __init__(self, mmu: MMU, opcodes: Opcodes, scheduler: Scheduler) -> None:
+        self.mmu = mmu
+        self.opcodes = opcodes
+        self.R = opcodes.R
+        self.SCHEDULER = scheduler
+
+        self.CACHE: dict[int, Block | None] = {}
+        self.PAGE_BLOCKS: list[list[int]] = [[] for _ in range(0x100)]
+
+        # RAM pages with blocks, and their write page table entries while they're protected
+        self.CODE_PAGES = [False] * 0x100
+        self.SAVED_PAGES: list[memoryview | None] = [None] * 0x100
+
+        self.HITS = 0
+        self.MISSES = 0
+        self.INVALIDATIONS = 0
+
+        mmu.BLOCKS = self
+
+    def lookup(self, pc: int) -> Block | None:
+        """Get the block starting at pc, translating it on a miss. None if it can't be translated"""
+        key = pc | self.mmu.CURRENT_BANK << 16 if 0x4000 <= pc < 0x8000 else pc
+
+        block = self.CACHE.get(key)
+        if block is not None:
+            self.HITS += 1
+            return block
+        if key in self.CACHE:
+            return None
+
+        self.MISSES += 1
+        block = self.translate(pc)
+        self.CACHE[key] = block
+        if block is not None:
+            self.PAGE_BLOCKS[pc >> 8].append(key)
+            if pc >= 0x8000:
+                self.protect(pc >> 8)
+        return block
+
+    def translate(self, pc: int) -> Block | None:
+        page = pc >> 8
+        view = self.mmu.READ_PAGES[page]
+        # ROM is read-only, RAM needs to be in the write page table to catch code changes
+        if view is None or (
+            pc >= 0x8000
+            and self.mmu.WRITE_PAGES[page] is None
+            and not self.CODE_PAGES[page]
+        ):
+            return None
+
+        dispatch = self.opcodes.DISPATCH
+        namespace: dict[str, object] = {"S": self.SCHEDULER, "R": self.R, "mmu": self.mmu}
+        lines = ["def run():", "    start = S.CYCLE", "    limit = S.NEXT_DEADLINE - start"]
+
+        offset = pc & 0xFF
+        elapsed = 0
+        synced = False
+        last = False
+        count = 0
+        starts: list[int] = []
+        # flag assignments not yet made, by flag
+        flags: dict[str, str] = {}
+
+        while count < MAX_BLOCK_LENGTH:
+            opcode = view[offset]
+            if opcode in ILLEGAL_OPCODES:
+                break
+
+            handler, width = dispatch[opcode]
+            if offset + 1 + width > 0x100:
+                break
+
+            opcode_offset = offset
+            operand = int.from_bytes(view[offset + 1 : offset + 1 + width], "little")
+            index = opcode
+            if opcode == 0xCB:
+                index = 0x100 | operand
+                handler = dispatch[index][0]
+                args = ""
+            else:
+                args = f"{operand:#x}" if width else ""
+
+            offset += 1 + width
+            next_pc = (pc & 0xFF00) + offset
+            last = (
+                opcode in BLOCK_END_OPCODES
+                or count == MAX_BLOCK_LENGTH - 1
+                or offset == 0x100
+            )
+
+            if count:
+                # the next scheduler event is due before this instruction
+                lines.append(f"    if limit <= {elapsed}:")
+                lines.extend(flush_flags(flags, "        "))
+                lines.append(f"        R.PC = {(pc & 0xFF00) + opcode_offset:#x}")
+                if synced:
+                    lines.append("        S.CYCLE = start")
+                lines.append(f"        return {elapsed}")
+
+            name = f"h{count}"
+            namespace[name] = handler
+            starts.append(elapsed)
+            count += 1
+
+            if index in MEMORY_OPCODES and elapsed:
+                lines.append(f"    S.CYCLE = start + {elapsed}")
+                synced = True
+
+            source = inline_lines(index, operand)
+            if source is None or last or any(FLAG_READ.search(line) for line in source):
+                lines.extend(flush_flags(flags, "    "))
+                flags.clear()
+            elif source:
+                # defer the flags, each template's locals get their own names so they stay valid
+                renamed = []
+                for line in source:
+                    line = TEMPLATE_LOCALS.sub(rf"\g<1>{count}", line)
+                    match = FLAG_WRITE.match(line)
+                    if match is None:
+                        renamed.append(line)
+                    else:
+                        flags[match[1]] = match[2]
+                source = renamed
+
+            if last:
+                branch = inline_branch(index, operand, next_pc, elapsed)
+                if branch is not None:
+                    for line in branch:
+                        if synced and line.lstrip().startswith("return"):
+                            indent = line[: len(line) - len(line.lstrip())]
+                            lines.append(f"    {indent}S.CYCLE = start")
+                        lines.append("    " + line)
+                    break
+
+                lines.append(f"    R.PC = {next_pc:#x}")
+                if source is None:
+                    lines.append(f"    cycles = {name}({args})")
+                else:
+                    lines.extend("    " + line for line in source if line)
+                    lines.append(f"    cycles = {CYCLES[index]}")
+                if synced:
+                    lines.append("    S.CYCLE = start")
+                lines.append(f"    return {elapsed} + cycles")
+                break
+
+            if index in WRITE_OPCODES:
+                lines.append("    writes = mmu.UNPAGED_WRITES")
+            if source is None:
+                lines.append(f"    {name}({args})")
+            else:
+                lines.extend("    " + line for line in source if line)
+            elapsed += CYCLES[index]
+            if index in WRITE_OPCODES:
+                # the write may have hit IO, the scheduler, or code
+                lines.append("    if mmu.UNPAGED_WRITES != writes:")
+                lines.extend(flush_flags(flags, "        "))
+                lines.append(f"        R.PC = {next_pc:#x}")
+                if synced:
+                    lines.append("        S.CYCLE = start")
+                lines.append(f"        return {elapsed}")
+
+        if count == 0:
+            return None
+
+        if not last:
+            # stopped before an illegal opcode, or one crossing the page
+            lines.extend(flush_flags(flags, "    "))
+            lines.append(f"    R.PC = {(pc & 0xFF00) + offset:#x}")
+            if synced:
+                lines.append("    S.CYCLE = start")
+            lines.append(f"    return {elapsed}")
+
+        exec(compile("\n".join(lines), f"<block {pc:#06x}>", "exec"), namespace)
+        run: Callable[[], int] = namespace["run"]  # type: ignore[assignment]
+
+        return Block(run, pc, (pc & 0xFF00) + offset, starts)
+
+    def protect(self, page: int) -> None:
+        """Route writes to a RAM page through `write`"""
+        if not self.CODE_PAGES[page]:
+            self.CODE_PAGES[page] = True
+            self.SAVED_PAGES[page] = self.mmu.WRITE_PAGES[page]
+            self.mmu.WRITE_PAGES[page] = None
+
+    def write(self, address: int, value: int) -> None:
+        """Write to a protected page, dropping the blocks covering the address"""
+        page = address >> 8
+        view = self.SAVED_PAGES[page]
+        assert view is not None
+        if view[address & 0xFF] == value:
+            return
+        view[address & 0xFF] = value
+
+        keys = self.PAGE_BLOCKS[page]
+        for key in [key for key in keys if self.covers(key, address)]:
+            keys.remove(key)
+            del self.CACHE[key]
+            self.INVALIDATIONS += 1
+
+        if not keys:
+            self.CODE_PAGES[page] = False
+            self.mmu.WRITE_PAGES[page] = view
+            self.SAVED_PAGES[page] = None
+
+    def covers(self, key: int, address: int) -> bool:
+        block = self.CACHE[key]
+        return block is not None and block.START <= address < block.END
+
+    def invalidate_range(self, start: int, end: int) -> None:
+        """Drop the blocks starting in start -> end, for every bank"""
+        for page in range(start >> 8, end >> 8):
+            for key in self.PAGE_BLOCKS[page]:
+                del self.CACHE[key]
+                self.INVALIDATIONS += 1
+            self.PAGE_BLOCKS[page] = []
+
+            if self.CODE_PAGES[page]:
+                self.CODE_PAGES[page] = False
+                self.mmu.WRITE_PAGES[page] = self.SAVED_PAGES[page]
+                self.SAVED_PAGES[page] = None
+
+        for key in [key for key in self.CACHE if start <= key & 0xFFFF < end]:
+            del self.CACHE[key]  # untranslatable entries
+
+    def stats(self) -> str:
+        return (
+            f"blocks: {sum(len(keys) for keys in self.PAGE_BLOCKS)} "
+            f"hits: {self.HITS} misses: {self.MISSES} invalidations: {self.INVALIDATIONS}"
+        )
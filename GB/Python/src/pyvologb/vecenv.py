@@ -0,0 +1,190 @@
+import contextlib
+import io
+import multiprocessing
+import os
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any
+
+from pyvologb.emulator import Emulator
+from pyvologb.mmu import BUTTONS
+
+SCREEN_WIDTH = 160
+SCREEN_HEIGHT = 144
+SCREEN_SIZE = SCREEN_WIDTH * SCREEN_HEIGHT
+
+
+def buttons(action: int) -> list[str]:
+    """The buttons held by an action, bit i of the action is BUTTONS[i]"""
+    return [button for i, button in enumerate(BUTTONS) if action >> i & 1]
+
+
+def worker(
+    connection: Connection,
+    rom_path: str,
+    first: int,
+    count: int,
+    shared_name: str,
+    state: bytes | None,
+    options: dict[str, Any],
+) -> None:
+    """Runs instances first -> first + count for a VecEnv, writing their screens into the shared
+    memory and answering each command once they're written"""
+    shared = SharedMemory(name=shared_name)
+    screens = shared.buf
+    assert screens is not None
+
+    # Serial output and unimplemented register warnings go to stdout, once per instance
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        emulators = [Emulator(rom_path, **options) for _ in range(count)]
+        if state is not None:
+            for emulator in emulators:
+                emulator.restore(state)
+        initial = [emulator.snapshot() for emulator in emulators]
+        held = [0] * count
+
+        while True:
+            match connection.recv():
+                case ("reset",):
+                    for emulator, initial_state in zip(emulators, initial):
+                        emulator.restore(initial_state)
+                    held = [0] * count
+                case ("step", actions, frames):
+                    for i, (emulator, action) in enumerate(zip(emulators, actions)):
+                        for button in buttons(held[i] & ~action):
+                            emulator.release(button)
+                        for button in buttons(action & ~held[i]):
+                            emulator.press(button)
+                        held[i] = action
+                        for _ in range(frames):
+                            emulator.run_frame()
+                case _:
+                    break
+
+            for i, emulator in enumerate(emulators):
+                offset = (first + i) * SCREEN_SIZE
+                screens[offset : offset + SCREEN_SIZE] = emulator.framebuffer()[:SCREEN_SIZE]
+            output.seek(0)
+            output.truncate()
+            connection.send(True)
+
+    screens.release()
+    shared.close()
+    connection.close()
+
+
+class VecEnv:
+    """Headless emulators of one ROM across a pool of worker processes, stepped together
+
+    An action is a bitmask of the buttons held, bit i for BUTTONS[i]. Each step holds one action
+    per instance for `frames_per_step` frames. Instances start from `state`, a savestate, or from
+    power on, and `reset` puts them back there.
+
+    Observations are the screens of every instance as palette indices 0 -> 3, or 4 while the
+    display is cleared, 160 per row. The workers write them into one shared memory block,
+    OBSERVATIONS, and reset and step return a view of each screen in it. The next reset or step
+    overwrites them, and close releases them. Copy a screen to keep it, and release any view taken
+    from one before close
+    """
+
+    def __init__(
+        self,
+        rom_path: str,
+        instances: int,
+        processes: int | None = None,
+        frames_per_step: int = 1,
+        state: bytes | None = None,
+        **options: Any,
+    ) -> None:
+        """`options` are passed to each Emulator, like skip_boot or jit"""
+        self.INSTANCES = instances
+        self.FRAMES_PER_STEP = frames_per_step
+        self.FRAMES = 0  # frames emulated by every instance together
+
+        self.SHARED = SharedMemory(create=True, size=instances * SCREEN_SIZE)
+        assert self.SHARED.buf is not None
+        self.OBSERVATIONS = self.SHARED.buf
+        self.SCREENS = [
+            self.OBSERVATIONS[i * SCREEN_SIZE : (i + 1) * SCREEN_SIZE]
+            for i in range(instances)
+        ]
+
+        # Instances split as evenly as possible, first -> first + count for each worker
+        processes = min(processes or os.cpu_count() or 1, instances)
+        self.WORKERS: list[tuple[BaseProcess, Connection, int, int]] = []
+        first = 0
+        for i in range(processes):
+            count = instances // processes + (i < instances % processes)
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=worker,
+                args=(
+                    worker_connection,
+                    os.path.abspath(rom_path),
+                    first,
+                    count,
+                    self.SHARED.name,
+                    state,
+                    options,
+                ),
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self.WORKERS.append((process, connection, first, count))
+            first += count
+
+    def send(self, commands: list[tuple[Any, ...]]) -> list[memoryview]:
+        """Send each worker its command, then wait for all of them"""
+        for (_, connection, _, _), command in zip(self.WORKERS, commands):
+            connection.send(command)
+        for _, connection, _, _ in self.WORKERS:
+            connection.recv()
+        return self.SCREENS
+
+    def reset(self) -> list[memoryview]:
+        return self.send([("reset",)] * len(self.WORKERS))
+
+    def step(self, actions: list[int]) -> list[memoryview]:
+        if len(actions) != self.INSTANCES:
+            raise Exception(f"Expected {self.INSTANCES} actions, got", len(actions))
+
+        self.FRAMES += self.INSTANCES * self.FRAMES_PER_STEP
+        return self.send(
+            [
+                ("step", actions[first : first + count], self.FRAMES_PER_STEP)
+                for _, _, first, count in self.WORKERS
+            ]
+        )
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory. Views taken from the screens have to be
+        released first, or this raises BufferError once the block is unlinked"""
+        try:
+            for process, connection, _, _ in self.WORKERS:
+                # A worker that died has closed its end already
+                with contextlib.suppress(BrokenPipeError):
+                    connection.send(("close",))
+                connection.close()
+                process.join()
+        finally:
+            self.WORKERS = []
+            for screen in self.SCREENS:
+                screen.release()
+            try:
+                self.SHARED.close()
+            finally:
+                self.SHARED.unlink()
+
+    def __enter__(self) -> "VecEnv":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,20 @@
+import os
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def make_rom(size: int = 0x8000, program: bytes = b"") -> str:
+    """Write a blank ROM image of `size` bytes with `program` placed at 0x150
+
+    The entry point at 0x100 jumps to the program. Returns the path of the image.
+    """
+    rom = bytearray(size)
+    rom[0x100:0x104] = bytes([0x00, 0xC3, 0x50, 0x01])
+    rom[0x148] = max(0, (size // 0x8000).bit_length() - 1)
+    rom[0x150 : 0x150 + len(program)] = program
+
+    fd, path = tempfile.mkstemp(suffix=".gb")
+    with os.fdopen(fd, "wb") as f:
+        f.write(rom)
+    return path
@@ -0,0 +1,76 @@
+"""The stepping API against the CPU loop in run_to
+
+Run from the src directory with `py -m unittest`
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from pyvologb.emulator import Emulator
+from pyvologb.trace import TraceComparison
+from tests.common import make_rom
+from tests.test_idle import LY_LOOP
+
+VBLANKS = 5
+
+
+class TestRunUntil(unittest.TestCase):
+    def create(self, **options: bool) -> Emulator:
+        rom_path = make_rom(program=LY_LOOP)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                emulator = Emulator(rom_path, skip_boot=True, **options)
+        finally:
+            os.remove(rom_path)
+        emulator.R.B = 0
+        return emulator
+
+    def test_skips_idle_loops(self) -> None:
+        expected = self.create()
+        self.assertTrue(expected.run_until(lambda: expected.R.B == VBLANKS))
+
+        for options in ({"skip_idle": True}, {"skip_idle": True, "jit": True}):
+            with self.subTest(**options):
+                emulator = self.create(**options)
+                self.assertTrue(emulator.run_until(lambda: emulator.R.B == VBLANKS))
+                # blocks run to their end before the predicate is checked again
+                if not options.get("jit"):
+                    self.assertEqual(expected.SCHEDULER.CYCLE, emulator.SCHEDULER.CYCLE)
+                assert emulator.IDLE is not None
+                self.assertGreater(emulator.IDLE.SKIPS, 0)
+
+    def test_stops_on_divergence(self) -> None:
+        # The states of the first instructions, with A wrong before the 21st
+        reference = self.create()
+        comparison = TraceComparison(reference.mmu, reference.R, os.devnull)
+        states = []
+        for _ in range(30):
+            states.append(comparison.state())
+            reference.step()
+        comparison.close()
+        state = states[20]
+        states[20] = f"A:{int(state[2:4], 16) ^ 0xFF:02X}" + state[4:]
+
+        with tempfile.NamedTemporaryFile("w", suffix=".log", delete=False) as f:
+            f.write("\n".join(states) + "\n")
+        try:
+            emulator = self.create()
+            emulator.COMPARISON = TraceComparison(emulator.mmu, emulator.R, f.name)
+            try:
+                self.assertFalse(emulator.run_until(lambda: False, max_cycles=1 << 20))
+            finally:
+                emulator.COMPARISON.close()
+        finally:
+            os.remove(f.name)
+
+        assert emulator.DIVERGENCE is not None
+        self.assertTrue(emulator.DIVERGENCE.startswith("Diverged from the reference log at line 21"))
+        self.assertIn(state, emulator.DIVERGENCE)
+        self.assertEqual(0, emulator.step())
+
+
+if __name__ == "__main__":
+    unittest.main()
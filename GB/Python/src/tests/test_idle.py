@@ -0,0 +1,72 @@
+"""Idle loop skipping against running every iteration
+
+Run from the src directory with `py -m unittest`
+"""
+
+import contextlib
+import io
+import os
+import unittest
+
+from pyvologb.emulator import Emulator
+from tests.common import make_rom
+
+FRAMES = 20
+
+# LD H,FF; LD L,80
+# wait: LD L,44; LD A,(HL); LD L,80; CP 90; JR NZ,wait  - reads LY through an L set in the loop
+# INC B; LDH A,(44); CP 90; JR Z,-6; JR wait  - counts V-Blanks, waits for LY to move on
+REGISTER_IN_LOOP = bytes(
+    [0x26, 0xFF, 0x2E, 0x80, 0x2E, 0x44, 0x7E, 0x2E, 0x80, 0xFE, 0x90, 0x20, 0xF7]
+    + [0x04, 0xF0, 0x44, 0xFE, 0x90, 0x28, 0xFA, 0x18, 0xEE]
+)
+REGISTER_IN_LOOP_START = 0x154
+
+# wait: LDH A,(44); CP 90; JR NZ,wait; INC B; LDH A,(44); CP 90; JR Z,-6; JR wait
+LY_LOOP = bytes(
+    [0xF0, 0x44, 0xFE, 0x90, 0x20, 0xFA, 0x04, 0xF0, 0x44, 0xFE, 0x90, 0x28, 0xFA, 0x18, 0xF3]
+)
+
+
+class TestIdleLoops(unittest.TestCase):
+    def run_frames(self, program: bytes, **options: bool) -> Emulator:
+        rom_path = make_rom(program=program)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                emulator = Emulator(rom_path, skip_boot=True, **options)
+        finally:
+            os.remove(rom_path)
+        emulator.R.B = 0
+        for _ in range(FRAMES):
+            emulator.run_frame()
+        return emulator
+
+    def test_register_written_before_read(self) -> None:
+        """The loop reads LY through HL, but only once L is set inside it. HL at the start of the
+        loop points at FF80, which never changes, so watching it would hang"""
+        expected = self.run_frames(REGISTER_IN_LOOP).R.B
+        self.assertGreaterEqual(expected, FRAMES - 1)
+
+        for options in ({"skip_idle": True}, {"skip_idle": True, "jit": True}):
+            with self.subTest(**options):
+                emulator = self.run_frames(REGISTER_IN_LOOP, **options)
+                self.assertEqual(expected, emulator.R.B)
+                assert emulator.IDLE is not None
+                emulator.R.PC = REGISTER_IN_LOOP_START
+                emulator.R.H, emulator.R.L = 0xFF, 0x80
+                self.assertIsNone(emulator.IDLE.decode_loop(REGISTER_IN_LOOP_START))
+
+    def test_skips(self) -> None:
+        expected = self.run_frames(LY_LOOP).R.B
+        self.assertGreaterEqual(expected, FRAMES - 1)
+
+        for options in ({"skip_idle": True}, {"skip_idle": True, "jit": True}):
+            with self.subTest(**options):
+                emulator = self.run_frames(LY_LOOP, **options)
+                self.assertEqual(expected, emulator.R.B)
+                assert emulator.IDLE is not None
+                self.assertGreater(emulator.IDLE.SKIPS, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Rewind history against the savestates it recorded
+
+Run from the src directory with `py -m unittest`
+"""
+
+import os
+import unittest
+
+from pyvologb.mmu import MMU
+from pyvologb.ppu import FRAME_CYCLES
+from pyvologb.registers import Registers
+from pyvologb.rewind import Rewind
+from tests.test_savestate import create, make_interrupt_rom
+
+FRAMES = 12
+
+
+class RecordingRewind(Rewind):
+    """Keeps each state recorded whole in HISTORY"""
+
+    def __init__(self, mmu: MMU, R: Registers, interval: int) -> None:
+        self.HISTORY: list[bytes] = []
+        super().__init__(mmu, R, interval=interval)
+
+    def record(self) -> None:
+        super().record()
+        self.HISTORY.append(self.LAST)
+
+
+class TestRewind(unittest.TestCase):
+    ROM_PATH: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.ROM_PATH = make_interrupt_rom()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        os.remove(cls.ROM_PATH)
+
+    def test_step_back(self) -> None:
+        for options in ({}, {"jit": True}):
+            for interval in (1, 3):
+                with self.subTest(interval=interval, **options):
+                    emulator = create(self.ROM_PATH, **options)
+                    rewind = RecordingRewind(emulator.mmu, emulator.R, interval)
+                    emulator.REWIND = rewind
+                    emulator.run_cycles(FRAMES * FRAME_CYCLES + 1234)
+                    history = rewind.HISTORY
+                    self.assertEqual(FRAMES // interval + 1, len(history))
+
+                    for expected in reversed(history[:-1]):
+                        self.assertTrue(rewind.step_back())
+                        self.assertEqual(expected, emulator.snapshot())
+                    self.assertFalse(rewind.step_back())
+                    self.assertEqual(history[0], emulator.snapshot())
+
+    def test_requested(self) -> None:
+        """The CPU loop steps back before running on when a front-end sets REQUESTED"""
+        emulator = create(self.ROM_PATH)
+        rewind = RecordingRewind(emulator.mmu, emulator.R, 1)
+        emulator.REWIND = rewind
+        emulator.run_cycles(FRAMES * FRAME_CYCLES + 1234)
+
+        expected = create(self.ROM_PATH)
+        expected.restore(rewind.HISTORY[-2])
+        expected.step()
+
+        rewind.REQUESTED = True
+        emulator.step()
+        self.assertFalse(rewind.REQUESTED)
+        self.assertEqual(expected.snapshot(), emulator.snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Savestates against running on without one
+
+Run from the src directory with `py -m unittest`
+"""
+
+import contextlib
+import io
+import os
+import unittest
+
+from pyvologb.emulator import Emulator
+from pyvologb.ppu import FRAME_CYCLES
+from pyvologb.savestate import HEADER, MAGIC, VERSION
+from tests.common import make_rom
+
+# Cycles run before a snapshot, at points through a frame, and after it
+SNAPSHOTS = [10 * FRAME_CYCLES + n * FRAME_CYCLES // 8 for n in range(8)]
+AFTER = 20 * FRAME_CYCLES + 4321
+
+# Timer at 4096 Hz, V-Blank and timer interrupts on
+# LD A,4; LDH (07),A; LD A,5; LDH (FF),A; EI; LD HL,C100
+# loop: LD A,(HL); ADD A,B; LD (HL),A; INC L; INC B; LD (8010),A; RL C; BIT 3,B; JR NZ,+1; HALT;
+# JR loop
+PROGRAM = bytes(
+    [0x3E, 0x04, 0xE0, 0x07, 0x3E, 0x05, 0xE0, 0xFF, 0xFB, 0x21, 0x00, 0xC1]
+    + [0x7E, 0x80, 0x77, 0x2C, 0x04, 0xEA, 0x10, 0x80, 0xCB, 0x11, 0xCB, 0x58, 0x20, 0x01, 0x76]
+    + [0x18, 0xEF]
+)
+
+# Handlers counting interrupts at C000 and C001, which also change IE and TMA as they run
+# V-Blank: PUSH AF; LD A,(C000); INC A; LD (C000),A; LDH A,(FF); XOR 4; LDH (FF),A; POP AF; RETI
+# Timer: PUSH AF; LD A,(C001); INC A; LD (C001),A; LDH (06),A; POP AF; RETI
+HANDLERS = {
+    0x0200: bytes([0xF5, 0xFA, 0x00, 0xC0, 0x3C, 0xEA, 0x00, 0xC0, 0xF0, 0xFF, 0xEE, 0x04])
+    + bytes([0xE0, 0xFF, 0xF1, 0xD9]),
+    0x0220: bytes([0xF5, 0xFA, 0x01, 0xC0, 0x3C, 0xEA, 0x01, 0xC0, 0xE0, 0x06, 0xF1, 0xD9]),
+}
+# JP to each handler from its vector
+VECTORS = {0x40: bytes([0xC3, 0x00, 0x02]), 0x50: bytes([0xC3, 0x20, 0x02])}
+
+
+def make_interrupt_rom() -> str:
+    """A ROM running PROGRAM with the V-Blank and timer HANDLERS"""
+    path = make_rom(program=PROGRAM)
+    with open(path, "r+b") as f:
+        for address, code in (HANDLERS | VECTORS).items():
+            f.seek(address)
+            f.write(code)
+    return path
+
+
+def create(rom_path: str, **options: bool) -> Emulator:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Emulator(rom_path, skip_boot=True, **options)
+
+
+class TestSavestate(unittest.TestCase):
+    ROM_PATH: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.ROM_PATH = make_interrupt_rom()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        os.remove(cls.ROM_PATH)
+
+    def test_restore_runs_on_the_same(self) -> None:
+        for options in ({}, {"jit": True}):
+            for before in SNAPSHOTS:
+                with self.subTest(before=before, **options):
+                    emulator = create(self.ROM_PATH, **options)
+                    emulator.run_cycles(before)
+                    state = emulator.snapshot()
+                    emulator.run_cycles(AFTER)
+                    expected = emulator.snapshot()
+                    # both handlers ran, so the state covers interrupts and HALT
+                    self.assertGreater(emulator.mmu.WRAM[0], 20)
+                    self.assertGreater(emulator.mmu.WRAM[1], 3)
+
+                    # Other emulators, fresh and some other way into the program
+                    for cycles in (0, before // 3):
+                        restored = create(self.ROM_PATH, **options)
+                        restored.run_cycles(cycles)
+                        restored.restore(state)
+                        self.assertEqual(state, restored.snapshot())
+                        restored.run_cycles(AFTER)
+                        self.assertEqual(expected, restored.snapshot())
+
+    def test_wrong_version(self) -> None:
+        emulator = create(self.ROM_PATH)
+        emulator.run_cycles(SNAPSHOTS[0])
+        state = emulator.snapshot()
+        emulator.run_cycles(AFTER)
+        current = emulator.snapshot()
+
+        wrong = HEADER.pack(MAGIC, VERSION + 1) + state[HEADER.size :]
+        with self.assertRaisesRegex(Exception, "Unsupported savestate version"):
+            emulator.restore(wrong)
+        self.assertEqual(current, emulator.snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""Translated blocks against the Opcodes handlers they replace
+
+Run from the src directory with `py -m unittest`
+"""
+
+import contextlib
+import io
+import os
+import random
+import unittest
+
+from pyvologb.cartridge import Cartridge
+from pyvologb.mmu import MMU
+from pyvologb.opcodes import Opcodes
+from pyvologb.registers import Registers
+from pyvologb.translator import BlockCache, inline_lines
+from tests.common import make_rom
+
+# Programs run from WRAM, with [HL] in a page of its own after them
+CODE = 0xC000
+DATA = 0xD000
+
+STATES = 16
+
+# ALU A,r / A,[HL] / A,n including CP, and INC / DEC of every register
+ALU = [opcode for opcode in range(0x80, 0xC0)]
+ALU_IMMEDIATE = [opcode for opcode in range(0xC6, 0x100, 8)]
+INC_DEC = [opcode for opcode in range(0x04, 0x40, 8)] + [opcode for opcode in range(0x05, 0x40, 8)]
+
+# Generated as calls to their handlers rather than inline. ADD A,A and ADC A,A take the half carry
+# from the updated A, and INC / DEC [HL] write memory. The tests below still run them in blocks,
+# between inline instructions whose deferred flags have to be written before the call
+HANDLER_CALLS = [0x34, 0x35, 0x87, 0x8F]
+
+# Instructions for random blocks, leaving HL pointing into DATA and only addressing memory through it
+MIXED = [
+    opcode
+    for opcode in ALU + ALU_IMMEDIATE + INC_DEC + list(range(0x40, 0x80))
+    if opcode not in (0x24, 0x25, 0x2C, 0x2D, 0x76) and not 0x60 <= opcode < 0x70
+] + [
+    0x00, 0x03, 0x13, 0x23, 0x0B, 0x1B, 0x2B, 0x06, 0x0E, 0x16, 0x1E, 0x3E, 0x36,
+    0x22, 0x32, 0x2A, 0x3A,
+    # handlers reading or writing flags between inline instructions
+    0x07, 0x0F, 0x17, 0x1F, 0x27, 0x2F, 0x37, 0x3F, 0xF5, 0xF1,
+]  # fmt: skip
+
+# CB rotates and shifts reading or writing the carry, RL B -> RR A and [HL]
+MIXED_CB = [opcode for opcode in range(0x10, 0x20) if opcode & 7 not in (4, 5)]
+
+
+class TestLazyFlags(unittest.TestCase):
+    """Blocks defer the flags of inline instructions, so each has to end with the registers, flags
+    and memory of the same instructions executed one at a time"""
+
+    ROM_PATH: str
+    CARTRIDGE: Cartridge
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.ROM_PATH = make_rom()
+        cls.CARTRIDGE = Cartridge(cls.ROM_PATH)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        os.remove(cls.ROM_PATH)
+
+    def setUp(self) -> None:
+        self.RANDOM = random.Random(self.id())
+
+    def create(self, program: bytes, state: random.Random) -> tuple[MMU, Registers, Opcodes]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            mmu = MMU(self.CARTRIDGE, use_boot_rom=False, headless=True)
+        R = Registers(mmu)
+        opcodes = Opcodes(mmu, R)
+
+        # An illegal opcode after the program ends the block there
+        mmu.WRAM[: len(program) + 1] = program + b"\xd3"
+        mmu.WRAM[DATA - 0xC000 : DATA - 0xC000 + 0x100] = state.randbytes(0x100)
+        R.A, R.B, R.C, R.D, R.E = (state.randrange(0x100) for _ in range(5))
+        R.H = DATA >> 8
+        R.L = state.randrange(0x40, 0xC0)
+        R.F = state.randrange(0x100) & 0xF0
+        R.SP = 0xDFF0
+        R.PC = CODE
+        return mmu, R, opcodes
+
+    def result(self, mmu: MMU, R: Registers) -> tuple[object, ...]:
+        return (R.A, R.F, R.B, R.C, R.D, R.E, R.H, R.L, R.SP, R.PC, bytes(mmu.WRAM))
+
+    def check(self, program: bytes) -> None:
+        """Run `program` interpreted and translated from STATES random states"""
+        end = CODE + len(program)
+        for seed in range(STATES):
+            mmu, R, opcodes = self.create(program, random.Random(seed))
+            while R.PC != end:
+                mmu.IO.tick(opcodes.execute(mmu.get_memory(R.PC)))
+            expected = self.result(mmu, R)
+
+            mmu, R, opcodes = self.create(program, random.Random(seed))
+            blocks = BlockCache(mmu, opcodes, mmu.IO.SCHEDULER)
+            # A block returns early before a scheduler event, so carry on from there
+            while R.PC != end:
+                block = blocks.lookup(R.PC)
+                self.assertIsNotNone(block, f"{R.PC:#06x} not translated")
+                assert block is not None
+                mmu.IO.tick(block.RUN())
+
+            self.assertEqual(expected, self.result(mmu, R), f"program {program.hex()} seed {seed}")
+
+    def random_instruction(self, pool: list[int]) -> bytes:
+        opcode = self.RANDOM.choice(pool)
+        if opcode & 0xC7 == 0x06 or opcode & 0xC7 == 0xC6:
+            return bytes([opcode, self.RANDOM.randrange(0x100)])
+        return bytes([opcode])
+
+    def test_templates_inline(self) -> None:
+        for opcode in ALU + ALU_IMMEDIATE + INC_DEC:
+            with self.subTest(opcode=f"{opcode:#04x}"):
+                if opcode in HANDLER_CALLS:
+                    self.assertIsNone(inline_lines(opcode, 0))
+                else:
+                    self.assertIsNotNone(inline_lines(opcode, 0))
+
+    def test_handler_calls(self) -> None:
+        """Each handler call after and before an inline instruction setting flags"""
+        for opcode in HANDLER_CALLS:
+            for _ in range(8):
+                program = (
+                    self.random_instruction(ALU + INC_DEC)
+                    + bytes([opcode])
+                    + self.random_instruction(MIXED)
+                )
+                with self.subTest(program=program.hex()):
+                    self.check(program)
+
+    def test_alu(self) -> None:
+        for opcode in ALU:
+            with self.subTest(opcode=f"{opcode:#04x}"):
+                self.check(bytes([opcode]))
+
+    def test_alu_immediate(self) -> None:
+        for opcode in ALU_IMMEDIATE:
+            for operand in (0x00, 0x01, 0x0F, 0x10, 0x80, 0xFF):
+                with self.subTest(opcode=f"{opcode:#04x}", operand=operand):
+                    self.check(bytes([opcode, operand]))
+
+    def test_inc_dec(self) -> None:
+        for opcode in INC_DEC:
+            with self.subTest(opcode=f"{opcode:#04x}"):
+                self.check(bytes([opcode]))
+
+    def test_pairs(self) -> None:
+        """Each template followed by another, which reads, keeps or overwrites the deferred flags"""
+        for opcode in ALU + ALU_IMMEDIATE + INC_DEC:
+            for _ in range(2):
+                program = self.random_instruction([opcode]) + self.random_instruction(MIXED)
+                with self.subTest(program=program.hex()):
+                    self.check(program)
+
+    def test_random_blocks(self) -> None:
+        for _ in range(300):
+            program = b""
+            for _ in range(self.RANDOM.randrange(1, 24)):
+                if self.RANDOM.random() < 0.1:
+                    program += bytes([0xCB, self.RANDOM.choice(MIXED_CB)])
+                else:
+                    program += self.random_instruction(MIXED)
+            with self.subTest(program=program.hex()):
+                self.check(program)
+
+
+if __name__ == "__main__":
+    unittest.main()